@@ -0,0 +1,82 @@
+"""
+Import-time regression benchmark.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and reports the cumulative
+import time of each module, the slowest imports it pulls in, and whether any heavy dependency that
+should load lazily was imported. Exits with status 1 when a budget is exceeded or a heavy dependency
+is loaded, so it can run in CI:
+
+    python benchmarks/import_time.py --max-ms 150
+"""
+import argparse
+import subprocess
+import sys
+
+MODULES = ["solidity_python_sdk", "solidity_python_sdk.main"]
+
+# Dependencies that must only load when the feature using them is used.
+LAZY_DEPENDENCIES = ["web3", "eth_account", "pinatapy", "requests", "sqlite3", "asyncio", "numpy", "pyarrow"]
+
+
+def measure(module):
+    """
+    Imports a module in a fresh interpreter.
+
+    Returns:
+        tuple: The cumulative import time of the module in microseconds, and a dict of the self time of
+        every module imported on the way, keyed by module name. Imports made by interpreter startup are
+        left out.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    total = None
+    self_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        name = raw_name.strip()
+        self_times[name] = int(self_us)
+        # Nested imports are printed before their importer; a top-level entry closes a subtree.
+        if raw_name[1:2] != " ":
+            if name.split(".")[0] == module.split(".")[0]:
+                total = int(cumulative_us)
+                if name == module:
+                    break
+            else:
+                self_times = {}
+    return total, self_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to import.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module; the fastest run is kept.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list.")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail when a module takes longer to import.")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        total, self_times = min(runs, key=lambda run: run[0])
+        print(f"{module}: {total / 1000:.1f} ms (best of {args.repeat})")
+        for name, self_us in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms  {name}")
+
+        loaded = [dependency for dependency in LAZY_DEPENDENCIES if dependency in self_times]
+        if loaded:
+            print(f"    eagerly imported: {', '.join(loaded)}")
+            failed = True
+        if args.max_ms is not None and total / 1000 > args.max_ms:
+            print(f"    over budget of {args.max_ms:.0f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,9 @@
-from .main import DigitalProductPassportSDK
\ No newline at end of file
+__all__ = ["DigitalProductPassportSDK"]
+
+
+def __getattr__(name):
+    # Importing the package stays cheap; the SDK and its dependencies load on first use.
+    if name == "DigitalProductPassportSDK":
+        from .main import DigitalProductPassportSDK
+        return DigitalProductPassportSDK
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
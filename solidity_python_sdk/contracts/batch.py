@@ -1,5 +1,7 @@
 import logging
+from solidity_python_sdk.contracts.records import BatchDetails, RecordColumns
 from solidity_python_sdk.utils import utils
+from solidity_python_sdk.utils.scanner import scan
 
 class Batch:
     """
@@ -59,11 +61,7 @@ class Batch:
             'gas': Contract.constructor(product_passport_address, self.account.address).estimate_gas({'from': self.account.address}),
             'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
         })
-        utils.check_funds(self.web3, self.account.address, tx['gas'] * tx['gasPrice'])
-
-        signed_tx = self.web3.eth.account.sign_transaction(tx, self.account.key)
-        tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_receipt = utils.send_transaction(self.sdk, tx)
         contract_address = tx_receipt.contractAddress
 
         self.logger.info(f"Batch contract deployed at address: {contract_address}")
@@ -110,9 +108,7 @@ class Batch:
                 'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
             })
             
-            signed_tx = self.web3.eth.account.sign_transaction(tx, self.account.key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            tx_receipt = utils.send_transaction(self.sdk, tx)
 
             self.logger.info(f"Batch created transaction receipt: {tx_receipt}")
             return tx_receipt
@@ -120,25 +116,187 @@ class Batch:
             self.logger.error(f"Failed to create batch: {e}")
             raise
 
-    def get_batch(self, contract_address, batch_id):
+    def preflight_batches(self, contract_address, batches):
+        """
+        Simulates creating many batches without sending any transaction.
+
+        Besides the on-chain checks (authorization, batch IDs already minted), a batch ID repeated
+        within ``batches`` fails for every occurrence after the first, since only one can be minted.
+
+        Args:
+            contract_address (str): The address of the deployed Batch contract.
+            batches (iterable): Dictionaries with the keys accepted by ``create_batch``.
+
+        Returns:
+            list: One dict per batch with its "index", "batchId", whether it is "ok", and the decoded "error" or None.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        batches = list(batches)
+        report = self.sdk.preflight.simulate(
+            contract.functions.setBatchDetails(
+                batch_details["batchId"],
+                batch_details["amount"],
+                batch_details["assemblingTime"],
+                batch_details["transportDetails"],
+                batch_details["ipfsHash"]
+            )
+            for batch_details in batches
+        )
+
+        first_index = {}
+        for entry, batch_details in zip(report, batches):
+            batch_id = entry["batchId"] = batch_details["batchId"]
+            if batch_id in first_index and entry["ok"]:
+                entry["ok"] = False
+                entry["error"] = f"Duplicate batchId {batch_id}, first at index {first_index[batch_id]}"
+            first_index.setdefault(batch_id, entry["index"])
+        return report
+
+    def get_batch(self, contract_address, batch_id, block_identifier='latest'):
         """
         Retrieves the batch details from the Batch contract.
 
         Args:
             contract_address (str): The address of the deployed Batch contract.
             batch_id (int): The unique identifier for the batch.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
 
         Returns:
-            dict: The batch details retrieved from the contract.
+            BatchDetails: The batch details retrieved from the contract, as a named tuple.
 
         Raises:
             ValueError: If the batch cannot be retrieved or if the batch ID is invalid.
         """
         contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
         try:
-            batch = contract.functions.getBatchDetails(batch_id).call()
+            batch = BatchDetails(*self.sdk.reader.call(contract.functions.getBatchDetails(batch_id), block_identifier))
             self.logger.info(f"Batch retrieved: {batch}")
             return batch
         except Exception as e:
             self.logger.error(f"Failed to retrieve batch: {e}")
             raise
+
+    def get_batches(self, contract_address, batch_ids, columnar=False, block_identifier='latest'):
+        """
+        Retrieves the details of several batches using batched requests.
+
+        Args:
+            contract_address (str): The address of the deployed Batch contract.
+            batch_ids (iterable): The unique identifiers of the batches.
+            columnar (bool, optional): Whether to return a RecordColumns container instead of a list. Defaults to False.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            list | RecordColumns: The BatchDetails records, in the order of ``batch_ids``.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        batch_ids = [int(batch_id) for batch_id in batch_ids]
+        results = self.sdk.reader.call_many(
+            (contract.functions.getBatchDetails(batch_id) for batch_id in batch_ids), block_identifier
+        )
+        if columnar:
+            return RecordColumns(BatchDetails, results, batch_ids)
+        return [BatchDetails(*result) for result in results]
+
+    def get_token_uris(self, contract_address, batch_ids, block_identifier='latest', return_exceptions=False):
+        """
+        Retrieves the token URIs of several batches using batched requests.
+
+        Args:
+            contract_address (str): The address of the deployed Batch contract.
+            batch_ids (iterable): The unique identifiers of the batches.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+            return_exceptions (bool, optional): Whether to return the error of a failed read in place of
+                its token URI instead of raising it. Defaults to False.
+
+        Returns:
+            list: The token URI of each batch, or None for batches that were never minted.
+
+        Raises:
+            Exception: If a read fails for another reason than a revert, unless ``return_exceptions`` is set.
+        """
+        from web3.exceptions import ContractLogicError
+
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        calls = [contract.functions.tokenURI(int(batch_id)) for batch_id in batch_ids]
+        results = self.sdk.reader.call_many(calls, block_identifier, return_exceptions=True)
+        token_uris = []
+        for call, result in zip(calls, results):
+            if isinstance(result, ContractLogicError):
+                # tokenURI reverts for batches that were never minted.
+                self.logger.debug(f"No token URI for batch {call.args[0]}: {result}")
+                result = None
+            elif isinstance(result, Exception) and not return_exceptions:
+                raise result
+            token_uris.append(result)
+        return token_uris
+
+    def resolve_metadata(self, contract_address, batch_ids, fetcher=None, block_identifier='latest'):
+        """
+        Resolves the on-chain details and IPFS metadata of several batches.
+
+        The tokenURI and getBatchDetails values are read in batched requests, then the metadata documents
+        are fetched concurrently through the IPFS fetcher, which caches them by CID.
+
+        Args:
+            contract_address (str): The address of the deployed Batch contract.
+            batch_ids (iterable): The unique identifiers of the batches.
+            fetcher (IpfsFetcher, optional): The fetcher to use. Defaults to the SDK's fetcher.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            list: One dict per batch with its "batchId", "tokenURI", "details" (BatchDetails), "metadata"
+            (the decoded JSON document, or None) and "error" (why the metadata is missing, or None).
+        """
+        fetcher = fetcher or self.sdk.ipfs
+        batch_ids = [int(batch_id) for batch_id in batch_ids]
+        details = self.get_batches(contract_address, batch_ids, block_identifier=block_identifier)
+        token_uris = self.get_token_uris(contract_address, batch_ids, block_identifier, return_exceptions=True)
+        documents = fetcher.fetch_many((uri for uri in token_uris if isinstance(uri, str) and uri), as_json=True)
+
+        resolved = []
+        for batch_id, batch, token_uri in zip(batch_ids, details, token_uris):
+            entry = {"batchId": batch_id, "tokenURI": token_uri, "details": batch, "metadata": None, "error": None}
+            if isinstance(token_uri, Exception):
+                entry["tokenURI"] = None
+                entry["error"] = f"Failed to read the token URI: {token_uri}"
+                resolved.append(entry)
+                continue
+            document = documents.get(token_uri)
+            if not token_uri:
+                entry["error"] = "Batch has no token URI"
+            elif isinstance(document, Exception):
+                entry["error"] = str(document)
+            else:
+                entry["metadata"] = document
+            resolved.append(entry)
+        return resolved
+
+    def iter_batches(self, contract_address, id_range, chunk_size=100, workers=4, ordered=True):
+        """
+        Iterates over every batch stored in the Batch contract within an ID range.
+
+        The range is read in chunks of batched getBatchDetails requests fanned out over a worker pool,
+        all at the block current when the scan starts. Empty batch IDs are skipped, and results are
+        yielded lazily with constant memory.
+
+        Args:
+            contract_address (str): The address of the deployed Batch contract.
+            id_range (iterable): The batch IDs to scan, e.g. ``range(1, 100000)``.
+            chunk_size (int, optional): Number of IDs read per batched request. Defaults to 100.
+            workers (int, optional): Number of concurrent requests. Defaults to 4.
+            ordered (bool, optional): Whether to yield batches in ID order rather than as chunks complete. Defaults to True.
+
+        Yields:
+            tuple: The batch ID and its BatchDetails record.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        block_number = self.web3.eth.block_number
+
+        def fetch_chunk(batch_ids):
+            results = self.sdk.reader.call_many(
+                (contract.functions.getBatchDetails(batch_id) for batch_id in batch_ids), block_identifier=block_number
+            )
+            return [(batch_id, BatchDetails(*batch)) for batch_id, batch in zip(batch_ids, results) if any(batch)]
+
+        return scan(fetch_chunk, (int(batch_id) for batch_id in id_range), chunk_size, workers, ordered)
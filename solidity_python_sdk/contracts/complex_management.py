@@ -0,0 +1,324 @@
+import logging
+from solidity_python_sdk.contracts.records import Complex, GeolocationRecord, RecordColumns
+from solidity_python_sdk.utils import utils
+
+# Order of the addComplex arguments; getComplex and ComplexAdded use the order of the Complex record.
+ADD_COMPLEX_FIELDS = (
+    "complexId", "complexName", "complexCountry", "complexAddress",
+    "latitude", "longitude", "complexSiteType", "complexIndustry"
+)
+
+
+class ComplexManagement:
+    """
+    Interface for interacting with the ComplexManagement smart contract.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        web3 (Web3): Web3 instance for blockchain interactions.
+        account (Account): Ethereum account used for transactions.
+        gwei_bid (int): Gas price in gwei.
+        contract (dict): ABI and bytecode of the ComplexManagement contract.
+        gas_margin (float): Factor applied to the gas estimated for bulk registrations.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, gas_margin=1.2):
+        """
+        Initializes the ComplexManagement class with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            gas_margin (float, optional): Factor applied to the gas estimated for bulk registrations. Defaults to 1.2.
+
+        Raises:
+            KeyError: If the 'ComplexManagement' contract is not found in the SDK contracts.
+        """
+        self.sdk = sdk
+        self.web3 = sdk.web3
+        self.account = sdk.account
+        self.gwei_bid = sdk.gwei_bid
+        self.gas_margin = gas_margin
+
+        if 'ComplexManagement' not in sdk.contracts:
+            raise KeyError("Contract 'ComplexManagement' not found in SDK")
+
+        self.contract = sdk.contracts['ComplexManagement']
+        self.logger = logging.getLogger(__name__)
+
+    def deploy(self, initial_owner=None):
+        """
+        Deploys the ComplexManagement contract to the blockchain.
+
+        Args:
+            initial_owner (str, optional): The address of the initial owner of the contract. Defaults to the deployer's address.
+
+        Returns:
+            str: The address of the deployed contract.
+
+        Raises:
+            ValueError: If the deployment fails.
+        """
+        self.logger.info(f"Deploying ComplexManagement contract from {self.account.address}")
+        Contract = self.web3.eth.contract(abi=self.contract["abi"], bytecode=self.contract["bytecode"])
+        constructor = Contract.constructor(initial_owner or self.account.address)
+        tx = constructor.build_transaction({
+            'from': self.account.address,
+            'nonce': self.web3.eth.get_transaction_count(self.account.address, 'pending'),
+            'gas': constructor.estimate_gas({'from': self.account.address}),
+            'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
+        })
+        tx_receipt = utils.send_transaction(self.sdk, tx)
+        contract_address = tx_receipt.contractAddress
+
+        self.logger.info(f"ComplexManagement contract deployed at address: {contract_address}")
+        return contract_address
+
+    def add_contributor(self, contract_address, contributor):
+        """
+        Allows an address to register complexes and geolocations.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            contributor (str): The address of the contributor.
+
+        Returns:
+            dict: The transaction receipt containing details of the transaction.
+        """
+        return self._transact(contract_address, 'addContributor', contributor)
+
+    def remove_contributor(self, contract_address, contributor):
+        """
+        Revokes the permission of an address to register complexes and geolocations.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            contributor (str): The address of the contributor.
+
+        Returns:
+            dict: The transaction receipt containing details of the transaction.
+        """
+        return self._transact(contract_address, 'removeContributor', contributor)
+
+    def add_complex(self, contract_address, complex_details):
+        """
+        Registers a complex in the ComplexManagement contract.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complex_details (dict): A dictionary containing the complex details with the keys:
+                "complexId", "complexName", "complexCountry", "complexAddress", "latitude", "longitude",
+                "complexSiteType", "complexIndustry".
+
+        Returns:
+            dict: The transaction receipt containing details of the transaction.
+
+        Raises:
+            KeyError: If one of the keys is missing.
+            ValueError: If the complexId is empty or the transaction fails.
+        """
+        try:
+            tx_receipt = self._transact(contract_address, 'addComplex', *_add_complex_args(complex_details))
+            self.logger.info(f"Complex added transaction receipt: {tx_receipt}")
+            return tx_receipt
+        except Exception as e:
+            self.logger.error(f"Failed to add complex: {e}")
+            raise
+
+    def add_complexes(self, contract_address, complexes, timeout=300, max_pending=64):
+        """
+        Registers many complexes with pipelined submission.
+
+        Gas is estimated once, for a complex whose fields are each as long as the longest value in the
+        input, and that limit is reused for every transaction. The transactions are then signed with
+        consecutive nonces and broadcast back-to-back, keeping up to ``max_pending`` of them unconfirmed
+        at a time instead of waiting for each receipt in turn.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complexes (iterable): Dictionaries with the keys accepted by ``add_complex``.
+            timeout (int, optional): Seconds to wait for each receipt. Defaults to 300.
+            max_pending (int, optional): Maximum number of unconfirmed transactions at a time. Defaults to 64.
+
+        Returns:
+            list: The transaction receipts, in the order of ``complexes``.
+
+        Raises:
+            KeyError: If a complex is missing one of the keys; nothing is sent then.
+            ValueError: If a complexId is empty, in which case nothing is sent, or if a transaction fails.
+        """
+        arguments = [_add_complex_args(complex_details) for complex_details in complexes]
+        if not arguments:
+            return []
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+
+        # Storage cost grows with the length of each string, so the longest value per field bounds the gas.
+        longest = ["x" * max(len(args[position].encode()) for args in arguments) for position in range(len(ADD_COMPLEX_FIELDS))]
+        gas = int(contract.functions.addComplex(*longest).estimate_gas({'from': self.account.address}) * self.gas_margin)
+        gas_price = self.web3.to_wei(self.gwei_bid, 'gwei')
+        nonce = self.web3.eth.get_transaction_count(self.account.address, 'pending')
+
+        txs = (
+            contract.functions.addComplex(*args).build_transaction({
+                'from': self.account.address,
+                'nonce': nonce + offset,
+                'gas': gas,
+                'gasPrice': gas_price
+            })
+            for offset, args in enumerate(arguments)
+        )
+        self.logger.info(f"Adding {len(arguments)} complexes to {contract_address}")
+        receipts = utils.send_transactions(self.sdk, txs, timeout=timeout, max_pending=max_pending)
+
+        failed = [self.web3.to_hex(tx_receipt.transactionHash) for tx_receipt in receipts if tx_receipt.status != 1]
+        if failed:
+            raise ValueError(f"{len(failed)} of {len(receipts)} complexes failed, first in transaction {failed[0]}")
+        return receipts
+
+    def set_geolocation(self, contract_address, complex_id, latitude, longitude, additional_info=""):
+        """
+        Sets the geolocation of a complex in the ComplexManagement contract.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complex_id (str): The unique identifier of the complex.
+            latitude (str): The latitude of the geolocation.
+            longitude (str): The longitude of the geolocation.
+            additional_info (str, optional): Additional information about the location. Defaults to "".
+
+        Returns:
+            dict: The transaction receipt containing details of the transaction.
+        """
+        return self._transact(contract_address, 'setGeolocation', complex_id, latitude, longitude, additional_info)
+
+    def get_complex(self, contract_address, complex_id, block_identifier='latest'):
+        """
+        Retrieves a complex from the ComplexManagement contract.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complex_id (str): The unique identifier of the complex.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            Complex: The complex details, as a named tuple.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        return Complex(*self.sdk.reader.call(contract.functions.getComplex(complex_id), block_identifier))
+
+    def get_complexes(self, contract_address, complex_ids, columnar=False, block_identifier='latest'):
+        """
+        Retrieves several complexes using batched requests.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complex_ids (iterable): The unique identifiers of the complexes.
+            columnar (bool, optional): Whether to return a RecordColumns container instead of a list. Defaults to False.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            list | RecordColumns: The Complex records, in the order of ``complex_ids``.
+        """
+        return self._get_many(contract_address, 'getComplex', Complex, complex_ids, columnar, block_identifier)
+
+    def get_geolocation(self, contract_address, complex_id, block_identifier='latest'):
+        """
+        Retrieves the geolocation of a complex from the ComplexManagement contract.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complex_id (str): The unique identifier of the complex.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            GeolocationRecord: A named tuple containing the latitude, longitude and additional information of the geolocation.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        return GeolocationRecord(*self.sdk.reader.call(contract.functions.getGeolocation(complex_id), block_identifier))
+
+    def get_geolocations(self, contract_address, complex_ids, columnar=False, block_identifier='latest'):
+        """
+        Retrieves the geolocations of several complexes using batched requests.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complex_ids (iterable): The unique identifiers of the complexes.
+            columnar (bool, optional): Whether to return a RecordColumns container instead of a list. Defaults to False.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            list | RecordColumns: The GeolocationRecord records, in the order of ``complex_ids``.
+        """
+        return self._get_many(contract_address, 'getGeolocation', GeolocationRecord, complex_ids, columnar, block_identifier)
+
+    def get_complex_events(self, contract_address, from_block=0, to_block=None, log_chunk_size=10000):
+        """
+        Decodes the ComplexAdded events emitted within a block range.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            from_block (int, optional): The first block to read. Defaults to 0.
+            to_block (int, optional): The last block to read. Defaults to the current block.
+            log_chunk_size (int, optional): Number of blocks per eth_getLogs call. Defaults to 10000.
+
+        Yields:
+            tuple: The block number of the event and the registered Complex record.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        to_block = self.web3.eth.block_number if to_block is None else to_block
+        for start in range(from_block, to_block + 1, log_chunk_size):
+            end = min(start + log_chunk_size - 1, to_block)
+            for event in contract.events.ComplexAdded.get_logs(from_block=start, to_block=end):
+                yield event.blockNumber, Complex(*(event.args[field] for field in Complex._fields))
+
+    def sync_complexes(self, contract_address, complexes, from_block=0, to_block=None):
+        """
+        Brings a local mapping of complexes up to date from ComplexAdded events.
+
+        Pass the returned block plus one as ``from_block`` on the next call to apply only newer events.
+
+        Args:
+            contract_address (str): The address of the deployed ComplexManagement contract.
+            complexes (dict): Mapping of complex ID to Complex record, updated in place.
+            from_block (int, optional): The first block to read. Defaults to 0.
+            to_block (int, optional): The last block to read. Defaults to the current block.
+
+        Returns:
+            int: The last block applied.
+        """
+        to_block = self.web3.eth.block_number if to_block is None else to_block
+        applied = 0
+        for _, complex_record in self.get_complex_events(contract_address, from_block, to_block):
+            complexes[complex_record.complexId] = complex_record
+            applied += 1
+        self.logger.info(f"Applied {applied} complex events up to block {to_block}; {len(complexes)} complexes known")
+        return to_block
+
+    def _get_many(self, contract_address, function_name, record_type, complex_ids, columnar, block_identifier):
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        complex_ids = list(complex_ids)
+        results = self.sdk.reader.call_many(
+            (contract.functions[function_name](complex_id) for complex_id in complex_ids), block_identifier
+        )
+        if columnar:
+            return RecordColumns(record_type, results, complex_ids)
+        return [record_type(*result) for result in results]
+
+    def _transact(self, contract_address, function_name, *args):
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        function = contract.functions[function_name](*args)
+        tx = function.build_transaction({
+            'from': self.account.address,
+            'nonce': self.web3.eth.get_transaction_count(self.account.address, 'pending'),
+            'gas': function.estimate_gas({'from': self.account.address}),
+            'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
+        })
+        return utils.send_transaction(self.sdk, tx)
+
+
+def _add_complex_args(complex_details):
+    # Every field is required, so a missing or misspelled key fails before any transaction is sent.
+    args = [str(complex_details[field]) for field in ADD_COMPLEX_FIELDS]
+    if not args[0]:
+        raise ValueError("complexId must not be empty")
+    return args
@@ -1,7 +1,6 @@
-import json
 import logging
-import os
-from web3 import Web3
+from solidity_python_sdk.contracts.records import GeolocationRecord
+from solidity_python_sdk.geo_index import GeolocationIndex
 from solidity_python_sdk.utils import utils
 
 
@@ -10,8 +9,10 @@ class Geolocation:
     Interface for interacting with the Geolocation smart contract.
 
     Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
         web3 (Web3): Web3 instance for blockchain interactions.
         account (Account): Ethereum account used for transactions.
+        gwei_bid (int): Gas price in gwei.
         contract (dict): ABI and bytecode of the Geolocation contract.
         logger (Logger): Logger instance for logging information and debug messages.
     """
@@ -23,12 +24,14 @@ class Geolocation:
         Args:
             sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
         """
+        self.sdk = sdk
         self.web3 = sdk.web3
         self.account = sdk.account
+        self.gwei_bid = sdk.gwei_bid
         self.contract = sdk.contracts['Geolocation']
         self.logger = logging.getLogger(__name__)
 
-    def set_geolocation(self, contract_address, batch_id, latitude, longitude):
+    def set_geolocation(self, contract_address, batch_id, latitude, longitude, additional_info=""):
         """
         Adds geolocation information for a specific batch in the Geolocation contract.
 
@@ -37,25 +40,51 @@ class Geolocation:
             batch_id (string): The unique identifier for the batch.
             latitude (string): The latitude of the geolocation.
             longitude (string): The longitude of the geolocation.
+            additional_info (string, optional): Additional information about the location. Defaults to "".
 
         Returns:
             dict: The transaction receipt containing details of the transaction.
         """
         contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
-        tx_hash = contract.functions.setGeolocation(batch_id, latitude, longitude).transact({'from': self.account.address})
-        tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
-        return tx_receipt
+        function = contract.functions.setGeolocation(batch_id, latitude, longitude, additional_info)
+        tx = function.build_transaction({
+            'from': self.account.address,
+            'nonce': self.web3.eth.get_transaction_count(self.account.address, 'pending'),
+            'gas': function.estimate_gas({'from': self.account.address}),
+            'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
+        })
+        return utils.send_transaction(self.sdk, tx)
 
-    def get_geolocation(self, contract_address, batch_id):
+    def get_geolocation(self, contract_address, batch_id, block_identifier='latest'):
         """
         Retrieves the geolocation information for a specific batch from the Geolocation contract.
 
         Args:
             contract_address (str): The address of the deployed Geolocation contract.
             batch_id (str): The unique identifier for the batch.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
 
         Returns:
-            tuple: A tuple containing the latitude and longitude of the geolocation.
+            GeolocationRecord: A named tuple containing the latitude, longitude and additional information of the geolocation.
         """
         contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
-        return contract.functions.getGeolocation(batch_id).call()
+        return GeolocationRecord(*self.sdk.reader.call(contract.functions.getGeolocation(batch_id), block_identifier))
+
+    def build_index(self, contract_address, from_block=None):
+        """
+        Builds a spatial index of the geolocations recorded in the Geolocation contract.
+
+        Args:
+            contract_address (str): The address of the deployed Geolocation contract.
+            from_block (int, optional): The block to start reading GeolocationAdded events from, such as the
+                "blockNumber" of a deployment manifest. Defaults to the block the contract was deployed in,
+                looked up with eth_getCode, which needs a node that keeps historical state.
+
+        Returns:
+            GeolocationIndex: The index, loaded up to the current block; call ``update`` to apply newer events.
+        """
+        if from_block is None:
+            from_block = utils.find_deployment_block(self.web3, contract_address)
+        index = GeolocationIndex(self.sdk, contract_address)
+        index.load_events(from_block)
+        return index
@@ -1,5 +1,7 @@
 import logging
+from solidity_python_sdk.contracts.records import Product, ProductData, RecordColumns
 from solidity_python_sdk.utils import utils
+from solidity_python_sdk.utils.scanner import scan
 
 class ProductPassport:
     """
@@ -67,11 +69,7 @@ class ProductPassport:
             'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
         })
 
-        utils.check_funds(self.web3, self.account.address, tx['gas'] * tx['gasPrice'])
-
-        signed_tx = self.web3.eth.account.sign_transaction(tx, self.account.key)
-        tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        tx_receipt = utils.send_transaction(self.sdk, tx)
         contract_address = tx_receipt.contractAddress
 
         self.logger.info(f"ProductPassport contract deployed at address: {contract_address}")
@@ -101,9 +99,7 @@ class ProductPassport:
                 'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
             })
             
-            signed_tx = self.web3.eth.account.sign_transaction(tx, self.account.key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            tx_receipt = utils.send_transaction(self.sdk, tx)
 
             self.logger.info(f"Entity authorized transaction receipt: {tx_receipt}")
             return tx_receipt
@@ -131,7 +127,7 @@ class ProductPassport:
 
         try:
             tx = contract.functions.setProduct(
-                product_id,
+                int(product_id),
                 product_details["uid"],
                 product_details["gtin"],
                 product_details["taricCode"],
@@ -142,7 +138,7 @@ class ProductPassport:
                 'from': self.account.address,
                 'nonce': self.web3.eth.get_transaction_count(self.account.address, 'pending'),
                 'gas': contract.functions.setProduct(
-                    product_id,
+                    int(product_id),
                     product_details["uid"],
                     product_details["gtin"],
                     product_details["taricCode"],
@@ -153,9 +149,7 @@ class ProductPassport:
                 'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
             })
             
-            signed_tx = self.web3.eth.account.sign_transaction(tx, self.account.key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            tx_receipt = utils.send_transaction(self.sdk, tx)
 
             self.logger.info(f"Product set transaction receipt: {tx_receipt}")
             return tx_receipt
@@ -163,29 +157,45 @@ class ProductPassport:
             self.logger.error(f"Failed to set product: {e}")
             raise
 
-    def get_product(self, contract_address, product_id):
+    def get_product(self, contract_address, product_id, block_identifier='latest'):
         """
         Retrieves the product details from the ProductPassport contract.
 
         Args:
             contract_address (str): The address of the deployed ProductPassport contract.
             product_id (str): The unique identifier for the product.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
 
         Returns:
-            dict: The product details retrieved from the contract.
+            Product: The product details retrieved from the contract, as a named tuple.
 
         Raises:
             ValueError: If the product cannot be retrieved.
         """
         contract = self.web3.eth.contract(address=contract_address, abi=self.product_details_contract['abi'])
         try:
-            product = contract.functions.getProduct(product_id).call()
+            product = Product(*self.sdk.reader.call(contract.functions.getProduct(int(product_id)), block_identifier))
             self.logger.info(f"Product retrieved: {product}")
             return product
         except Exception as e:
             self.logger.error(f"Failed to retrieve product: {e}")
             raise
 
+    async def get_product_async(self, contract_address, product_id, block_identifier='latest'):
+        """
+        Retrieves the product details from asyncio code; identical concurrent reads share one RPC.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            product_id (int): The unique identifier for the product.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            Product: The product details retrieved from the contract, as a named tuple.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.product_details_contract['abi'])
+        return Product(*await self.sdk.reader.acall(contract.functions.getProduct(int(product_id)), block_identifier))
+
     def set_product_data(self, contract_address, product_id, product_data):
         """
         Sets the product data in the ProductPassport contract.
@@ -237,9 +247,7 @@ class ProductPassport:
                 'gasPrice': self.web3.to_wei(self.gwei_bid, 'gwei')
             })
             
-            signed_tx = self.web3.eth.account.sign_transaction(tx, self.account.key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            tx_receipt = utils.send_transaction(self.sdk, tx)
 
             self.logger.info(f"Product data set transaction receipt: {tx_receipt}")
             return tx_receipt
@@ -247,25 +255,211 @@ class ProductPassport:
             self.logger.error(f"Failed to set product data: {e}")
             raise
 
-    def get_product_data(self, contract_address, product_id):
+    def get_product_data(self, contract_address, product_id, block_identifier='latest'):
         """
         Retrieves the product data from the ProductPassport contract.
 
         Args:
             contract_address (str): The address of the deployed ProductPassport contract.
             product_id (int): The unique identifier for the product.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
 
         Returns:
-            dict: The product data retrieved from the contract.
+            ProductData: The product data retrieved from the contract, as a named tuple.
 
         Raises:
             ValueError: If the product data cannot be retrieved.
         """
         contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
         try:
-            product_data = contract.functions.getProductData(product_id).call()
+            product_data = ProductData(*self.sdk.reader.call(contract.functions.getProductData(int(product_id)), block_identifier))
             self.logger.info(f"Product data retrieved: {product_data}")
             return product_data
         except Exception as e:
             self.logger.error(f"Failed to retrieve product data: {e}")
             raise
+
+    async def get_product_data_async(self, contract_address, product_id, block_identifier='latest'):
+        """
+        Retrieves the product data from asyncio code; identical concurrent reads share one RPC.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            product_id (int): The unique identifier for the product.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            ProductData: The product data retrieved from the contract, as a named tuple.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        return ProductData(*await self.sdk.reader.acall(contract.functions.getProductData(int(product_id)), block_identifier))
+
+    def get_products(self, contract_address, product_ids, columnar=False, block_identifier='latest'):
+        """
+        Retrieves the product details of several products using batched requests.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            product_ids (iterable): The unique identifiers of the products.
+            columnar (bool, optional): Whether to return a RecordColumns container instead of a list. Defaults to False.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            list | RecordColumns: The Product records, in the order of ``product_ids``.
+        """
+        return self._get_many(contract_address, 'getProduct', Product, product_ids, columnar, block_identifier)
+
+    def get_products_data(self, contract_address, product_ids, columnar=False, block_identifier='latest'):
+        """
+        Retrieves the product data of several products using batched requests.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            product_ids (iterable): The unique identifiers of the products.
+            columnar (bool, optional): Whether to return a RecordColumns container instead of a list. Defaults to False.
+            block_identifier (int | str, optional): The block to read at. Defaults to 'latest'.
+
+        Returns:
+            list | RecordColumns: The ProductData records, in the order of ``product_ids``.
+        """
+        return self._get_many(contract_address, 'getProductData', ProductData, product_ids, columnar, block_identifier)
+
+    def iter_products(self, contract_address, id_range, chunk_size=100, workers=4, ordered=True):
+        """
+        Iterates over every product stored in the ProductPassport contract within an ID range.
+
+        The range is read in chunks of batched getProduct/getProductData requests fanned out over a
+        worker pool, all at the block current when the scan starts. IDs with neither product details
+        nor product data are skipped, and results are yielded lazily with constant memory.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            id_range (iterable): The product IDs to scan, e.g. ``range(1, 100000)``.
+            chunk_size (int, optional): Number of IDs read per batched request. Defaults to 100.
+            workers (int, optional): Number of concurrent requests. Defaults to 4.
+            ordered (bool, optional): Whether to yield products in ID order rather than as chunks complete. Defaults to True.
+
+        Yields:
+            tuple: The product ID, its Product record and its ProductData record.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        block_number = self.web3.eth.block_number
+
+        def fetch_chunk(product_ids):
+            calls = []
+            for product_id in product_ids:
+                calls.append(contract.functions.getProduct(product_id))
+                calls.append(contract.functions.getProductData(product_id))
+            results = self.sdk.reader.call_many(calls, block_identifier=block_number)
+            return [
+                (product_id, Product(*product), ProductData(*product_data))
+                for product_id, product, product_data in zip(product_ids, results[::2], results[1::2])
+                if any(product) or any(product_data)
+            ]
+
+        return scan(fetch_chunk, (int(product_id) for product_id in id_range), chunk_size, workers, ordered)
+
+    def _get_many(self, contract_address, function_name, record_type, product_ids, columnar, block_identifier='latest'):
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        product_ids = [int(product_id) for product_id in product_ids]
+        results = self.sdk.reader.call_many(
+            (contract.functions[function_name](product_id) for product_id in product_ids), block_identifier
+        )
+        if columnar:
+            return RecordColumns(record_type, results, product_ids)
+        return [record_type(*result) for result in results]
+
+    def preflight_product_data(self, contract_address, source):
+        """
+        Simulates setProductData for many products without sending any transaction.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            source (dict | iterable): Either a mapping of product ID to product data, or an iterable of
+                product data records carrying a "productId" key.
+
+        Returns:
+            list: One dict per product with its "index", "productId", whether it is "ok", and the decoded "error" or None.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        records = list(source.items() if isinstance(source, dict) else ((record["productId"], record) for record in source))
+        report = self.sdk.preflight.simulate(
+            contract.functions.setProductData(int(product_id), *(record[field] for field in ProductData._fields))
+            for product_id, record in records
+        )
+        for entry, (product_id, _) in zip(report, records):
+            entry["productId"] = product_id
+        return report
+
+    def sync_products(self, contract_address, source, batch_size=100):
+        """
+        Synchronizes products with the ProductPassport contract, sending transactions only for records that changed.
+
+        Current on-chain values are read in batches through getProduct and getProductData and compared
+        field by field with the source records. setProduct or setProductData is sent only for the parts
+        of a record that differ, so re-running an unchanged catalog costs no gas.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            source (dict | iterable): Either a mapping of product ID to record, or an iterable of records
+                carrying a "productId" key. A record may hold the product details keys ("uid", "gtin", ...),
+                the product data keys ("description", "manuals", ...), or both; only the groups present
+                in a record are compared and written. Keys missing from a group keep their on-chain values.
+            batch_size (int, optional): Number of products read per batched request. Defaults to 100.
+
+        Returns:
+            dict: The number of "unchanged", "changed" and "new" products, and the "receipts" of the transactions sent.
+
+        Raises:
+            ValueError: If a transaction fails.
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=self.contract['abi'])
+        groups = [
+            ("getProduct", utils.output_fields(self.contract['abi'], 'getProduct'), self.set_product),
+            ("getProductData", utils.output_fields(self.contract['abi'], 'getProductData'), self.set_product_data),
+        ]
+        report = {"unchanged": 0, "changed": 0, "new": 0, "receipts": []}
+
+        if isinstance(source, dict):
+            records = source.items()
+        else:
+            records = ((record["productId"], record) for record in source)
+
+        for chunk in utils.chunked(records, batch_size):
+            reads = []
+            for product_id, record in chunk:
+                for function_name, fields, writer in groups:
+                    if any(field in record for field in fields):
+                        reads.append((product_id, record, fields, writer,
+                                      contract.functions[function_name](int(product_id))))
+            current = self.sdk.reader.call_many(read[-1] for read in reads)
+
+            pending = {}
+            for (product_id, record, fields, writer, _), on_chain in zip(reads, current):
+                state = pending.setdefault(product_id, {"new": True, "writes": []})
+                if any(on_chain):
+                    state["new"] = False
+                # Keys missing from a partial record keep their on-chain values, so only the given ones are compared.
+                merged = dict(zip(fields, on_chain))
+                if any(_normalize(record[field]) != _normalize(value) for field, value in merged.items() if field in record):
+                    merged.update((field, record[field]) for field in fields if field in record)
+                    state["writes"].append((writer, merged))
+
+            for product_id, state in pending.items():
+                if not state["writes"]:
+                    report["unchanged"] += 1
+                    continue
+                report["new" if state["new"] else "changed"] += 1
+                for writer, record in state["writes"]:
+                    report["receipts"].append(writer(contract_address, int(product_id), record))
+
+        self.logger.info(
+            f"Products synchronized: {report['unchanged']} unchanged, {report['changed']} changed, {report['new']} new"
+        )
+        return report
+
+
+def _normalize(value):
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return value
@@ -0,0 +1,139 @@
+import json
+import os
+import sys
+from array import array
+from collections import namedtuple
+from solidity_python_sdk.resources import ABI
+
+
+def load_abi(contract_name):
+    """
+    Loads the ABI of a bundled contract.
+    """
+    path = os.path.join(os.path.dirname(ABI.__file__), f"{contract_name}.sol", f"{contract_name}.json")
+    with open(path) as file:
+        return json.load(file)['abi']
+
+
+def record_type(type_name, contract_name, function_name):
+    """
+    Generates a named tuple type for the values returned by a contract function.
+
+    The field names and Solidity types are taken from the function's output components in the
+    bundled ABI. Named tuples carry no per-instance dict, and they still support positional access,
+    so ``record[3]`` keeps working alongside ``record.manufacturerInfo``.
+    """
+    for entry in load_abi(contract_name):
+        if entry.get('type') == 'function' and entry.get('name') == function_name:
+            outputs = entry['outputs']
+            if len(outputs) == 1 and outputs[0].get('components'):
+                outputs = outputs[0]['components']
+            record = namedtuple(type_name, [output['name'] for output in outputs])
+            record.abi_types = tuple(output['type'] for output in outputs)
+            record.__doc__ = f"Values returned by {contract_name}.{function_name}."
+            return record
+    raise KeyError(f"Function '{function_name}' not found in {contract_name} ABI")
+
+
+Product = record_type("Product", "ProductPassport", "getProduct")
+ProductData = record_type("ProductData", "ProductPassport", "getProductData")
+BatchDetails = record_type("BatchDetails", "Batch", "getBatchDetails")
+GeolocationRecord = record_type("GeolocationRecord", "Geolocation", "getGeolocation")
+Complex = record_type("Complex", "ComplexManagement", "getComplex")
+
+
+class RecordColumns:
+    """
+    Columnar container for many records of one record type.
+
+    Each field is stored as a column instead of one tuple per record: unsigned integer fields go into
+    compact ``array('Q')`` columns (falling back to a list for values beyond 64 bits), strings are
+    interned so repeated values such as manufacturer names are stored once, and string arrays are kept
+    as tuples.
+
+    Attributes:
+        record_type (type): The record type held by the container.
+        keys (list): The key (e.g. product ID) of each record, in insertion order.
+        columns (dict): One column per field name.
+    """
+
+    def __init__(self, record_type, records=(), keys=()):
+        """
+        Initializes the RecordColumns container, optionally filled with records.
+
+        Args:
+            record_type (type): A record type generated by ``record_type``.
+            records (iterable, optional): Records to append.
+            keys (iterable, optional): The key of each record in ``records``.
+        """
+        self.record_type = record_type
+        self.keys = []
+        self.columns = {
+            field: array('Q') if abi_type.startswith('uint') and not abi_type.endswith(']') else []
+            for field, abi_type in zip(record_type._fields, record_type.abi_types)
+        }
+        self.extend(records, keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        return self.record_type(*(column[index] for column in self.columns.values()))
+
+    def append(self, record, key=None):
+        """
+        Appends a record, given as a record instance or any sequence in field order.
+        """
+        for (field, column), value in zip(self.columns.items(), record):
+            if isinstance(value, str):
+                value = sys.intern(value)
+            elif isinstance(value, list):
+                value = tuple(sys.intern(item) if isinstance(item, str) else item for item in value)
+            if isinstance(column, array):
+                try:
+                    column.append(value)
+                    continue
+                except OverflowError:
+                    column = self.columns[field] = column.tolist()
+            column.append(value)
+        self.keys.append(key if key is not None else len(self.keys))
+
+    def extend(self, records, keys=()):
+        keys = iter(keys)
+        for record in records:
+            self.append(record, next(keys, None))
+
+    def column(self, field):
+        """
+        Returns the column of a field.
+        """
+        return self.columns[field]
+
+    def to_arrow(self, key_name="key"):
+        """
+        Converts the container to a pyarrow Table, with the record keys as the first column.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("pyarrow is required for Arrow output: pip install solidity-python-sdk[arrow]") from e
+
+        data = {key_name: self.keys}
+        for field, column in self.columns.items():
+            if isinstance(column, array):
+                data[field] = pyarrow.array(column, type=pyarrow.uint64())
+            elif column and isinstance(column[0], tuple):
+                data[field] = [list(value) for value in column]
+            elif column and isinstance(column[0], int):
+                # Integers beyond 64 bits have no Arrow integer type; keep them exact as strings.
+                data[field] = [str(value) for value in column]
+            else:
+                data[field] = column
+        return pyarrow.table(data)
@@ -0,0 +1,138 @@
+import logging
+from solidity_python_sdk.utils import utils
+from solidity_python_sdk.utils.error_handling import DeploymentError
+
+
+class DeploymentPlanner:
+    """
+    Plans and deploys complete tenant contract sets (ProductPassport, Batch and Geolocation) in one round.
+
+    Contract addresses are precomputed from the deployer address and nonce, so constructors that
+    depend on another contract (Batch needs the ProductPassport address) can be signed before that
+    contract exists. Every transaction is then broadcast back-to-back and the receipts are collected
+    at the end, instead of waiting for each deployment in turn.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        web3 (Web3): Web3 instance for blockchain interactions.
+        account (Account): Ethereum account used for transactions.
+        gwei_bid (int): Gas price in gwei.
+        gas_margin (float): Factor applied to the estimated deployment gas.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, gas_margin=1.1):
+        """
+        Initializes the DeploymentPlanner with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            gas_margin (float, optional): Factor applied to the estimated deployment gas. Defaults to 1.1.
+        """
+        self.sdk = sdk
+        self.web3 = sdk.web3
+        self.account = sdk.account
+        self.gwei_bid = sdk.gwei_bid
+        self.gas_margin = gas_margin
+        self.logger = logging.getLogger(__name__)
+
+    def plan(self, tenants=1, initial_owner=None, include_geolocation=True):
+        """
+        Builds the deployment transactions for one or more tenants without sending them.
+
+        Gas is estimated once per contract type and reused for every tenant, and the nonce is looked
+        up once for the whole plan.
+
+        Args:
+            tenants (int, optional): Number of tenant contract sets to deploy. Defaults to 1.
+            initial_owner (str, optional): Owner of the deployed contracts. Defaults to the deployer's address.
+            include_geolocation (bool, optional): Whether to deploy a Geolocation contract per tenant. Defaults to True.
+
+        Returns:
+            list: One dict per tenant mapping contract name to a dict with the precomputed "address" and the "transaction".
+        """
+        from web3.utils.address import get_create_address
+
+        owner = initial_owner or self.account.address
+        nonce = self.web3.eth.get_transaction_count(self.account.address, 'pending')
+        gas_price = self.web3.to_wei(self.gwei_bid, 'gwei')
+        gas_limits = {}
+
+        def step(name, *args):
+            nonlocal nonce
+            Contract = self.web3.eth.contract(abi=self.sdk.contracts[name]["abi"], bytecode=self.sdk.contracts[name]["bytecode"])
+            constructor = Contract.constructor(*args)
+            if name not in gas_limits:
+                gas_limits[name] = int(constructor.estimate_gas({'from': self.account.address}) * self.gas_margin)
+            tx = constructor.build_transaction({
+                'from': self.account.address,
+                'nonce': nonce,
+                'gas': gas_limits[name],
+                'gasPrice': gas_price
+            })
+            address = get_create_address(self.account.address, nonce)
+            nonce += 1
+            return {"address": address, "transaction": tx}
+
+        plan = []
+        for _ in range(tenants):
+            tenant = {"ProductPassport": step("ProductPassport", owner)}
+            tenant["Batch"] = step("Batch", tenant["ProductPassport"]["address"], owner)
+            if include_geolocation:
+                tenant["Geolocation"] = step("Geolocation")
+            plan.append(tenant)
+        return plan
+
+    def deploy(self, tenants=1, initial_owner=None, include_geolocation=True, timeout=300, max_pending=64):
+        """
+        Deploys one or more tenant contract sets and returns their deployment manifest.
+
+        Args:
+            tenants (int, optional): Number of tenant contract sets to deploy. Defaults to 1.
+            initial_owner (str, optional): Owner of the deployed contracts. Defaults to the deployer's address.
+            include_geolocation (bool, optional): Whether to deploy a Geolocation contract per tenant. Defaults to True.
+            timeout (int, optional): Seconds to wait for each receipt. Defaults to 300.
+            max_pending (int, optional): Maximum number of unconfirmed deployments at a time. Defaults to 64.
+
+        Returns:
+            dict: The manifest, with the "deployer", the "chainId" and a "tenants" list mapping contract name
+            to its "address", "transactionHash" and "blockNumber".
+
+        Raises:
+            DeploymentError: If a deployment transaction cannot be sent, fails, lands at an unexpected address
+                or its receipt cannot be awaited. Its ``manifest`` lists the contracts that were deployed,
+                so that none is lost; tenants are missing the contracts that were not.
+        """
+        plan = self.plan(tenants, initial_owner, include_geolocation)
+        transactions = [deployment["transaction"] for tenant in plan for deployment in tenant.values()]
+        self.logger.info(f"Deploying {len(transactions)} contracts for {tenants} tenant(s) from {self.account.address}")
+
+        receipts = []
+        errors = []
+        error = None
+        try:
+            utils.send_transactions(self.sdk, transactions, timeout=timeout, max_pending=max_pending, receipts=receipts)
+        except Exception as e:
+            error = e
+            errors.append(str(e))
+        receipts = iter(receipts)
+
+        manifest = {"deployer": self.account.address, "chainId": self.web3.eth.chain_id, "tenants": []}
+        for tenant in plan:
+            entry = {}
+            for name, deployment in tenant.items():
+                tx_receipt = next(receipts, None)
+                if tx_receipt is None:
+                    continue
+                tx_hash = self.web3.to_hex(tx_receipt.transactionHash)
+                if tx_receipt.status != 1 or tx_receipt.contractAddress != deployment["address"]:
+                    errors.append(f"Deployment of {name} failed in transaction {tx_hash}")
+                    continue
+                entry[name] = {"address": deployment["address"], "transactionHash": tx_hash, "blockNumber": tx_receipt.blockNumber}
+            manifest["tenants"].append(entry)
+
+        if errors:
+            self.logger.error(f"Deployment failed, partial manifest: {manifest}")
+            raise DeploymentError("; ".join(errors), manifest) from error
+        self.logger.info(f"Deployment manifest: {manifest}")
+        return manifest
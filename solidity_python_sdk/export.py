@@ -0,0 +1,261 @@
+import json
+import logging
+import os
+import time
+from solidity_python_sdk.contracts.records import Product, ProductData, BatchDetails, GeolocationRecord
+from solidity_python_sdk.utils import utils
+
+FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+# Exported column names for the batch and geolocation records, which would otherwise be ambiguous.
+BATCH_COLUMNS = {"amount": "batchAmount", "assemblingTime": "batchAssemblingTime", "transportDetails": "batchTransportDetails"}
+GEOLOCATION_COLUMNS = {"latitude": "latitude", "longitude": "longitude", "additionalInfo": "geolocationInfo"}
+
+
+class PassportExporter:
+    """
+    Streams passport data from the chain into JSONL, Parquet or Arrow IPC files with bounded memory.
+
+    Each exported row combines a product's getProduct and getProductData values and, optionally, the
+    batch and geolocation recorded for its batch number. Rows are read through the SDK's chunked
+    scanner and written in record batches, so memory is bounded by ``batch_size`` rather than the
+    catalog size. After every record batch a checkpoint is saved next to the output, which lets an
+    interrupted export resume where it stopped.
+
+    JSONL output is a single file. Parquet and Arrow output is a directory holding one part file per
+    record batch, which Arrow datasets, pandas and most query engines read as one table.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        batch_size (int): Number of rows per written record batch.
+        chunk_size (int): Number of product IDs per batched read.
+        workers (int): Number of concurrent reads.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, batch_size=1000, chunk_size=100, workers=4):
+        """
+        Initializes the PassportExporter with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            batch_size (int, optional): Number of rows per written record batch. Defaults to 1000.
+            chunk_size (int, optional): Number of product IDs per batched read. Defaults to 100.
+            workers (int, optional): Number of concurrent reads. Defaults to 4.
+        """
+        self.sdk = sdk
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.logger = logging.getLogger(__name__)
+
+    def export(self, path, contract_address, id_range, batch_address=None, geolocation_address=None,
+               output_format=None, resume=False):
+        """
+        Exports every product in an ID range to a file.
+
+        Args:
+            path (str): The output file (JSONL) or directory (Parquet, Arrow).
+            contract_address (str): The address of the deployed ProductPassport contract.
+            id_range (iterable): The product IDs to export, in ascending order.
+            batch_address (str, optional): Batch contract to read each product's batch from, using its numeric batch number.
+            geolocation_address (str, optional): Geolocation contract to read each product's batch geolocation from.
+            output_format (str, optional): One of "jsonl", "parquet" or "arrow". Defaults to the format matching the path extension.
+            resume (bool, optional): Whether to continue an interrupted export from its checkpoint. Defaults to False.
+
+        Returns:
+            dict: The number of "records" written, the "seconds" taken, the "recordsPerSecond" and the "lastId" exported.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        output_format = output_format or FORMATS.get(os.path.splitext(path)[1].lower())
+        if output_format not in ("jsonl", "parquet", "arrow"):
+            raise ValueError(f"Unknown export format for {path}: {output_format}")
+
+        checkpoint_path = path.rstrip(os.sep) + ".checkpoint"
+        checkpoint = _load_checkpoint(checkpoint_path) if resume else None
+        if checkpoint:
+            self.logger.info(f"Resuming export to {path} after product {checkpoint['lastId']}")
+            id_range = (product_id for product_id in id_range if int(product_id) > checkpoint["lastId"])
+
+        if output_format == "jsonl":
+            writer = JsonlWriter(path, checkpoint["offset"] if checkpoint else None)
+        else:
+            writer = ColumnarWriter(path, output_format, batch_address is not None, geolocation_address is not None,
+                                    resume=checkpoint is not None)
+
+        stats = {"records": 0, "seconds": 0.0, "recordsPerSecond": 0.0, "lastId": checkpoint["lastId"] if checkpoint else None}
+        start = time.monotonic()
+        try:
+            rows = self.iter_rows(contract_address, id_range, batch_address, geolocation_address)
+            for rows_batch in utils.chunked(rows, self.batch_size):
+                offset = writer.write(rows_batch)
+                stats["records"] += len(rows_batch)
+                stats["lastId"] = rows_batch[-1]["productId"]
+                _save_checkpoint(checkpoint_path, {"lastId": stats["lastId"], "offset": offset})
+
+                stats["seconds"] = time.monotonic() - start
+                stats["recordsPerSecond"] = stats["records"] / stats["seconds"] if stats["seconds"] else 0.0
+                self.logger.info(
+                    f"Exported {stats['records']} records to {path} ({stats['recordsPerSecond']:.1f} records/s)"
+                )
+        finally:
+            writer.close()
+
+        stats["seconds"] = time.monotonic() - start
+        stats["recordsPerSecond"] = stats["records"] / stats["seconds"] if stats["seconds"] else 0.0
+        return stats
+
+    def iter_rows(self, contract_address, id_range, batch_address=None, geolocation_address=None):
+        """
+        Yields one flat row per product, enriched with its batch and geolocation when contracts are given.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            id_range (iterable): The product IDs to read.
+            batch_address (str, optional): Batch contract to read each product's batch from.
+            geolocation_address (str, optional): Geolocation contract to read each product's batch geolocation from.
+
+        Yields:
+            dict: The row, keyed by "productId" and the record field names.
+        """
+        products = self.sdk.product_passport.iter_products(contract_address, id_range, self.chunk_size, self.workers)
+        for chunk in utils.chunked(products, self.chunk_size):
+            rows = []
+            for product_id, product, product_data in chunk:
+                row = {"productId": product_id}
+                row.update(product._asdict())
+                row.update(product_data._asdict())
+                rows.append(row)
+
+            if batch_address is not None:
+                batch_ids = sorted({int(row["batchNumber"]) for row in rows if row["batchNumber"].isdigit()})
+                batches = dict(zip(batch_ids, self.sdk.batch.get_batches(batch_address, batch_ids)))
+                for row in rows:
+                    batch_number = row["batchNumber"]
+                    batch = batches[int(batch_number)] if batch_number.isdigit() else BatchDetails(None, None, None)
+                    row.update((BATCH_COLUMNS[field], value) for field, value in batch._asdict().items())
+
+            if geolocation_address is not None:
+                contract = self.sdk.web3.eth.contract(address=geolocation_address, abi=self.sdk.contracts['Geolocation']['abi'])
+                geolocations = self.sdk.reader.call_many(contract.functions.getGeolocation(row["batchNumber"]) for row in rows)
+                for row, geolocation in zip(rows, geolocations):
+                    row.update(
+                        (GEOLOCATION_COLUMNS[field], value) for field, value in GeolocationRecord(*geolocation)._asdict().items()
+                    )
+
+            yield from rows
+
+
+class JsonlWriter:
+    """
+    Appends rows to a JSON Lines file, one flushed record batch at a time.
+    """
+
+    def __init__(self, path, offset=None):
+        self.file = open(path, "r+b" if offset is not None else "wb")
+        if offset is not None:
+            # Drop anything written after the last checkpoint, such as a partially written batch.
+            self.file.truncate(offset)
+            self.file.seek(offset)
+
+    def write(self, rows):
+        self.file.write("".join(json.dumps(row) + "\n" for row in rows).encode())
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class ColumnarWriter:
+    """
+    Writes each record batch as its own Parquet or Arrow IPC part file inside a directory.
+
+    Part files are written under a temporary name and renamed once complete, so an interrupted export
+    never leaves a truncated part behind. A new export removes the part files of any earlier export
+    to the same directory; a resumed one keeps them.
+
+    uint256 values have no Arrow integer type, so they are written exactly as decimal strings, the
+    same as in RecordColumns.to_arrow; every part file then has the same schema.
+    """
+
+    def __init__(self, path, output_format, include_batch=False, include_geolocation=False, resume=False):
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                f"pyarrow is required for {output_format} output: pip install solidity-python-sdk[arrow]"
+            ) from e
+
+        self.pyarrow = pyarrow
+        self.path = path
+        self.output_format = output_format
+        self.text_columns = []
+        self.schema = self._schema(include_batch, include_geolocation)
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            # Unfinished parts are always stale; finished ones only belong to a resumed export.
+            if name.startswith("part-") and (name.endswith(".tmp") or not resume):
+                os.remove(os.path.join(path, name))
+
+    def _schema(self, include_batch, include_geolocation):
+        pyarrow = self.pyarrow
+        types = {"string": pyarrow.string(), "string[]": pyarrow.list_(pyarrow.string()), "uint256": pyarrow.string()}
+        columns = [(record_type, None) for record_type in (Product, ProductData)]
+        if include_batch:
+            columns.append((BatchDetails, BATCH_COLUMNS))
+        if include_geolocation:
+            columns.append((GeolocationRecord, GEOLOCATION_COLUMNS))
+
+        fields = [("productId", pyarrow.uint64())]
+        for record_type, names in columns:
+            for field, abi_type in zip(record_type._fields, record_type.abi_types):
+                name = names[field] if names else field
+                fields.append((name, types[abi_type]))
+                if abi_type == "uint256":
+                    self.text_columns.append(name)
+        return pyarrow.schema(fields)
+
+    def write(self, rows):
+        for row in rows:
+            for name in self.text_columns:
+                if row[name] is not None:
+                    row[name] = str(row[name])
+        table = self.pyarrow.Table.from_pylist(rows, schema=self.schema)
+        extension = "parquet" if self.output_format == "parquet" else "arrow"
+        part_path = os.path.join(self.path, f"part-{rows[0]['productId']:020d}.{extension}")
+        temporary_path = part_path + ".tmp"
+        if self.output_format == "parquet":
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table, temporary_path)
+        else:
+            with self.pyarrow.ipc.new_file(temporary_path, self.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary_path, part_path)
+        return None
+
+    def close(self):
+        pass
+
+
+def _load_checkpoint(checkpoint_path):
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as file:
+        return json.load(file)
+
+
+def _save_checkpoint(checkpoint_path, checkpoint):
+    temporary_path = checkpoint_path + ".tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(checkpoint, file)
+    os.replace(temporary_path, checkpoint_path)
@@ -0,0 +1,251 @@
+import logging
+from solidity_python_sdk.contracts.records import GeolocationRecord
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class GeolocationIndex:
+    """
+    In-memory spatial index over the geolocations recorded in a Geolocation contract.
+
+    Latitudes and longitudes are parsed once into NumPy float arrays keyed by batch ID, so radius and
+    bounding-box questions are answered with vectorized arithmetic instead of one contract call and
+    string parse per batch. The index is filled from GeolocationAdded events or bulk reads and can be
+    brought up to date incrementally as new events arrive.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        contract_address (str): The address of the indexed Geolocation contract.
+        last_block (int): The last block whose events have been applied, or None.
+        log_chunk_size (int): Number of blocks requested per eth_getLogs call.
+        skipped (int): Number of geolocations ignored because their coordinates could not be parsed.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, contract_address, log_chunk_size=10000):
+        """
+        Initializes an empty GeolocationIndex for a Geolocation contract.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            contract_address (str): The address of the deployed Geolocation contract.
+            log_chunk_size (int, optional): Number of blocks per eth_getLogs call. Defaults to 10000.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("numpy is required for the geolocation index: pip install solidity-python-sdk[geo]") from e
+
+        self.numpy = numpy
+        self.sdk = sdk
+        self.contract_address = contract_address
+        self.contract = sdk.web3.eth.contract(address=contract_address, abi=sdk.contracts['Geolocation']['abi'])
+        self.last_block = None
+        self.log_chunk_size = log_chunk_size
+        self.skipped = 0
+        self.batch_ids = []
+        self._positions = {}
+        self._latitudes = numpy.empty(0)
+        self._longitudes = numpy.empty(0)
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self):
+        return len(self.batch_ids)
+
+    def __contains__(self, batch_id):
+        return batch_id in self._positions
+
+    @property
+    def latitudes(self):
+        """
+        numpy.ndarray: Latitudes in degrees, aligned with ``batch_ids``.
+        """
+        return self._latitudes[:len(self)]
+
+    @property
+    def longitudes(self):
+        """
+        numpy.ndarray: Longitudes in degrees, aligned with ``batch_ids``.
+        """
+        return self._longitudes[:len(self)]
+
+    def add(self, batch_id, latitude, longitude):
+        """
+        Adds or replaces the geolocation of a batch.
+
+        Args:
+            batch_id (str): The unique identifier of the batch.
+            latitude (str | float): The latitude in degrees.
+            longitude (str | float): The longitude in degrees.
+
+        Returns:
+            bool: Whether the coordinates were valid and indexed. A batch with invalid coordinates is
+            removed from the index, since its earlier geolocation is no longer current.
+        """
+        try:
+            latitude, longitude = float(latitude), float(longitude)
+            valid = -90 <= latitude <= 90 and -180 <= longitude <= 180
+        except (TypeError, ValueError):
+            valid = False
+        if not valid:
+            self.skipped += 1
+            self.logger.debug(f"Skipping batch {batch_id} with invalid coordinates {latitude!r}, {longitude!r}")
+            self.remove(batch_id)
+            return False
+
+        position = self._positions.get(batch_id)
+        if position is None:
+            position = len(self.batch_ids)
+            if position == len(self._latitudes):
+                capacity = max(1024, 2 * position)
+                self._latitudes = self.numpy.resize(self._latitudes, capacity)
+                self._longitudes = self.numpy.resize(self._longitudes, capacity)
+            self._positions[batch_id] = position
+            self.batch_ids.append(batch_id)
+        self._latitudes[position] = latitude
+        self._longitudes[position] = longitude
+        return True
+
+    def remove(self, batch_id):
+        """
+        Removes the geolocation of a batch, if indexed.
+
+        The last indexed batch takes the place of the removed one, so ``batch_ids`` is not kept in insertion order.
+        """
+        position = self._positions.pop(batch_id, None)
+        if position is None:
+            return
+        last = len(self.batch_ids) - 1
+        last_id = self.batch_ids.pop()
+        if position != last:
+            self.batch_ids[position] = last_id
+            self._positions[last_id] = position
+            self._latitudes[position] = self._latitudes[last]
+            self._longitudes[position] = self._longitudes[last]
+
+    def load_events(self, from_block=0, to_block=None):
+        """
+        Applies the GeolocationAdded events emitted within a block range.
+
+        Args:
+            from_block (int, optional): The first block to read. Defaults to 0.
+            to_block (int, optional): The last block to read. Defaults to the current block.
+
+        Returns:
+            int: The number of events applied.
+        """
+        to_block = self.sdk.web3.eth.block_number if to_block is None else to_block
+        applied = 0
+        for start in range(from_block, to_block + 1, self.log_chunk_size):
+            end = min(start + self.log_chunk_size - 1, to_block)
+            for event in self.contract.events.GeolocationAdded.get_logs(from_block=start, to_block=end):
+                self.add(event.args.id, event.args.latitude, event.args.longitude)
+                applied += 1
+            self.last_block = end
+        self.logger.info(f"Applied {applied} geolocation events up to block {to_block}; {len(self)} batches indexed")
+        return applied
+
+    def update(self, from_block=None):
+        """
+        Applies the GeolocationAdded events emitted since the last load.
+
+        Args:
+            from_block (int, optional): The first block to read. Defaults to the block after the last load.
+
+        Returns:
+            int: The number of events applied.
+
+        Raises:
+            ValueError: If the index was never loaded and no ``from_block`` is given.
+        """
+        if from_block is None:
+            if self.last_block is None:
+                raise ValueError("The index was never loaded: call load or load_events first, or pass from_block")
+            from_block = self.last_block + 1
+        if from_block > self.sdk.web3.eth.block_number:
+            return 0
+        return self.load_events(from_block)
+
+    def load(self, batch_ids, block_number=None):
+        """
+        Reads the geolocation of the given batches in bulk and indexes them.
+
+        The reads are pinned to one block. If no events were applied yet, that block becomes
+        ``last_block``, so ``update`` continues from it.
+
+        Args:
+            batch_ids (iterable): The unique identifiers of the batches.
+            block_number (int, optional): The block to read at. Defaults to the current block.
+
+        Returns:
+            int: The number of batches indexed.
+        """
+        batch_ids = list(batch_ids)
+        block_number = self.sdk.web3.eth.block_number if block_number is None else block_number
+        results = self.sdk.reader.call_many(
+            (self.contract.functions.getGeolocation(batch_id) for batch_id in batch_ids), block_identifier=block_number
+        )
+        if self.last_block is None:
+            self.last_block = block_number
+        indexed = 0
+        for batch_id, result in zip(batch_ids, results):
+            geolocation = GeolocationRecord(*result)
+            if geolocation.latitude or geolocation.longitude:
+                indexed += self.add(batch_id, geolocation.latitude, geolocation.longitude)
+        return indexed
+
+    def within_radius(self, latitude, longitude, radius_km):
+        """
+        Finds the batches recorded within a great-circle distance of a point.
+
+        Args:
+            latitude (float): Latitude of the center in degrees.
+            longitude (float): Longitude of the center in degrees.
+            radius_km (float): The radius in kilometres.
+
+        Returns:
+            list: Tuples of batch ID and distance in kilometres, nearest first.
+        """
+        distances = self.distances(latitude, longitude)
+        matches = self.numpy.flatnonzero(distances <= radius_km)
+        matches = matches[self.numpy.argsort(distances[matches], kind="stable")]
+        return [(self.batch_ids[i], float(distances[i])) for i in matches]
+
+    def within_bbox(self, min_latitude, min_longitude, max_latitude, max_longitude):
+        """
+        Finds the batches recorded inside a bounding box.
+
+        A box whose minimum longitude is greater than its maximum longitude crosses the antimeridian.
+
+        Args:
+            min_latitude (float): Southern edge in degrees.
+            min_longitude (float): Western edge in degrees.
+            max_latitude (float): Northern edge in degrees.
+            max_longitude (float): Eastern edge in degrees.
+
+        Returns:
+            list: The batch IDs inside the box, in index order.
+        """
+        latitudes, longitudes = self.latitudes, self.longitudes
+        inside = (latitudes >= min_latitude) & (latitudes <= max_latitude)
+        if min_longitude <= max_longitude:
+            inside &= (longitudes >= min_longitude) & (longitudes <= max_longitude)
+        else:
+            inside &= (longitudes >= min_longitude) | (longitudes <= max_longitude)
+        return [self.batch_ids[i] for i in self.numpy.flatnonzero(inside)]
+
+    def distances(self, latitude, longitude):
+        """
+        Returns the haversine distance in kilometres from a point to every indexed batch.
+        """
+        numpy = self.numpy
+        latitudes, longitudes = numpy.radians(self.latitudes), numpy.radians(self.longitudes)
+        latitude, longitude = numpy.radians(latitude), numpy.radians(longitude)
+        a = (
+            numpy.sin((latitudes - latitude) / 2) ** 2
+            + numpy.cos(latitude) * numpy.cos(latitudes) * numpy.sin((longitudes - longitude) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS_KM * numpy.arcsin(numpy.sqrt(numpy.clip(a, 0.0, 1.0)))
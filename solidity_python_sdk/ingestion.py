@@ -0,0 +1,267 @@
+import json
+import logging
+import os
+import queue
+import threading
+from solidity_python_sdk.contracts.records import ProductData
+from solidity_python_sdk.utils import utils
+
+_DONE = object()
+
+
+class IngestionPipeline:
+    """
+    Streams directories of passport configs through IPFS and onto the chain.
+
+    Every config passes four stages: its documents are pinned, the passport JSON is built (and the
+    gas of its setProductData transaction estimated), that JSON is pinned, and the product data is
+    submitted on-chain. Each stage runs on its own worker threads and hands items to the next through
+    a bounded queue, so pinning, gas estimation and transaction submission for different configs
+    overlap, while memory stays bounded by the queue sizes. Submission runs on a single thread that
+    assigns consecutive nonces and keeps up to ``max_pending`` transactions unconfirmed.
+
+    A config that fails in any stage is reported and dropped without stopping the others. If a
+    transaction cannot be broadcast, later nonces would be invalid, so the pipeline stops: configs
+    already in flight are reported as failed and the rest of the source is not read.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        pinata_utility (PinataUtility): The IPFS pinning client.
+        pin_workers (int): Number of threads pinning documents.
+        build_workers (int): Number of threads building passports and estimating gas.
+        pin_json_workers (int): Number of threads pinning passport JSON.
+        queue_size (int): Capacity of the queue between two stages.
+        max_pending (int): Maximum number of unconfirmed transactions at a time.
+        timeout (int): Seconds to wait for each receipt.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, pinata_utility=None, pin_workers=8, build_workers=4, pin_json_workers=8, queue_size=64,
+                 max_pending=64, timeout=300):
+        """
+        Initializes the IngestionPipeline with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            pinata_utility (PinataUtility, optional): The IPFS pinning client. Defaults to the SDK's client.
+            pin_workers (int, optional): Number of threads pinning documents. Defaults to 8.
+            build_workers (int, optional): Number of threads building passports and estimating gas. Defaults to 4.
+            pin_json_workers (int, optional): Number of threads pinning passport JSON. Defaults to 8.
+            queue_size (int, optional): Capacity of the queue between two stages. Defaults to 64.
+            max_pending (int, optional): Maximum number of unconfirmed transactions at a time. Defaults to 64.
+            timeout (int, optional): Seconds to wait for each receipt. Defaults to 300.
+
+        Raises:
+            ValueError: If no pinning client is given and the SDK has no Pinata credentials.
+        """
+        self.sdk = sdk
+        self.pinata_utility = pinata_utility or getattr(sdk, "pinata_utility", None)
+        if self.pinata_utility is None:
+            raise ValueError("Pinata API key and secret must be provided for ingestion.")
+        self.pin_workers = pin_workers
+        self.build_workers = build_workers
+        self.pin_json_workers = pin_json_workers
+        self.queue_size = queue_size
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, source, contract_address):
+        """
+        Ingests every config of a source into a ProductPassport contract.
+
+        Args:
+            source (str | iterable): A directory of JSON configs, a manifest file listing config paths
+                (a JSON array, or one path per line), or an iterable of config paths.
+            contract_address (str): The address of the deployed ProductPassport contract.
+
+        Returns:
+            dict: The "submitted" results (one dict per config with its "config", "productId",
+            "passportCid", "transactionHash" and "blockNumber") and the "failed" configs (one dict with
+            the "config", the "stage" it failed in and the "error").
+        """
+        contract = self.sdk.web3.eth.contract(address=contract_address, abi=self.sdk.contracts['ProductPassport']['abi'])
+        report = {"submitted": [], "failed": []}
+        lock = threading.Lock()
+        stop = threading.Event()
+        queues = [queue.Queue(self.queue_size) for _ in range(4)]
+
+        def fail(item, stage, error):
+            self.logger.error(f"Ingestion of {item['config']} failed in stage {stage}: {error}")
+            with lock:
+                report["failed"].append({"config": item["config"], "stage": stage, "error": str(error)})
+
+        def feed():
+            try:
+                for config_path in iter_configs(source):
+                    if stop.is_set():
+                        break
+                    queues[0].put({"config": config_path})
+            except Exception as e:
+                fail({"config": source}, "read_source", e)
+            finally:
+                queues[0].put(_DONE)
+
+        stages = [
+            ("pin_documents", self.pin_documents, self.pin_workers),
+            ("build_passport", lambda item: self.build_passport(item, contract), self.build_workers),
+            ("pin_passport", self.pin_passport, self.pin_json_workers),
+        ]
+        threads = [threading.Thread(target=feed, daemon=True)]
+        for position, (stage, function, workers) in enumerate(stages):
+            threads.extend(_stage_threads(stage, function, workers, queues[position], queues[position + 1], stop, fail))
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._submit(queues[-1], report, stop, fail)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        self.logger.info(f"Ingestion finished: {len(report['submitted'])} submitted, {len(report['failed'])} failed")
+        return report
+
+    def pin_documents(self, item):
+        """
+        Loads a config and pins the files it references, replacing their paths with CIDs.
+        """
+        config_path = item["config"]
+        with open(config_path) as config_file:
+            config = json.load(config_file)
+        base = os.path.dirname(config_path)
+
+        def pin(value):
+            path = value if os.path.isabs(value) else os.path.join(base, value)
+            if not os.path.isfile(path):
+                return value
+            return self.pinata_utility.pin_file(path)["IpfsHash"]
+
+        pinned = {}
+        for key, value in config.items():
+            if isinstance(value, list):
+                pinned[key] = [pin(entry) if isinstance(entry, str) else entry for entry in value]
+            elif isinstance(value, str):
+                pinned[key] = pin(value)
+            else:
+                pinned[key] = value
+        if "productId" not in pinned:
+            raise ValueError("Config has no productId")
+        item["pinned"] = pinned
+        return item
+
+    def build_passport(self, item, contract):
+        """
+        Builds the passport JSON of a config and prepares its setProductData call with a gas estimate.
+        """
+        passport = self.sdk.create_passport_json(item["pinned"])
+        item["productId"] = int(item["pinned"]["productId"])
+        item["passport"] = passport
+        item["function"] = contract.functions.setProductData(
+            item["productId"], *(passport[field] for field in ProductData._fields)
+        )
+        item["gas"] = item["function"].estimate_gas({'from': self.sdk.account.address})
+        return item
+
+    def pin_passport(self, item):
+        """
+        Pins the passport JSON of a config.
+        """
+        item["passportCid"] = self.pinata_utility.pin_json(item["passport"])["IpfsHash"]
+        return item
+
+    def _submit(self, inbox, report, stop, fail):
+        submitted = []
+        gas_price = self.sdk.web3.to_wei(self.sdk.gwei_bid, 'gwei')
+
+        def transactions():
+            nonce = self.sdk.web3.eth.get_transaction_count(self.sdk.account.address, 'pending')
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    return
+                # Recorded before building, so a config whose transaction cannot be built is reported as failed.
+                submitted.append(item)
+                tx = item["function"].build_transaction({
+                    'from': self.sdk.account.address,
+                    'nonce': nonce,
+                    'gas': item["gas"],
+                    'gasPrice': gas_price
+                })
+                nonce += 1
+                yield tx
+
+        receipts = []
+        try:
+            utils.send_transactions(self.sdk, transactions(), timeout=self.timeout, max_pending=self.max_pending,
+                                    receipts=receipts)
+        except Exception as e:
+            stop.set()
+            for item in submitted[len(receipts):]:
+                fail(item, "submit", e)
+            # Later nonces are invalid once a transaction is missing; drain the remaining configs as failed.
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    break
+                fail(item, "submit", "Pipeline stopped after a submission failure")
+
+        for item, tx_receipt in zip(submitted, receipts):
+            if tx_receipt.status != 1:
+                fail(item, "submit", f"Transaction {self.sdk.web3.to_hex(tx_receipt.transactionHash)} reverted")
+                continue
+            report["submitted"].append({
+                "config": item["config"],
+                "productId": item["productId"],
+                "passportCid": item["passportCid"],
+                "transactionHash": self.sdk.web3.to_hex(tx_receipt.transactionHash),
+                "blockNumber": tx_receipt.blockNumber
+            })
+
+
+def iter_configs(source):
+    """
+    Yields the config paths of a directory, a manifest file or an iterable of paths.
+    """
+    if isinstance(source, str) and os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(".json"):
+                yield os.path.join(source, name)
+    elif isinstance(source, str):
+        base = os.path.dirname(source)
+        with open(source) as manifest:
+            content = manifest.read()
+        try:
+            paths = json.loads(content)
+        except ValueError:
+            paths = [line.strip() for line in content.splitlines() if line.strip()]
+        for path in paths:
+            yield path if os.path.isabs(path) else os.path.join(base, path)
+    else:
+        yield from source
+
+
+def _stage_threads(stage, function, workers, inbox, outbox, stop, fail):
+    remaining = [workers]
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                # Pass the end marker on to the sibling workers, and downstream once they are all done.
+                (outbox if last else inbox).put(_DONE)
+                return
+            if stop.is_set():
+                fail(item, stage, "Pipeline stopped after a submission failure")
+                continue
+            try:
+                outbox.put(function(item))
+            except Exception as e:
+                fail(item, stage, e)
+
+    return [threading.Thread(target=work, daemon=True, name=f"ingestion-{stage}-{index}") for index in range(workers)]
@@ -1,48 +1,117 @@
 import logging
 import json
-from web3 import Web3
 from dotenv import load_dotenv
 import os
-from eth_account import Account
+from functools import cached_property
 from solidity_python_sdk.contracts.product_passport import ProductPassport
 from solidity_python_sdk.contracts.geolocation import Geolocation
 from solidity_python_sdk.contracts.batch import Batch
+from solidity_python_sdk.contracts.complex_management import ComplexManagement
+from solidity_python_sdk.deployment import DeploymentPlanner
+from solidity_python_sdk.ingestion import IngestionPipeline
 from solidity_python_sdk.resources import ABI
-from solidity_python_sdk.utils.pinata_utils import PinataUtility
+from solidity_python_sdk.utils.integrity import IntegrityVerifier
+from solidity_python_sdk.utils.ledger import SpendLedger
+from solidity_python_sdk.utils.preflight import Preflight
+from solidity_python_sdk.utils.reader import ContractReader
+from solidity_python_sdk.utils.ipfs import ContentCache, IpfsFetcher
+
+# web3 (with eth_account), the provider stacks, pinatapy and sqlite3 are imported where they are
+# first needed, so importing the SDK stays cheap for tools that never connect to a node.
 
 class DigitalProductPassportSDK:
     """
     SDK for interacting with Digital Product Passport smart contracts.
     """
 
-    def __init__(self, provider_url=None, private_key=None, gas=254362, gwei_bid=3, pinata_api_key=None, pinata_secret_key=None):
+    def __init__(self, provider_url=None, private_key=None, gas=254362, gwei_bid=3, pinata_api_key=None, pinata_secret_key=None,
+                 rate_limits=None, cache_path=None, ipfs_gateways=None, ipfs_cache_dir=None):
         """
         Initializes the SDK with a provider URL and private key.
+
+        ``provider_url`` may also be a list of RPC endpoint URLs (or a comma-separated string of them),
+        in which case requests are spread over the endpoints by a MultiEndpointProvider, or a ready-made
+        Web3 provider instance.
+
+        ``rate_limits`` enables client-side rate limiting: pass True for the default read, write and
+        eth_getLogs budgets, or a dict overriding some of them (see RateLimitedProvider).
+
+        ``cache_path`` enables a persistent on-disk cache of contract reads at finalized blocks, stored
+        in a SQLite database at that path (see ReadCache).
+
+        ``ipfs_gateways`` lists the HTTP gateways used to fetch IPFS documents, and ``ipfs_cache_dir``
+        keeps fetched documents on disk, keyed by CID (see IpfsFetcher).
         """
         logging.basicConfig(level=logging.DEBUG)
         load_dotenv()
         provider_url = provider_url or os.getenv("PROVIDER_URL")
         private_key = private_key or os.getenv("PRIVATE_KEY")
-        pinata_api_key = provider_url or os.getenv("PINATA_API_KEY")
-        pinata_secret_key = private_key or os.getenv("PINATA_API_SECRET")
+        pinata_api_key = pinata_api_key or os.getenv("PINATA_API_KEY")
+        pinata_secret_key = pinata_secret_key or os.getenv("PINATA_API_SECRET")
 
         if not private_key:
             raise ValueError("Private key must be provided.")
 
-        self.web3 = Web3(Web3.HTTPProvider(provider_url))
+        from web3 import Web3
+
+        provider = self.build_provider(provider_url)
+        if rate_limits:
+            from solidity_python_sdk.providers.rate_limit import RateLimitedProvider
+            provider = RateLimitedProvider(provider, budgets=None if rate_limits is True else rate_limits)
+        self.web3 = Web3(provider)
         self.account = self.web3.eth.account.from_key(private_key)
         self.gas = gas
         self.gwei_bid = gwei_bid
         self.contracts = self.load_all_contracts()
+        cache = None
+        if cache_path:
+            from solidity_python_sdk.utils.cache import ReadCache
+            cache = ReadCache(cache_path)
+        self.reader = ContractReader(self, cache=cache)
+        self.ledger = SpendLedger(self)
+        self.preflight = Preflight(self)
+        self.ipfs_gateways = ipfs_gateways
+        self.ipfs_cache_dir = ipfs_cache_dir
 
         if pinata_api_key and pinata_secret_key:
+            from solidity_python_sdk.utils.pinata_utils import PinataUtility
             self.pinata_utility = PinataUtility(pinata_api_key, pinata_secret_key)
         self.product_passport = ProductPassport(self)
         self.batch = Batch(self)
         self.geolocation = Geolocation(self)
+        self.complex_management = ComplexManagement(self)
+        self.deployment = DeploymentPlanner(self)
 
         logging.info("DigitalProductPassportSDK initialized successfully.")
 
+    @cached_property
+    def ipfs(self):
+        """
+        IpfsFetcher over ``ipfs_gateways``, created on first use so SDKs that never fetch IPFS
+        documents do not set up an HTTP session and thread pool for it.
+        """
+        return IpfsFetcher(self.ipfs_gateways, cache=ContentCache(self.ipfs_cache_dir))
+
+    @cached_property
+    def integrity(self):
+        """
+        IntegrityVerifier using the SDK's IPFS fetcher, created on first use.
+        """
+        return IntegrityVerifier(self)
+
+    def build_provider(self, provider_url):
+        from web3 import Web3
+        from web3.providers.base import BaseProvider
+
+        if isinstance(provider_url, BaseProvider):
+            return provider_url
+        if isinstance(provider_url, str) and "," in provider_url:
+            provider_url = [url.strip() for url in provider_url.split(",") if url.strip()]
+        if isinstance(provider_url, (list, tuple)):
+            from solidity_python_sdk.providers.multi_endpoint import MultiEndpointProvider
+            return MultiEndpointProvider(provider_url)
+        return Web3.HTTPProvider(provider_url)
+
     def load_all_contracts(self):
         contracts = {}
         abi_folder_path = os.path.dirname(ABI.__file__)
@@ -67,6 +136,13 @@ class DigitalProductPassportSDK:
         passport_data = self.create_passport_json(pinned_data)
         return self.pinata_utility.pin_json(passport_data)
 
+    def ingest_configs(self, source, contract_address, **options):
+        """
+        Pins the documents of many passport configs and writes their product data on-chain,
+        streaming them through an IngestionPipeline. Keyword options are passed to the pipeline.
+        """
+        return IngestionPipeline(self, **options).run(source, contract_address)
+
     def create_passport_json(self, pinned_data):
         passport_json = {
             "description": pinned_data.get("description", ""),
@@ -0,0 +1,244 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from eth_utils import keccak
+from web3 import HTTPProvider
+from web3.providers.base import JSONBaseProvider
+
+# JSON-RPC methods that only read chain state; these are safe to send to several endpoints at once.
+READ_METHODS = frozenset({
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+    "net_version",
+    "web3_clientVersion",
+})
+
+
+class EndpointStats:
+    """
+    Rolling latency and error statistics for a single RPC endpoint.
+
+    Samples older than ``max_age`` seconds are forgotten, so an endpoint that stopped receiving
+    requests after a bad spell is judged afresh: once its failures have aged out it is ranked as
+    healthy again, and the next request sent to it serves as a probe.
+
+    Attributes:
+        latencies (deque): Times and latencies in seconds of the most recent successful requests.
+        outcomes (deque): Times of the most recent requests and whether each succeeded.
+        max_age (float): Seconds after which a sample is forgotten.
+    """
+
+    def __init__(self, window=200, max_age=60.0):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def record(self, latency, ok):
+        now = time.monotonic()
+        with self._lock:
+            self.outcomes.append((now, ok))
+            if ok:
+                self.latencies.append((now, latency))
+
+    def percentile(self, fraction):
+        with self._lock:
+            self._expire()
+            samples = sorted(latency for _, latency in self.latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    @property
+    def samples(self):
+        """
+        int: Number of latency samples that have not expired.
+        """
+        with self._lock:
+            self._expire()
+            return len(self.latencies)
+
+    @property
+    def error_rate(self):
+        with self._lock:
+            self._expire()
+            if not self.outcomes:
+                return 0.0
+            return sum(not ok for _, ok in self.outcomes) / len(self.outcomes)
+
+    def _expire(self):
+        oldest = time.monotonic() - self.max_age
+        for samples in (self.latencies, self.outcomes):
+            while samples and samples[0][0] < oldest:
+                samples.popleft()
+
+
+class MultiEndpointProvider(JSONBaseProvider):
+    """
+    Web3 provider spreading requests over several RPC endpoints.
+
+    Endpoints are ranked by error rate and median latency. Read requests go to the best endpoint and,
+    if it has not answered within its p95 latency, a hedged duplicate is sent to the next one; the first
+    answer wins. Write requests are sent to one endpoint at a time, failing over to the next healthy
+    endpoint on connection errors. Endpoint statistics expire after ``stats_max_age`` seconds, so an
+    endpoint ranked last after failures is tried again once they have aged out.
+
+    Attributes:
+        endpoints (list): The underlying providers, one per RPC endpoint.
+        stats (dict): EndpointStats for each provider.
+        hedge_delay (float): Delay in seconds used before hedging until enough latency samples exist.
+        min_samples (int): Number of latency samples needed before the p95 latency is trusted.
+        unhealthy_error_rate (float): Error rate above which an endpoint is ranked after the healthy ones.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, endpoints, hedge_delay=0.5, min_samples=20, unhealthy_error_rate=0.5, max_workers=16,
+                 request_kwargs=None, stats_max_age=60.0, **kwargs):
+        """
+        Initializes the MultiEndpointProvider with a list of endpoints.
+
+        Args:
+            endpoints (list): RPC endpoint URLs, or provider instances.
+            hedge_delay (float, optional): Hedge delay in seconds used until enough samples exist. Defaults to 0.5.
+            min_samples (int, optional): Latency samples needed before the p95 is used. Defaults to 20.
+            unhealthy_error_rate (float, optional): Error rate marking an endpoint unhealthy. Defaults to 0.5.
+            max_workers (int, optional): Number of threads used for concurrent requests. Defaults to 16.
+            request_kwargs (dict, optional): Keyword arguments passed to each HTTPProvider created from a URL.
+            stats_max_age (float, optional): Seconds after which latency and error samples expire. Defaults to 60.
+
+        Raises:
+            ValueError: If no endpoints are provided.
+        """
+        super().__init__(**kwargs)
+        if not endpoints:
+            raise ValueError("At least one endpoint must be provided.")
+
+        self.endpoints = [
+            HTTPProvider(endpoint, request_kwargs=request_kwargs, exception_retry_configuration=None)
+            if isinstance(endpoint, str) else endpoint
+            for endpoint in endpoints
+        ]
+        self.stats = {endpoint: EndpointStats(max_age=stats_max_age) for endpoint in self.endpoints}
+        self.hedge_delay = hedge_delay
+        self.min_samples = min_samples
+        self.unhealthy_error_rate = unhealthy_error_rate
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rpc-endpoint")
+        self.logger = logging.getLogger(__name__)
+
+    def __str__(self):
+        return f"Multi-endpoint connection {[str(endpoint) for endpoint in self.endpoints]}"
+
+    def ranked_endpoints(self):
+        """
+        Returns the endpoints ordered from most to least preferred.
+        """
+        def score(endpoint):
+            stats = self.stats[endpoint]
+            median = stats.percentile(0.5)
+            return (stats.error_rate > self.unhealthy_error_rate, median if median is not None else 0.0)
+
+        return sorted(self.endpoints, key=score)
+
+    def make_request(self, method, params):
+        if method in READ_METHODS:
+            return self._hedged(lambda endpoint: endpoint.make_request(method, params))
+        return self._failover(method, params)
+
+    def make_batch_request(self, requests):
+        if all(method in READ_METHODS for method, _ in requests):
+            return self._hedged(lambda endpoint: endpoint.make_batch_request(requests))
+        return self._failover_batch(requests)
+
+    def is_connected(self, show_traceback=False):
+        return any(endpoint.is_connected(show_traceback) for endpoint in self.endpoints)
+
+    def close(self):
+        """
+        Shuts down the threads used for hedged requests. Requests still running are not waited for.
+        """
+        self._executor.shutdown(wait=False)
+
+    def _timed(self, endpoint, request):
+        start = time.monotonic()
+        try:
+            response = request(endpoint)
+        except Exception:
+            self.stats[endpoint].record(time.monotonic() - start, False)
+            raise
+        self.stats[endpoint].record(time.monotonic() - start, True)
+        return response
+
+    def _hedge_delay_for(self, endpoint):
+        stats = self.stats[endpoint]
+        delay = stats.percentile(0.95) if stats.samples >= self.min_samples else None
+        return self.hedge_delay if delay is None else delay
+
+    def _hedged(self, request):
+        candidates = self.ranked_endpoints()
+        primary = candidates.pop(0)
+        futures = {self._executor.submit(self._timed, primary, request): primary}
+        done, _ = wait(futures, timeout=self._hedge_delay_for(primary))
+
+        last_error = None
+        while True:
+            for future in done:
+                endpoint = futures.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    self.logger.warning(f"Request to {endpoint} failed: {e}")
+                    last_error = e
+            if candidates:
+                # Either the pending requests are slower than usual or they failed: hedge to the next endpoint.
+                endpoint = candidates.pop(0)
+                self.logger.debug(f"Hedging request to {endpoint}")
+                futures[self._executor.submit(self._timed, endpoint, request)] = endpoint
+            elif not futures:
+                raise last_error
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+    def _failover(self, method, params):
+        last_error = None
+        for endpoint in self.ranked_endpoints():
+            try:
+                response = self._timed(endpoint, lambda provider: provider.make_request(method, params))
+            except Exception as e:
+                self.logger.warning(f"Request {method} to {endpoint} failed, failing over: {e}")
+                last_error = e
+                continue
+            if last_error is not None and method == "eth_sendRawTransaction" and _already_known(response):
+                # An earlier endpoint broadcast the transaction before failing; report its hash.
+                return {"jsonrpc": "2.0", "id": response.get("id"), "result": "0x" + keccak(hexstr=params[0]).hex()}
+            return response
+        raise last_error
+
+    def _failover_batch(self, requests):
+        last_error = None
+        for endpoint in self.ranked_endpoints():
+            try:
+                return self._timed(endpoint, lambda provider: provider.make_batch_request(requests))
+            except Exception as e:
+                self.logger.warning(f"Batch request to {endpoint} failed, failing over: {e}")
+                last_error = e
+        raise last_error
+
+
+def _already_known(response):
+    message = str(response.get("error", {}).get("message", "")).lower()
+    return "already known" in message or "known transaction" in message
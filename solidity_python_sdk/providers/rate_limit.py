@@ -0,0 +1,223 @@
+import logging
+import threading
+import time
+from requests.exceptions import HTTPError
+from web3.providers.base import JSONBaseProvider
+
+# JSON-RPC error codes that hosted providers use to signal throttling.
+THROTTLE_ERROR_CODES = frozenset({429, -32005})
+WRITE_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+LOG_METHODS = frozenset({"eth_getLogs"})
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the rate at which requests are sent.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of tokens the bucket holds, i.e. the allowed burst.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Blocks until ``tokens`` tokens are available, then takes them.
+        """
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit adjusted AIMD-style: it grows by one slot per window of successful requests and
+    is cut multiplicatively whenever a request is throttled. Requests that fail otherwise leave it unchanged.
+
+    Attributes:
+        limit (float): The current concurrency limit.
+        minimum (int): The lowest the limit may shrink to.
+        maximum (int): The highest the limit may grow to.
+        decrease (float): Factor applied to the limit on throttling.
+        in_flight (int): Number of requests currently holding a slot.
+    """
+
+    def __init__(self, initial, minimum=1, maximum=64, decrease=0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= max(self.minimum, int(self.limit)):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled=False, succeeded=True):
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            elif succeeded:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+
+class Budget:
+    """
+    Request budget for one class of requests, combining a token bucket with an adaptive concurrency limit.
+
+    The token rate follows the same AIMD rule as the concurrency limit: it grows by ``rate_increase``
+    per successful request up to ``max_rate`` and is halved on throttling, down to ``min_rate``. A request
+    that fails for another reason, such as a connection error, releases its slot without changing either.
+    """
+
+    def __init__(self, rate, concurrency, max_rate=None, min_rate=1.0, rate_increase=0.1, max_concurrency=None):
+        self.bucket = TokenBucket(rate)
+        self.concurrency = AdaptiveConcurrency(concurrency, maximum=max_concurrency or concurrency * 8)
+        self.max_rate = max_rate or rate * 8
+        self.min_rate = min_rate
+        self.rate_increase = rate_increase
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    def acquire(self, tokens=1):
+        self.concurrency.acquire()
+        self.bucket.acquire(tokens)
+
+    def release(self, throttled=False, succeeded=True):
+        with self._lock:
+            if throttled:
+                self.bucket.rate = max(self.min_rate, self.bucket.rate * 0.5)
+            elif succeeded:
+                self.bucket.rate = min(self.max_rate, self.bucket.rate + self.rate_increase)
+        self.concurrency.release(throttled, succeeded)
+
+
+def default_budgets():
+    return {
+        "reads": Budget(rate=50, concurrency=8),
+        "writes": Budget(rate=10, concurrency=4),
+        "logs": Budget(rate=5, concurrency=2),
+    }
+
+
+class RateLimitedProvider(JSONBaseProvider):
+    """
+    Web3 provider wrapper that paces requests with separate budgets for reads, writes and eth_getLogs.
+
+    Throttling responses (HTTP 429 or JSON-RPC rate-limit errors) shrink the budget's rate and
+    concurrency and the request is retried after a backoff; successful requests grow them again, so
+    bulk jobs settle at the highest rate the provider sustains.
+
+    Attributes:
+        provider (BaseProvider): The wrapped provider.
+        budgets (dict): Budget for each of "reads", "writes" and "logs".
+        max_retries (int): Number of times a throttled request is retried before the error is returned.
+        backoff (float): Base delay in seconds between retries, doubled on each attempt.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, provider, budgets=None, max_retries=5, backoff=0.5, **kwargs):
+        """
+        Initializes the RateLimitedProvider around an existing provider.
+
+        Args:
+            provider (BaseProvider): The provider to wrap.
+            budgets (dict, optional): Budgets, or keyword arguments for them, overriding the defaults for
+                "reads", "writes" and "logs".
+            max_retries (int, optional): Retries for throttled requests. Defaults to 5.
+            backoff (float, optional): Base retry delay in seconds. Defaults to 0.5.
+        """
+        super().__init__(**kwargs)
+        self.provider = provider
+        self.budgets = default_budgets()
+        for name, budget in (budgets or {}).items():
+            self.budgets[name] = budget if isinstance(budget, Budget) else Budget(**budget)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.logger = logging.getLogger(__name__)
+
+    def __str__(self):
+        return f"Rate limited {self.provider}"
+
+    def is_connected(self, show_traceback=False):
+        return self.provider.is_connected(show_traceback)
+
+    def make_request(self, method, params):
+        return self._send(self._budget_for([method]), 1, lambda: self.provider.make_request(method, params))
+
+    def make_batch_request(self, requests):
+        budget = self._budget_for([method for method, _ in requests])
+        return self._send(budget, len(requests), lambda: self.provider.make_batch_request(requests))
+
+    def _budget_for(self, methods):
+        if any(method in WRITE_METHODS for method in methods):
+            return self.budgets["writes"]
+        if any(method in LOG_METHODS for method in methods):
+            return self.budgets["logs"]
+        return self.budgets["reads"]
+
+    def _send(self, budget, tokens, request):
+        for attempt in range(self.max_retries + 1):
+            budget.acquire(tokens)
+            throttled, succeeded, retry_after = False, False, None
+            try:
+                response = request()
+                throttled = is_throttled(response)
+                succeeded = not throttled
+            except HTTPError as e:
+                throttled = e.response is not None and e.response.status_code == 429
+                if not throttled or attempt == self.max_retries:
+                    raise
+                retry_after = e.response.headers.get("Retry-After")
+            finally:
+                # Only answered requests grow the budget; other failures say nothing about the provider's limits.
+                budget.release(throttled, succeeded)
+
+            if not throttled or attempt == self.max_retries:
+                return response
+
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else self.backoff * 2 ** attempt
+            self.logger.warning(
+                f"Provider throttled request, retrying in {delay:.2f}s "
+                f"(rate {budget.rate:.1f}/s, concurrency {budget.concurrency.limit:.1f})"
+            )
+            time.sleep(delay)
+
+
+def is_throttled(response):
+    """
+    Returns whether a JSON-RPC response, or any response of a batch, is a rate-limit error.
+    """
+    if isinstance(response, list):
+        return any(is_throttled(item) for item in response)
+    error = response.get("error") if isinstance(response, dict) else None
+    if not isinstance(error, dict):
+        return False
+    message = str(error.get("message", "")).lower()
+    return (
+        error.get("code") in THROTTLE_ERROR_CODES
+        or "rate limit" in message
+        or "too many requests" in message
+    )
@@ -0,0 +1,24 @@
+"""
+Pytest fixtures for testing code built on the SDK against an in-process chain.
+
+Enable them in a conftest.py with ``pytest_plugins = ["solidity_python_sdk.pytest_plugin"]``.
+"""
+import pytest
+from solidity_python_sdk.testing import LocalChain
+
+
+@pytest.fixture(scope="session")
+def dpp_chain():
+    """
+    LocalChain shared by the whole test session, with the bundled contracts deployed once.
+    """
+    return LocalChain()
+
+
+@pytest.fixture()
+def dpp_sdk(dpp_chain):
+    """
+    SDK connected to the shared LocalChain; every change the test makes to the chain is reverted afterwards.
+    """
+    with dpp_chain.isolated() as sdk:
+        yield sdk
@@ -0,0 +1,149 @@
+import ast
+import logging
+from contextlib import contextmanager
+from eth_abi import encode
+from eth_tester import EthereumTester, PyEVMBackend
+from eth_tester.backends.pyevm.main import get_default_account_keys
+from eth_tester.exceptions import TransactionFailed
+from web3 import EthereumTesterProvider
+from web3.providers.base import JSONBaseProvider
+from web3.providers.eth_tester.middleware import ethereum_tester_middleware
+from solidity_python_sdk.main import DigitalProductPassportSDK
+from solidity_python_sdk.utils.preflight import ERROR_STRING_SELECTOR
+
+
+class TesterNodeProvider(EthereumTesterProvider, JSONBaseProvider):
+    """
+    EthereumTesterProvider that answers like a JSON-RPC node.
+
+    eth-tester raises reverts as Python exceptions and has no batched requests. This provider returns
+    reverts as error responses carrying the revert data (code 3), so web3 raises ContractLogicError
+    as it does against a real node, and it accepts batched requests.
+    """
+
+    def make_request(self, method, params):
+        try:
+            return super().make_request(method, params)
+        except TransactionFailed as e:
+            reason = str(e.args[0]) if e.args else ""
+            reason = reason.split("execution reverted: ", 1)[-1]
+            if reason.startswith(("b'", 'b"')):
+                # Custom errors come back as the repr of the raw revert data.
+                data = ast.literal_eval(reason)
+                message = "execution reverted"
+            else:
+                data = bytes.fromhex(ERROR_STRING_SELECTOR) + encode(["string"], [reason])
+                message = f"execution reverted: {reason}"
+            return {"jsonrpc": "2.0", "id": 0, "error": {"code": 3, "message": message, "data": "0x" + data.hex()}}
+
+    def make_batch_request(self, requests):
+        responses = []
+        for method, params in requests:
+            if method in ("eth_call", "eth_estimateGas") and not params[0].get("from"):
+                # Done by web3's default transaction fields middleware for single requests, which
+                # cannot look up accounts in the middle of a batch.
+                params = [dict(params[0], **{"from": self.ethereum_tester.get_accounts()[0]})] + list(params[1:])
+            responses.append(self.make_request(method, params))
+        return responses
+
+    def batch_request_func(self, w3, middleware_onion):
+        # Batched requests need the eth-tester request and result formatting, which only request_func adds.
+        accumulator = self.make_batch_request
+        for middleware in reversed(middleware_onion.as_tuple_of_middleware() + (ethereum_tester_middleware,)):
+            accumulator = middleware(w3).wrap_make_batch_request(accumulator)
+        return accumulator
+
+
+class LocalChain:
+    """
+    In-process eth-tester chain for testing code built on the SDK, without a node or network access.
+
+    The chain starts with prefunded accounts, and the bundled contracts are deployed once when it is
+    created. Tests then run against a snapshot of that state that is reverted afterwards, so each test
+    sees the freshly deployed contracts without paying for another deployment.
+
+    Attributes:
+        provider (TesterNodeProvider): The Web3 provider of the in-process chain.
+        private_keys (list): Hex private keys of the prefunded accounts.
+        sdk (DigitalProductPassportSDK): SDK signing with the first account, used for the deployment.
+        addresses (dict): Address of each deployed contract, keyed by contract name.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, accounts=10, deploy=True):
+        """
+        Starts the chain and deploys the bundled contracts.
+
+        Args:
+            accounts (int, optional): Number of prefunded accounts, each holding 1,000,000 ether. Defaults to 10.
+            deploy (bool, optional): Whether to deploy the bundled contracts. Defaults to True.
+        """
+        backend = PyEVMBackend(genesis_state=PyEVMBackend.generate_genesis_state(num_accounts=accounts))
+        self.provider = TesterNodeProvider(EthereumTester(backend))
+        self.private_keys = [key.to_hex() for key in get_default_account_keys(quantity=accounts)]
+        self.sdk = self.new_sdk()
+        self.addresses = {}
+        self.logger = logging.getLogger(__name__)
+        if deploy:
+            self.deploy()
+
+    def new_sdk(self, account=0, **options):
+        """
+        Creates an SDK connected to the chain.
+
+        Args:
+            account (int, optional): Index of the prefunded account to sign with. Defaults to 0.
+            **options: Further keyword arguments for DigitalProductPassportSDK.
+
+        Returns:
+            DigitalProductPassportSDK: The SDK instance.
+        """
+        return DigitalProductPassportSDK(provider_url=self.provider, private_key=self.private_keys[account], **options)
+
+    def deploy(self):
+        """
+        Deploys ProductPassport, Batch, Geolocation and ComplexManagement, and authorizes the first
+        account on the ProductPassport contract.
+
+        Returns:
+            dict: Address of each deployed contract, keyed by contract name.
+        """
+        manifest = self.sdk.deployment.deploy()
+        self.addresses = {name: deployment["address"] for name, deployment in manifest["tenants"][0].items()}
+        self.addresses["ComplexManagement"] = self.sdk.complex_management.deploy()
+        self.sdk.product_passport.authorize_entity(self.addresses["ProductPassport"], self.sdk.account.address)
+        self.logger.info(f"Local chain contracts deployed: {self.addresses}")
+        return self.addresses
+
+    def snapshot(self):
+        """
+        Takes a snapshot of the chain state.
+
+        Returns:
+            int: The snapshot id.
+        """
+        return self.sdk.web3.testing.snapshot()
+
+    def revert(self, snapshot_id):
+        """
+        Reverts the chain to a snapshot. The snapshot stays valid and can be reverted to again.
+        """
+        self.sdk.web3.testing.revert(snapshot_id)
+
+    @contextmanager
+    def isolated(self, account=0, **options):
+        """
+        Yields a new SDK connected to the chain and reverts every change made to the chain afterwards.
+
+        A new SDK is created each time, so state kept by the SDK itself (the spend ledger, read
+        counters) does not leak from one test to the next either.
+
+        Args:
+            account (int, optional): Index of the prefunded account to sign with. Defaults to 0.
+            **options: Further keyword arguments for DigitalProductPassportSDK.
+        """
+        snapshot_id = self.snapshot()
+        try:
+            yield self.new_sdk(account, **options)
+        finally:
+            self.revert(snapshot_id)
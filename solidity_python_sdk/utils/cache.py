@@ -0,0 +1,106 @@
+import json
+import logging
+import threading
+
+MISSING = object()
+
+
+class ReadCache:
+    """
+    Persistent on-disk cache of contract view call results at finalized blocks.
+
+    State at a finalized block can never change, so entries are kept permanently without any TTL or
+    invalidation. Results are stored as JSON in a SQLite database, which makes the cache safe to share
+    between threads and between runs of the same tool.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found in the cache.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, path):
+        """
+        Opens (or creates) the cache database.
+
+        Args:
+            path (str): Path of the SQLite database file.
+        """
+        import sqlite3
+
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS calls (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._connection.commit()
+        self.logger = logging.getLogger(__name__)
+
+    def get_many(self, keys):
+        """
+        Looks up several keys at once.
+
+        Returns:
+            list: The cached value for each key, or MISSING.
+        """
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM calls WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                )
+                found.update(rows)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return [_decode(found[key]) if key in found else MISSING for key in keys]
+
+    def set_many(self, items):
+        """
+        Stores several key and value pairs.
+        """
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO calls (key, value) VALUES (?, ?)",
+                ((key, _encode(value)) for key, value in items)
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def call_key(chain_id, function, block_number):
+    """
+    Returns the cache key of a contract call: chain, contract address, function signature, arguments and block.
+    """
+    arguments = json.dumps(_to_json(list(function.args)), separators=(",", ":"))
+    return f"{chain_id}:{function.address}:{function.abi_element_identifier}:{arguments}:{block_number}"
+
+
+def _to_json(value):
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytes": value.hex()}
+    return value
+
+
+def _from_json(value):
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+    if isinstance(value, dict) and "bytes" in value:
+        return bytes.fromhex(value["bytes"])
+    return value
+
+
+def _encode(value):
+    return json.dumps(_to_json(value), separators=(",", ":"))
+
+
+def _decode(value):
+    return _from_json(json.loads(value))
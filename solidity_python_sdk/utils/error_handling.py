@@ -1,8 +1,16 @@
-import json
-import logging
-import os
-from web3 import Web3
-from eth_account import Account
-
 class InsufficientFundsError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class IpfsFetchError(Exception):
+    pass
+
+
+class ContentMismatchError(IpfsFetchError):
+    pass
+
+
+class DeploymentError(Exception):
+    def __init__(self, message, manifest):
+        super().__init__(message)
+        self.manifest = manifest
@@ -0,0 +1,205 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from solidity_python_sdk.utils.error_handling import ContentMismatchError, IpfsFetchError
+from solidity_python_sdk.utils.ipfs import DAG_PB, HASHES, IDENTITY, decode_cid, decode_dag_pb, parse_cid
+from solidity_python_sdk.utils.scanner import scan
+
+
+class IntegrityVerifier:
+    """
+    Verifies that the IPFS documents referenced on-chain are still retrievable and match their CIDs.
+
+    A CID is the hash of the root block of a document's DAG, not of the file bytes, so each document is
+    fetched block by block as raw blocks from trustless gateways (``?format=raw``). Every block is
+    hashed while it streams in and compared with the digest in its CID, and the links of dag-pb blocks
+    are followed down to the leaves. Only one block, at most 2 MiB, is held in memory at a time per
+    document. With ``head_only``, documents are only checked for availability with HEAD requests.
+
+    Documents are verified concurrently on a bounded thread pool while their CIDs are still being read
+    from the chain, and a CID referenced several times is verified once.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        fetcher (IpfsFetcher): The fetcher whose gateways, HTTP session and timeout are used.
+        max_workers (int): Maximum number of documents verified at a time.
+        deep (bool): Whether to verify every block of a document rather than only its root block.
+        head_only (bool): Whether to only check availability, without downloading or hashing.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, fetcher=None, max_workers=16, deep=True, head_only=False):
+        """
+        Initializes the IntegrityVerifier with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            fetcher (IpfsFetcher, optional): The fetcher to use. Defaults to the SDK's fetcher.
+            max_workers (int, optional): Maximum number of documents verified at a time. Defaults to 16.
+            deep (bool, optional): Whether to verify every block rather than only the root block. Defaults to True.
+            head_only (bool, optional): Whether to only check availability with HEAD requests. Defaults to False.
+        """
+        self.sdk = sdk
+        self.fetcher = fetcher or sdk.ipfs
+        self.max_workers = max_workers
+        self.deep = deep
+        self.head_only = head_only
+        self.logger = logging.getLogger(__name__)
+
+    def verify(self, uri):
+        """
+        Verifies a single document.
+
+        Args:
+            uri (str): A CID, optionally followed by a path, or an "ipfs://" or gateway URI. Only the
+                DAG under the CID is verified; the path is ignored.
+
+        Returns:
+            dict: The "cid", its "status" ("ok", "missing", "mismatched" or "invalid"), the number of
+            "blocks" and "bytes" verified, and the "error", or None.
+        """
+        cid = parse_cid(uri).split("/", 1)[0]
+        result = {"cid": cid, "status": "ok", "blocks": 0, "bytes": 0, "error": None}
+        try:
+            decoded = decode_cid(cid)
+        except ValueError as e:
+            return dict(result, status="invalid", error=str(e))
+        if decoded.hash_function != IDENTITY and decoded.hash_function not in HASHES:
+            return dict(result, status="invalid", error=f"Unsupported hash function 0x{decoded.hash_function:x}")
+        if decoded.hash_function == IDENTITY:
+            # The content is inlined in the CID itself.
+            return dict(result, blocks=1, bytes=len(decoded.digest))
+        if self.head_only:
+            return dict(result, **self._head(cid))
+
+        blocks = deque([(cid, decoded)])
+        while blocks:
+            block_cid, block = blocks.popleft()
+            status, error, links, size = self._verify_block(block_cid, block)
+            if status != "ok":
+                return dict(result, status=status, error=f"Block {block_cid}: {error}" if block_cid != cid else error)
+            result["blocks"] += 1
+            result["bytes"] += size
+            if self.deep:
+                for link in links:
+                    try:
+                        blocks.append((link, decode_cid(link)))
+                    except ValueError as e:
+                        return dict(result, status="invalid", error=f"Block {block_cid} has an invalid link: {e}")
+        return result
+
+    def verify_references(self, references):
+        """
+        Verifies the documents of a stream of references concurrently, reading the stream lazily.
+
+        Args:
+            references (iterable): Pairs of a reference (a dict describing where the URI was found) and
+                the document URI.
+
+        Returns:
+            dict: The number of references "checked" and found "ok", and the "missing", "mismatched"
+            and "invalid" references, each a dict with the reference fields plus "uri", "cid" and "error".
+        """
+        report = {"checked": 0, "ok": 0, "missing": [], "mismatched": [], "invalid": []}
+        futures = {}
+        pending = deque()
+
+        def settle():
+            reference, uri, future = pending.popleft()
+            result = future.result()
+            report["checked"] += 1
+            if result["status"] == "ok":
+                report["ok"] += 1
+            else:
+                report[result["status"]].append(dict(reference, uri=uri, cid=result["cid"], error=result["error"]))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="integrity") as executor:
+            for reference, uri in references:
+                cid = parse_cid(uri).split("/", 1)[0]
+                if cid not in futures:
+                    futures[cid] = executor.submit(self.verify, cid)
+                pending.append((reference, uri, futures[cid]))
+                # Bound the read-ahead, so a large scan does not queue every CID at once.
+                while len(pending) > self.max_workers * 4:
+                    settle()
+            while pending:
+                settle()
+
+        self.logger.info(
+            f"Verified {report['checked']} document references ({len(futures)} distinct): {report['ok']} ok, "
+            f"{len(report['missing'])} missing, {len(report['mismatched'])} mismatched, {len(report['invalid'])} invalid"
+        )
+        return report
+
+    def verify_products(self, contract_address, id_range, chunk_size=100, workers=4):
+        """
+        Verifies the manuals and specifications of every product in an ID range of a ProductPassport contract.
+
+        Args:
+            contract_address (str): The address of the deployed ProductPassport contract.
+            id_range (iterable): The product IDs to scan, e.g. ``range(1, 100000)``.
+            chunk_size (int, optional): Number of IDs read per batched request. Defaults to 100.
+            workers (int, optional): Number of concurrent chain reads. Defaults to 4.
+
+        Returns:
+            dict: The report of verify_references; references carry the "productId" and "field", e.g. "manuals[0]".
+        """
+        def references():
+            for product_id, _, product_data in self.sdk.product_passport.iter_products(
+                contract_address, id_range, chunk_size, workers
+            ):
+                for field in ("manuals", "specifications"):
+                    for index, uri in enumerate(getattr(product_data, field)):
+                        yield {"productId": product_id, "field": f"{field}[{index}]"}, uri
+
+        return self.verify_references(references())
+
+    def verify_batches(self, contract_address, id_range, chunk_size=100, workers=4):
+        """
+        Verifies the IPFS metadata of every minted batch in an ID range of a Batch contract.
+
+        Args:
+            contract_address (str): The address of the deployed Batch contract.
+            id_range (iterable): The batch IDs to scan, e.g. ``range(1, 100000)``.
+            chunk_size (int, optional): Number of IDs read per batched request. Defaults to 100.
+            workers (int, optional): Number of concurrent chain reads. Defaults to 4.
+
+        Returns:
+            dict: The report of verify_references; references carry the "batchId" and "field" ("tokenURI").
+        """
+        block_number = self.sdk.web3.eth.block_number
+
+        def fetch_chunk(batch_ids):
+            token_uris = self.sdk.batch.get_token_uris(contract_address, batch_ids, block_number)
+            return [({"batchId": batch_id, "field": "tokenURI"}, uri) for batch_id, uri in zip(batch_ids, token_uris) if uri]
+
+        return self.verify_references(scan(fetch_chunk, (int(batch_id) for batch_id in id_range), chunk_size, workers))
+
+    def _head(self, cid):
+        from requests import RequestException
+
+        errors = []
+        for gateway in self.fetcher.ordered_gateways():
+            try:
+                response = self.fetcher.session.head(gateway + cid, timeout=self.fetcher.timeout, allow_redirects=True)
+                response.raise_for_status()
+                return {"status": "ok", "error": None}
+            except RequestException as e:
+                errors.append(f"{gateway}: {e}")
+        return {"status": "missing", "error": "; ".join(errors)}
+
+    def _verify_block(self, cid, decoded):
+        keep = decoded.codec == DAG_PB and self.deep
+        try:
+            block, size = self.fetcher.fetch_block(cid, decoded, keep=keep)
+        except ContentMismatchError as e:
+            return "mismatched", str(e), [], 0
+        except IpfsFetchError as e:
+            return "missing", str(e), [], 0
+        if not keep:
+            return "ok", None, [], size
+        try:
+            links = [link for link, _ in decode_dag_pb(block)[1]]
+        except ValueError as e:
+            return "invalid", f"Malformed dag-pb block: {e}", [], size
+        return "ok", None, links, size
@@ -0,0 +1,452 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from solidity_python_sdk.utils.error_handling import ContentMismatchError, IpfsFetchError
+
+DEFAULT_GATEWAYS = (
+    "https://ipfs.io/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+    "https://dweb.link/ipfs/",
+)
+
+# Multicodec codes of the IPLD codecs and hash functions found in CIDs.
+RAW = 0x55
+DAG_PB = 0x70
+IDENTITY = 0x00
+SHA2_256 = 0x12
+SHA2_512 = 0x13
+HASHES = {SHA2_256: hashlib.sha256, SHA2_512: hashlib.sha512}
+
+# UnixFS node types of dag-pb blocks.
+UNIXFS_RAW = 0
+UNIXFS_DIRECTORY = 1
+UNIXFS_FILE = 2
+
+RAW_BLOCK = "application/vnd.ipld.raw"
+# Blocks above 2 MiB are refused by IPFS nodes, so a larger response cannot be a valid block.
+MAX_BLOCK_SIZE = 2 * 1024 * 1024
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+Cid = namedtuple("Cid", ["version", "codec", "hash_function", "digest"])
+Cid.__doc__ = "A decoded CID: its version, IPLD codec, multihash function code and digest."
+
+
+class ContentCache:
+    """
+    Cache of IPFS content keyed by CID.
+
+    Content addressed by a CID can never change, so entries are never invalidated. The most recently
+    used entries are kept in memory, and every entry is also written to ``directory`` when one is given,
+    so it survives restarts.
+
+    Attributes:
+        directory (str): Directory of the on-disk cache, or None.
+        max_items (int): Maximum number of entries kept in memory.
+    """
+
+    def __init__(self, directory=None, max_items=1024):
+        self.directory = directory
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, cid):
+        """
+        Returns the cached content of a CID, or None.
+        """
+        with self._lock:
+            if cid in self._memory:
+                self._memory.move_to_end(cid)
+                return self._memory[cid]
+        if self.directory:
+            path = self._path(cid)
+            if os.path.exists(path):
+                with open(path, "rb") as file:
+                    content = file.read()
+                self._remember(cid, content)
+                return content
+        return None
+
+    def set(self, cid, content):
+        """
+        Stores the content of a CID.
+        """
+        self._remember(cid, content)
+        if self.directory:
+            path = self._path(cid)
+            temporary_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temporary_path, "wb") as file:
+                file.write(content)
+            os.replace(temporary_path, path)
+
+    def _remember(self, cid, content):
+        with self._lock:
+            self._memory[cid] = content
+            self._memory.move_to_end(cid)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def _path(self, cid):
+        return os.path.join(self.directory, hashlib.sha256(cid.encode()).hexdigest())
+
+
+class IpfsFetcher:
+    """
+    Fetches IPFS content over HTTP gateways, concurrently and through a content cache.
+
+    Content is requested block by block as raw blocks from trustless gateways (``?format=raw``), and
+    every block is checked against the hash in its CID before it is used. Files are reassembled from
+    their UnixFS blocks, and paths below a CID are resolved through its directory blocks. A gateway
+    that is down, or serves content not matching the CID, is skipped for the next one; the gateway
+    that answered last is tried first on the next fetch. Only verified content reaches the cache.
+    Fetching many CIDs at once runs the requests on a thread pool and requests each distinct CID only once.
+
+    Attributes:
+        gateways (list): Gateway URL prefixes, e.g. "https://ipfs.io/ipfs/".
+        cache (ContentCache): Cache of fetched content.
+        timeout (float): Seconds to wait for each gateway request.
+        max_workers (int): Maximum number of concurrent requests.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, gateways=None, cache=None, timeout=10, max_workers=16):
+        """
+        Initializes the IpfsFetcher.
+
+        Args:
+            gateways (list, optional): Gateway URL prefixes. Defaults to DEFAULT_GATEWAYS.
+            cache (ContentCache, optional): Cache of fetched content. Defaults to an in-memory cache.
+            timeout (float, optional): Seconds to wait for each gateway request. Defaults to 10.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+        """
+        import requests
+
+        self.gateways = [gateway if gateway.endswith("/") else gateway + "/" for gateway in gateways or DEFAULT_GATEWAYS]
+        self.cache = cache if cache is not None else ContentCache()
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        self._preferred = 0
+        self.logger = logging.getLogger(__name__)
+
+    def fetch(self, cid):
+        """
+        Fetches the content of a CID or IPFS URI.
+
+        Args:
+            cid (str): A CID, optionally followed by a path, or an "ipfs://" or gateway URI.
+
+        Returns:
+            bytes: The content.
+
+        Raises:
+            ContentMismatchError: If gateways only returned content not matching the CID.
+            IpfsFetchError: If the CID is invalid, does not address a file, or no gateway returns it.
+        """
+        uri = parse_cid(cid)
+        content = self.cache.get(uri)
+        if content is not None:
+            return content
+
+        cid, _, path = uri.partition("/")
+        try:
+            decoded = decode_cid(cid)
+        except ValueError as e:
+            raise IpfsFetchError(str(e)) from None
+        for name in filter(None, path.split("/")):
+            cid, decoded = self._resolve(cid, decoded, name)
+        content = b"".join(self._file_chunks(cid, decoded))
+        self.cache.set(uri, content)
+        return content
+
+    def fetch_block(self, cid, decoded=None, keep=True):
+        """
+        Fetches a single raw block and checks it against its CID.
+
+        The block is hashed while it streams in, so with ``keep=False`` it is never held in memory.
+
+        Args:
+            cid (str): The CID of the block.
+            decoded (Cid, optional): The decoded CID, if already at hand.
+            keep (bool, optional): Whether to return the block content. Defaults to True.
+
+        Returns:
+            tuple: The block (empty when not kept) and its size in bytes.
+
+        Raises:
+            ContentMismatchError: If gateways only returned content not matching the CID.
+            IpfsFetchError: If the hash function is unsupported or no gateway returns the block.
+        """
+        decoded = decoded or decode_cid(cid)
+        if decoded.hash_function == IDENTITY:
+            # The content is inlined in the CID itself.
+            return (decoded.digest if keep else b""), len(decoded.digest)
+        if decoded.hash_function not in HASHES:
+            raise IpfsFetchError(f"Unsupported hash function 0x{decoded.hash_function:x} in {cid}")
+
+        from requests import RequestException
+
+        errors = []
+        mismatched = False
+        for gateway in self.ordered_gateways():
+            hasher = HASHES[decoded.hash_function]()
+            chunks = []
+            size = 0
+            try:
+                with self.session.get(gateway + cid, params={"format": "raw"}, headers={"Accept": RAW_BLOCK},
+                                      stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(64 * 1024):
+                        size += len(chunk)
+                        if size > MAX_BLOCK_SIZE:
+                            break
+                        hasher.update(chunk)
+                        if keep:
+                            chunks.append(chunk)
+            except RequestException as e:
+                self.logger.debug(f"Gateway {gateway} failed for {cid}: {e}")
+                errors.append(f"{gateway}: {e}")
+                continue
+            if size > MAX_BLOCK_SIZE or hasher.digest()[:len(decoded.digest)] != decoded.digest:
+                self.logger.warning(f"Gateway {gateway} returned content not matching {cid}")
+                mismatched = True
+                errors.append(f"{gateway}: content does not match the CID")
+                continue
+            self._preferred = self.gateways.index(gateway)
+            return b"".join(chunks), size
+        error = ContentMismatchError if mismatched else IpfsFetchError
+        raise error(f"Failed to fetch {cid} from {len(self.gateways)} gateway(s): {'; '.join(errors)}")
+
+    def _resolve(self, cid, decoded, name):
+        node_type, _, links = self._dag_pb_node(cid, decoded)
+        if node_type != UNIXFS_DIRECTORY:
+            raise IpfsFetchError(f"{cid} is not a directory")
+        for link, link_name in links:
+            if link_name == name:
+                return link, decode_cid(link)
+        raise IpfsFetchError(f"{name} not found in directory {cid}")
+
+    def _file_chunks(self, cid, decoded):
+        if decoded.codec == RAW:
+            yield self.fetch_block(cid, decoded)[0]
+            return
+        node_type, data, links = self._dag_pb_node(cid, decoded)
+        if node_type not in (UNIXFS_RAW, UNIXFS_FILE):
+            raise IpfsFetchError(f"{cid} is not a file")
+        yield data
+        for link, _ in links:
+            yield from self._file_chunks(link, decode_cid(link))
+
+    def _dag_pb_node(self, cid, decoded):
+        if decoded.codec != DAG_PB:
+            raise IpfsFetchError(f"Unsupported codec 0x{decoded.codec:x} in {cid}")
+        try:
+            data, links = decode_dag_pb(self.fetch_block(cid, decoded)[0])
+            node_type, content = decode_unixfs(data)
+        except ValueError as e:
+            raise IpfsFetchError(f"Malformed block {cid}: {e}") from None
+        return node_type, content, links
+
+    def ordered_gateways(self):
+        """
+        Returns the gateways in the order to try them, starting with the one that answered last.
+        """
+        return self.gateways[self._preferred:] + self.gateways[:self._preferred]
+
+    def fetch_json(self, cid):
+        """
+        Fetches and decodes a JSON document from IPFS.
+        """
+        return json.loads(self.fetch(cid))
+
+    def fetch_many(self, cids, as_json=False):
+        """
+        Fetches several CIDs concurrently.
+
+        Args:
+            cids (iterable): CIDs or IPFS URIs.
+            as_json (bool, optional): Whether to decode each document as JSON. Defaults to False.
+
+        Returns:
+            dict: The content, or the exception raised while fetching it, keyed by each distinct CID as given.
+        """
+        cids = list(dict.fromkeys(cids))
+        fetch = self.fetch_json if as_json else self.fetch
+
+        def attempt(cid):
+            try:
+                return fetch(cid)
+            except Exception as e:
+                return e
+
+        if len(cids) <= 1:
+            return {cid: attempt(cid) for cid in cids}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(cids))) as executor:
+            return dict(zip(cids, executor.map(attempt, cids)))
+
+
+def parse_cid(uri):
+    """
+    Extracts the CID and path from a CID, "ipfs://" URI or gateway URL.
+    """
+    uri = uri.strip()
+    if uri.startswith("ipfs://"):
+        uri = uri[len("ipfs://"):]
+    elif "/ipfs/" in uri:
+        uri = uri.split("/ipfs/", 1)[1]
+    return uri.lstrip("/")
+
+
+def decode_cid(cid):
+    """
+    Decodes a CID string: a base58btc CIDv0 ("Qm..."), or a CIDv1 in base32 ("b..."), base58btc ("z...")
+    or base16 ("f...").
+
+    Returns:
+        Cid: The decoded CID.
+
+    Raises:
+        ValueError: If the string is not a valid CID.
+    """
+    if len(cid) == 46 and cid.startswith("Qm"):
+        version, codec, multihash = 0, DAG_PB, _b58decode(cid)
+    else:
+        prefix, body = cid[:1], cid[1:]
+        try:
+            if prefix in ("b", "B"):
+                data = base64.b32decode(body.upper() + "=" * (-len(body) % 8))
+            elif prefix == "z":
+                data = _b58decode(body)
+            elif prefix in ("f", "F"):
+                data = bytes.fromhex(body)
+            else:
+                raise ValueError(f"Unsupported multibase prefix '{prefix}'")
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid CID {cid!r}: {e}") from None
+        version, offset = read_varint(data, 0)
+        if version != 1:
+            raise ValueError(f"Invalid CID {cid!r}: unsupported version {version}")
+        codec, offset = read_varint(data, offset)
+        multihash = data[offset:]
+    hash_function, offset = read_varint(multihash, 0)
+    length, offset = read_varint(multihash, offset)
+    digest = multihash[offset:]
+    if len(digest) != length:
+        raise ValueError(f"Invalid CID {cid!r}: digest length does not match")
+    return Cid(version, codec, hash_function, digest)
+
+
+def cid_to_string(data):
+    """
+    Returns the string form of a binary CID, as found in the links of a dag-pb block: base58btc for
+    CIDv0 and base32 for CIDv1.
+    """
+    if data[:2] == bytes([SHA2_256, 32]) and len(data) == 34:
+        return _b58encode(data)
+    return "b" + base64.b32encode(data).decode().lower().rstrip("=")
+
+
+def read_varint(data, offset):
+    """
+    Reads an unsigned varint (as used by multiformats and protobuf) and returns it with the next offset.
+    """
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _b58decode(text):
+    value = 0
+    for character in text:
+        index = BASE58_ALPHABET.find(character)
+        if index < 0:
+            raise ValueError(f"Invalid base58 character '{character}'")
+        value = value * 58 + index
+    leading_zeros = len(text) - len(text.lstrip("1"))
+    return b"\0" * leading_zeros + value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def _b58encode(data):
+    value = int.from_bytes(data, "big")
+    characters = []
+    while value:
+        value, remainder = divmod(value, 58)
+        characters.append(BASE58_ALPHABET[remainder])
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return "1" * leading_zeros + "".join(reversed(characters))
+
+
+def decode_dag_pb(block):
+    """
+    Decodes a dag-pb block.
+
+    Returns:
+        tuple: The data of the node, and its links as (CID string, name) pairs in order.
+
+    Raises:
+        ValueError: If the block is malformed.
+    """
+    data = b""
+    links = []
+    for field, value in _protobuf_fields(block):
+        if field == 1:
+            data = value
+        elif field == 2:
+            link_cid, name = None, ""
+            for link_field, link_value in _protobuf_fields(value):
+                if link_field == 1:
+                    link_cid = cid_to_string(link_value)
+                elif link_field == 2:
+                    name = link_value.decode()
+            if link_cid is None:
+                raise ValueError("Link without a hash")
+            links.append((link_cid, name))
+    return data, links
+
+
+def decode_unixfs(data):
+    """
+    Decodes the UnixFS data of a dag-pb node.
+
+    Returns:
+        tuple: The UnixFS node type and the file content held by the node itself.
+    """
+    node_type, content = None, b""
+    for field, value in _protobuf_fields(data):
+        if field == 1:
+            node_type = value
+        elif field == 2:
+            content = value
+    return node_type, content
+
+
+def _protobuf_fields(data):
+    offset = 0
+    while offset < len(data):
+        key, offset = read_varint(data, offset)
+        wire_type = key & 7
+        if wire_type == 0:
+            value, offset = read_varint(data, offset)
+        elif wire_type == 2:
+            length, offset = read_varint(data, offset)
+            if offset + length > len(data):
+                raise ValueError("Truncated protobuf field")
+            value, offset = data[offset:offset + length], offset + length
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        yield key >> 3, value
@@ -0,0 +1,174 @@
+import itertools
+import logging
+import threading
+import time
+from solidity_python_sdk.utils.error_handling import InsufficientFundsError
+
+
+class SpendLedger:
+    """
+    Local ledger of the SDK account's spendable balance.
+
+    The balance is fetched once and then kept up to date locally: each transaction reserves its
+    worst-case cost (gas limit times max fee, plus value) before submission and is reconciled with the
+    gas actually used once its receipt arrives. Work that cannot be afforded is refused, or queued until
+    in-flight transactions settle, without an eth_getBalance call per transaction. A transaction that was
+    broadcast but whose receipt could not be awaited keeps its reservation until a sync finds it mined.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK whose account is tracked.
+        resync_interval (float): Seconds after which the balance is fetched again from the node.
+        queue_timeout (float): Seconds a reservation may wait for in-flight transactions to settle before being refused.
+        balance (int): Last known balance in wei, net of settled transactions.
+        reserved (int): Total worst-case cost in wei of the transactions still in flight.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, resync_interval=300, queue_timeout=0):
+        """
+        Initializes the SpendLedger for the SDK account. The balance is fetched on first use.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            resync_interval (float, optional): Seconds between balance re-syncs. Defaults to 300.
+            queue_timeout (float, optional): Seconds to wait for funds held by in-flight transactions. Defaults to 0.
+        """
+        self.sdk = sdk
+        self.resync_interval = resync_interval
+        self.queue_timeout = queue_timeout
+        self.balance = None
+        self.reserved = 0
+        self.reservations = {}
+        self._held = {}
+        self._synced_at = None
+        self._ids = itertools.count()
+        self._condition = threading.Condition()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def available(self):
+        """
+        int: Balance in wei that is not reserved by in-flight transactions.
+        """
+        with self._condition:
+            self._maybe_sync()
+            return self.balance - self.reserved
+
+    def sync(self):
+        """
+        Fetches the account balance from the node.
+        """
+        with self._condition:
+            self._sync()
+
+    def reserve(self, tx):
+        """
+        Reserves the worst-case cost of a transaction before it is submitted.
+
+        Args:
+            tx (dict): The transaction, with 'gas' and either 'maxFeePerGas' or 'gasPrice'.
+
+        Returns:
+            int: Identifier of the reservation, to be passed to settle or release.
+
+        Raises:
+            InsufficientFundsError: If the balance cannot cover the transaction, even after waiting
+                up to queue_timeout for in-flight transactions to settle.
+        """
+        cost = worst_case_cost(tx)
+        deadline = time.monotonic() + self.queue_timeout
+        with self._condition:
+            synced = self._maybe_sync()
+            while self.balance - self.reserved < cost:
+                remaining = deadline - time.monotonic()
+                if self.reservations and remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                if not synced:
+                    # The account may have been funded since the last sync.
+                    self._sync()
+                    synced = True
+                    continue
+                raise InsufficientFundsError(
+                    f"Insufficient funds: balance {self.balance}, reserved {self.reserved}, required {cost}"
+                )
+            reservation = next(self._ids)
+            self.reservations[reservation] = (cost, tx.get('value', 0))
+            self.reserved += cost
+            return reservation
+
+    def settle(self, reservation, receipt):
+        """
+        Reconciles a reservation with the gas actually used by the mined transaction.
+
+        Args:
+            reservation (int): The identifier returned by reserve.
+            receipt (dict): The transaction receipt.
+        """
+        with self._condition:
+            cost, value = self.reservations.pop(reservation)
+            self.reserved -= cost
+            gas_price = receipt.get('effectiveGasPrice') or 0
+            self.balance -= receipt['gasUsed'] * gas_price + (value if receipt.get('status', 1) else 0)
+            self._condition.notify_all()
+
+    def release(self, reservation):
+        """
+        Drops a reservation whose transaction was never submitted.
+
+        Args:
+            reservation (int): The identifier returned by reserve.
+        """
+        with self._condition:
+            self._drop(reservation)
+
+    def hold(self, reservation, tx_hash):
+        """
+        Keeps the reservation of a transaction that was broadcast but whose receipt could not be awaited.
+
+        The transaction may still be mined, so its worst-case cost stays reserved until a later sync
+        finds its receipt, at which point the synced balance accounts for it.
+
+        Args:
+            reservation (int): The identifier returned by reserve.
+            tx_hash (HexBytes): The hash of the broadcast transaction.
+        """
+        with self._condition:
+            self._held[reservation] = tx_hash
+
+    def _drop(self, reservation):
+        cost, _ = self.reservations.pop(reservation)
+        self.reserved -= cost
+        self._condition.notify_all()
+
+    def _maybe_sync(self):
+        if self.balance is None or time.monotonic() - self._synced_at > self.resync_interval:
+            self._sync()
+            return True
+        return False
+
+    def _sync(self):
+        from web3.exceptions import TransactionNotFound
+
+        # Held transactions are looked up before the balance is read, so one found mined is already
+        # reflected in it and its reservation can be dropped.
+        for reservation, tx_hash in list(self._held.items()):
+            try:
+                self.sdk.web3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+            del self._held[reservation]
+            self._drop(reservation)
+        # Reservations still outstanding stay subtracted from the synced balance. A transaction mined
+        # but not yet settled is then counted twice until the next sync, which errs on the safe side.
+        self.balance = self.sdk.web3.eth.get_balance(self.sdk.account.address)
+        self._synced_at = time.monotonic()
+        self.logger.debug(f"Balance of {self.sdk.account.address} synced: {self.balance}")
+
+
+def worst_case_cost(tx):
+    """
+    Returns the most a transaction can cost in wei: its gas limit times its max fee, plus its value.
+    """
+    gas_price = tx.get('maxFeePerGas') or tx.get('gasPrice') or 0
+    return tx['gas'] * gas_price + tx.get('value', 0)
@@ -1,9 +1,9 @@
 import json
-from pinatapy import PinataPy
 import os
 
 class PinataUtility:
     def __init__(self, api_key, secret_api_key):
+        from pinatapy import PinataPy
         self.pinata = PinataPy(api_key, secret_api_key)
 
     def pin_file(self, file_path):
@@ -0,0 +1,165 @@
+import logging
+
+# Selectors of the errors built into Solidity: Error(string) and Panic(uint256).
+ERROR_STRING_SELECTOR = "08c379a0"
+PANIC_SELECTOR = "4e487b71"
+
+
+class ErrorDecoder:
+    """
+    Decodes revert data into readable errors, using the custom error entries of contract ABIs.
+
+    Attributes:
+        errors (dict): Error name, argument names and argument types, keyed by 4-byte selector in hex.
+    """
+
+    def __init__(self, abis):
+        """
+        Initializes the ErrorDecoder with the error entries of several ABIs.
+
+        Args:
+            abis (iterable): Contract ABIs, as lists of ABI entries.
+        """
+        from eth_utils import keccak
+        from eth_utils.abi import collapse_if_tuple
+
+        self.errors = {}
+        for abi in abis:
+            for entry in abi:
+                if entry.get('type') != 'error':
+                    continue
+                types = [collapse_if_tuple(argument) for argument in entry['inputs']]
+                selector = keccak(text=f"{entry['name']}({','.join(types)})")[:4].hex()
+                self.errors[selector] = (entry['name'], [argument['name'] for argument in entry['inputs']], types)
+
+    def decode(self, data):
+        """
+        Decodes revert data.
+
+        Args:
+            data (bytes | str): The revert data, as bytes or a hex string.
+
+        Returns:
+            str: The error, e.g. "ERC721InvalidSender(sender=0x0000000000000000000000000000000000000000)".
+        """
+        from eth_abi import decode
+
+        if isinstance(data, str):
+            data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+        if not data:
+            return "execution reverted"
+        selector, payload = data[:4].hex(), data[4:]
+        try:
+            if selector == ERROR_STRING_SELECTOR:
+                return decode(["string"], payload)[0]
+            if selector == PANIC_SELECTOR:
+                return f"Panic(0x{decode(['uint256'], payload)[0]:x})"
+            if selector in self.errors:
+                name, names, types = self.errors[selector]
+                values = decode(types, payload)
+                return f"{name}({', '.join(f'{n}={v}' for n, v in zip(names, values))})"
+        except Exception:
+            pass
+        return f"Unknown error 0x{data.hex()}"
+
+
+class Preflight:
+    """
+    Simulates intended writes with eth_call before any gas is spent.
+
+    Each write is executed as an eth_call from the sending account, many of them per batched JSON-RPC
+    request when the provider supports it. web3 fails a whole batch when one of its calls reverts, so
+    a failing batch is split in halves until the reverting calls are isolated. Reverts are decoded with
+    the custom errors of the bundled ABIs, so a bulk submission can drop its failing rows before
+    sending anything. Errors other than reverts, such as connection failures, are raised.
+
+    Every write is simulated against the same state, independently of the others in the batch; a write
+    that only fails because of an earlier write in the same batch is not detected.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance for interacting with the blockchain.
+        batch_size (int): Maximum number of calls sent in a single batched request.
+        decoder (ErrorDecoder): Decoder of the custom errors of the bundled contracts.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, batch_size=100):
+        """
+        Initializes the Preflight class with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            batch_size (int, optional): Maximum number of calls per batched request. Defaults to 100.
+        """
+        self.sdk = sdk
+        self.batch_size = batch_size
+        self.decoder = ErrorDecoder(contract['abi'] for contract in sdk.contracts.values())
+        self.logger = logging.getLogger(__name__)
+
+    def simulate(self, functions, sender=None, block_identifier='pending'):
+        """
+        Simulates contract writes.
+
+        Args:
+            functions (iterable): Contract functions with their arguments, e.g. ``contract.functions.setBatchDetails(...)``.
+            sender (str, optional): The address sending the writes. Defaults to the SDK account.
+            block_identifier (int | str, optional): The block to simulate on. Defaults to 'pending'.
+
+        Returns:
+            list: One dict per write with its "index", whether it is "ok", and the decoded "error" or None.
+        """
+        sender = sender or self.sdk.account.address
+        txs = [
+            {
+                'from': sender,
+                'to': function.address,
+                'data': self.sdk.web3.eth.contract(abi=function.contract_abi).encode_abi(
+                    function.abi_element_identifier, args=function.args
+                )
+            }
+            for function in functions
+        ]
+        errors = []
+        for start in range(0, len(txs), self.batch_size):
+            errors.extend(self._simulate_chunk(txs[start:start + self.batch_size], block_identifier))
+
+        report = [{"index": index, "ok": error is None, "error": error} for index, error in enumerate(errors)]
+        failed = sum(not entry["ok"] for entry in report)
+        self.logger.info(f"Preflight of {len(report)} writes: {len(report) - failed} pass, {failed} fail")
+        return report
+
+    def _simulate_chunk(self, txs, block_identifier):
+        from web3.exceptions import ContractLogicError, Web3TypeError
+
+        # Whether the provider batches is shared with the reader, which probes it the same way.
+        reader = self.sdk.reader
+        if reader.batching_supported is not False and len(txs) > 1:
+            try:
+                with self.sdk.web3.batch_requests() as batch:
+                    for tx in txs:
+                        batch.add(self.sdk.web3.eth.call(tx, block_identifier))
+                    batch.execute()
+                reader.batching_supported = True
+                return [None] * len(txs)
+            except ContractLogicError:
+                reader.batching_supported = True
+                middle = len(txs) // 2
+                return (self._simulate_chunk(txs[:middle], block_identifier)
+                        + self._simulate_chunk(txs[middle:], block_identifier))
+            except (Web3TypeError, NotImplementedError):
+                self.logger.debug("Provider does not support batched requests, falling back to sequential calls")
+                reader.batching_supported = False
+
+        errors = []
+        for tx in txs:
+            try:
+                self.sdk.web3.eth.call(tx, block_identifier)
+                errors.append(None)
+            except ContractLogicError as e:
+                errors.append(self._revert_error(e))
+        return errors
+
+    def _revert_error(self, error):
+        if isinstance(error.data, str) and error.data.startswith('0x'):
+            return self.decoder.decode(error.data)
+        return error.message or str(error)
@@ -0,0 +1,238 @@
+import logging
+import threading
+from concurrent.futures import Future
+from solidity_python_sdk.utils.cache import MISSING, call_key
+
+
+class ContractReader:
+    """
+    Executes contract view calls, grouping them into batched JSON-RPC requests when the provider supports it.
+
+    When a ReadCache is configured, calls at a numbered block that is already finalized are answered
+    from the cache, and results fetched for such blocks are stored in it permanently.
+
+    Identical calls (same contract, function, arguments and block) that are in flight at the same time,
+    from different threads or asyncio tasks, are coalesced: one RPC is made and every caller receives
+    its decoded result. A call that fails only fails the callers waiting for that call, even when it
+    was sent in the same batched request as others.
+
+    Attributes:
+        sdk (DigitalProductPassportSDK): The SDK instance whose Web3 connection is used for the calls.
+        batch_size (int): Maximum number of calls sent in a single batched request.
+        cache (ReadCache): Cache of results at finalized blocks, or None.
+        confirmations (int): Blocks behind the head treated as final when the node has no 'finalized' tag.
+        batching_supported (bool): Whether the provider accepts batched requests, or None until first tried.
+        requested (int): Number of calls made through the reader, including those answered from the cache.
+        coalesced (int): Number of those calls answered by an identical call already in flight.
+        logger (Logger): Logger instance for logging information and debug messages.
+    """
+
+    def __init__(self, sdk, batch_size=100, cache=None, confirmations=64):
+        """
+        Initializes the ContractReader with the provided SDK instance.
+
+        Args:
+            sdk (DigitalProductPassportSDK): The SDK instance for blockchain interactions.
+            batch_size (int, optional): Maximum number of calls per batched request. Defaults to 100.
+            cache (ReadCache, optional): Cache of results at finalized blocks. Defaults to None.
+            confirmations (int, optional): Fallback finality depth in blocks. Defaults to 64.
+        """
+        self.sdk = sdk
+        self.batch_size = batch_size
+        self.cache = cache
+        self.confirmations = confirmations
+        self.batching_supported = None
+        self._chain_id = None
+        self._finalized_block = -1
+        self.requested = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def dedup_ratio(self):
+        """
+        float: The share of calls answered by an identical call already in flight.
+        """
+        return self.coalesced / self.requested if self.requested else 0.0
+
+    def call(self, function, block_identifier='latest'):
+        """
+        Executes a single contract view call.
+
+        Args:
+            function (ContractFunction): The contract function, already bound to its arguments.
+            block_identifier (int | str, optional): The block to read the state at. Defaults to 'latest'.
+
+        Returns:
+            The decoded return value of the call.
+        """
+        return self.call_many([function], block_identifier)[0]
+
+    async def acall(self, function, block_identifier='latest'):
+        """
+        Executes a single contract view call from asyncio code.
+
+        The call is registered as in flight before it is handed to the event loop's default executor, so
+        identical calls made meanwhile, from tasks or threads, await its result without taking an
+        executor thread.
+
+        Args:
+            function (ContractFunction): The contract function, already bound to its arguments.
+            block_identifier (int | str, optional): The block to read the state at. Defaults to 'latest'.
+
+        Returns:
+            The decoded return value of the call.
+        """
+        import asyncio
+
+        futures, leaders = self._register([function], block_identifier)
+        if leaders:
+            await asyncio.get_running_loop().run_in_executor(None, self._lead, leaders, block_identifier)
+        return await asyncio.wrap_future(futures[0])
+
+    def call_many(self, functions, block_identifier='latest', return_exceptions=False):
+        """
+        Executes several contract view calls, batching them into as few requests as possible.
+
+        Args:
+            functions (iterable): Contract functions, already bound to their arguments.
+            block_identifier (int | str, optional): The block to read the state at. Defaults to 'latest'.
+            return_exceptions (bool, optional): Whether to return the error of a failed call in place of
+                its value instead of raising it. Defaults to False.
+
+        Returns:
+            list: The decoded return values, in the same order as ``functions``.
+        """
+        futures, leaders = self._register(list(functions), block_identifier)
+        self._lead(leaders, block_identifier)
+        # Calls led by other threads are awaited only after this thread's own calls have been made.
+        if not return_exceptions:
+            return [future.result() for future in futures]
+        return [future.exception() or future.result() for future in futures]
+
+    @property
+    def chain_id(self):
+        """
+        int: The chain ID of the connected node, fetched once.
+        """
+        if self._chain_id is None:
+            self._chain_id = self.sdk.web3.eth.chain_id
+        return self._chain_id
+
+    def finalized_block(self):
+        """
+        Returns the number of the latest finalized block, falling back to a fixed confirmation depth.
+        """
+        try:
+            return self.sdk.web3.eth.get_block('finalized')['number']
+        except Exception:
+            return self.sdk.web3.eth.block_number - self.confirmations
+
+    def _cacheable_block(self, block_identifier):
+        if self.cache is None:
+            return None
+        if isinstance(block_identifier, str) and block_identifier.startswith('0x') and len(block_identifier) < 66:
+            block_identifier = int(block_identifier, 16)
+        if not isinstance(block_identifier, int) or isinstance(block_identifier, bool):
+            return None
+        if block_identifier > self._finalized_block:
+            self._finalized_block = self.finalized_block()
+        return block_identifier if block_identifier <= self._finalized_block else None
+
+    def _register(self, functions, block_identifier):
+        # Returns a future per call, and the calls this caller leads because no identical call is in flight.
+        futures = []
+        leaders = []
+        with self._lock:
+            self.requested += len(functions)
+            for function in functions:
+                key = _flight_key(function, block_identifier)
+                future = self._in_flight.get(key)
+                if future is None:
+                    future = self._in_flight[key] = Future()
+                    leaders.append((key, function, future))
+                else:
+                    self.coalesced += 1
+                futures.append(future)
+        return futures, leaders
+
+    def _lead(self, leaders, block_identifier):
+        # Answers the led calls from the cache where possible and makes the others in batched chunks.
+        try:
+            block_number = self._cacheable_block(block_identifier) if leaders else None
+            cache_keys = {}
+            if block_number is not None:
+                cache_keys = {key: call_key(self.chain_id, function, block_number) for key, function, _ in leaders}
+                cached = self.cache.get_many([cache_keys[key] for key, _, _ in leaders])
+                hits = [(leader, result) for leader, result in zip(leaders, cached) if result is not MISSING]
+                self._land([leader for leader, _ in hits], [(result, None) for _, result in hits])
+                leaders = [leader for leader, result in zip(leaders, cached) if result is MISSING]
+                block_identifier = block_number
+
+            for start in range(0, len(leaders), self.batch_size):
+                chunk = leaders[start:start + self.batch_size]
+                try:
+                    outcomes = self._call_chunk([function for _, function, _ in chunk], block_identifier)
+                except Exception as e:
+                    outcomes = [(None, e)] * len(chunk)
+                if cache_keys:
+                    self.cache.set_many(
+                        (cache_keys[key], result) for (key, _, _), (result, error) in zip(chunk, outcomes) if error is None
+                    )
+                self._land(chunk, outcomes)
+        except BaseException as e:
+            # Never leave waiters behind; calls already landed keep their outcome.
+            self._land(leaders, [(None, e)] * len(leaders))
+            raise
+
+    def _land(self, leaders, outcomes):
+        with self._lock:
+            for key, _, future in leaders:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+        for (_, _, future), (result, error) in zip(leaders, outcomes):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _call_chunk(self, functions, block_identifier):
+        # Returns a (result, error) pair per call; errors that are not about a single call are raised.
+        from web3.exceptions import BadFunctionCallOutput, ContractLogicError, Web3RPCError, Web3TypeError
+
+        # Errors about a single call, as opposed to the connection.
+        call_errors = (BadFunctionCallOutput, ContractLogicError, Web3RPCError)
+        if self.batching_supported is not False and len(functions) > 1:
+            try:
+                with self.sdk.web3.batch_requests() as batch:
+                    for function in functions:
+                        batch.add(function.call(block_identifier=block_identifier))
+                    results = batch.execute()
+                self.batching_supported = True
+                return [(result, None) for result in results]
+            except (Web3TypeError, NotImplementedError):
+                self.logger.debug("Provider does not support batched requests, falling back to sequential calls")
+                self.batching_supported = False
+            except call_errors as e:
+                # One failing call fails the whole batch; split it in halves to find the failing calls.
+                self.logger.debug(f"Batched request of {len(functions)} calls failed ({e}), splitting it")
+                self.batching_supported = True
+                middle = len(functions) // 2
+                return (self._call_chunk(functions[:middle], block_identifier)
+                        + self._call_chunk(functions[middle:], block_identifier))
+
+        outcomes = []
+        for function in functions:
+            try:
+                outcomes.append((function.call(block_identifier=block_identifier), None))
+            except call_errors as e:
+                outcomes.append((None, e))
+        return outcomes
+
+
+def _flight_key(function, block_identifier):
+    return (function.address, function.abi_element_identifier, repr(function.args), block_identifier)
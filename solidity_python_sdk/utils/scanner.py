@@ -0,0 +1,51 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from solidity_python_sdk.utils import utils
+
+
+def scan(fetch_chunk, ids, chunk_size=100, workers=4, ordered=True):
+    """
+    Fans chunked reads out over a thread pool and yields their results lazily.
+
+    ``ids`` is split into chunks of ``chunk_size`` and ``fetch_chunk`` is called with each chunk on a
+    worker thread; it returns the (already filtered) results for that chunk. At most two chunks per
+    worker are in flight at a time, so memory stays constant however large the ID range is.
+
+    Args:
+        fetch_chunk (callable): Called with a list of IDs, returns an iterable of results.
+        ids (iterable): The IDs to scan.
+        chunk_size (int, optional): Number of IDs per chunk. Defaults to 100.
+        workers (int, optional): Number of worker threads. Defaults to 4.
+        ordered (bool, optional): Whether to yield results in ID order rather than as chunks complete. Defaults to True.
+
+    Yields:
+        The results returned by ``fetch_chunk``.
+    """
+    chunks = utils.chunked(ids, chunk_size)
+    max_in_flight = workers * 2
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scanner")
+    in_flight = deque()
+
+    def submit():
+        chunk = next(chunks, None)
+        if chunk is not None:
+            in_flight.append(executor.submit(fetch_chunk, chunk))
+
+    try:
+        for _ in range(max_in_flight):
+            submit()
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+            for future in done:
+                results = future.result()
+                submit()
+                yield from results
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -1,11 +1,139 @@
-import logging
-import json
-from web3 import Web3
-from solidity_python_sdk.utils.error_handling import InsufficientFundsError
-    
-def check_funds(web3, account_address, required_amount):
-    balance = web3.eth.get_balance(account_address)
-    if balance < required_amount:
-        raise InsufficientFundsError(f"Insufficient funds: balance {balance}, required {required_amount}")
+from collections import deque
+from itertools import islice
 
 
+def send_transaction(sdk, tx, timeout=300):
+    """
+    Signs a transaction with the SDK account, sends it and waits for its receipt.
+
+    The worst-case cost of the transaction is reserved in the SDK's spend ledger before submission,
+    so unaffordable work is refused up front, and reconciled with the gas actually used afterwards.
+    The reservation is released if the transaction cannot be sent, and held if it was sent but its
+    receipt cannot be awaited, since it may still be mined.
+    """
+    reservation = sdk.ledger.reserve(tx)
+    try:
+        signed_tx = sdk.web3.eth.account.sign_transaction(tx, sdk.account.key)
+        tx_hash = sdk.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+    except Exception:
+        sdk.ledger.release(reservation)
+        raise
+    try:
+        tx_receipt = sdk.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+    except Exception:
+        sdk.ledger.hold(reservation, tx_hash)
+        raise
+    sdk.ledger.settle(reservation, tx_receipt)
+    return tx_receipt
+
+
+def send_transactions(sdk, txs, timeout=300, max_pending=64, receipts=None):
+    """
+    Signs and broadcasts transactions back-to-back, then collects their receipts.
+
+    The transactions must already carry consecutive nonces. At most ``max_pending`` transactions are
+    left unconfirmed at a time; once the window is full, the oldest receipt is awaited before the next
+    transaction is sent. If a transaction cannot be sent, the ones already broadcast are still awaited
+    and reconciled in the spend ledger before the error is raised. If a receipt cannot be awaited, the
+    reservations of that transaction and of the ones after it are held in the ledger without waiting
+    for them, since they were broadcast and may still be mined. Either way the first error is raised.
+    Pass a list as ``receipts`` to keep the receipts collected up to such an error.
+    """
+    pending = deque()
+    receipts = [] if receipts is None else receipts
+
+    def collect():
+        reservation, tx_hash = pending.popleft()
+        try:
+            tx_receipt = sdk.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        except Exception:
+            sdk.ledger.hold(reservation, tx_hash)
+            raise
+        sdk.ledger.settle(reservation, tx_receipt)
+        receipts.append(tx_receipt)
+
+    error = None
+    receipt_failed = False
+    try:
+        for tx in txs:
+            if len(pending) >= max_pending:
+                try:
+                    collect()
+                except Exception:
+                    receipt_failed = True
+                    raise
+            reservation = sdk.ledger.reserve(tx)
+            try:
+                signed_tx = sdk.web3.eth.account.sign_transaction(tx, sdk.account.key)
+                tx_hash = sdk.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            except Exception:
+                sdk.ledger.release(reservation)
+                raise
+            pending.append((reservation, tx_hash))
+    except Exception as e:
+        error = e
+
+    while pending:
+        if receipt_failed:
+            sdk.ledger.hold(*pending.popleft())
+            continue
+        try:
+            collect()
+        except Exception as e:
+            error = error or e
+            receipt_failed = True
+    if error is not None:
+        raise error
+    return receipts
+
+
+def output_fields(abi, function_name):
+    """
+    Returns the names of the fields returned by a contract function, as declared in its ABI.
+
+    Tuple outputs are flattened into the names of their components.
+    """
+    for entry in abi:
+        if entry.get('type') == 'function' and entry.get('name') == function_name:
+            fields = []
+            for output in entry['outputs']:
+                if output.get('components'):
+                    fields.extend(component['name'] for component in output['components'])
+                else:
+                    fields.append(output['name'])
+            return fields
+    raise KeyError(f"Function '{function_name}' not found in ABI")
+
+
+def chunked(iterable, size):
+    """
+    Yields successive lists of at most ``size`` items from ``iterable`` without materializing it.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def find_deployment_block(web3, address):
+    """
+    Returns the number of the block in which the contract at ``address`` was deployed.
+
+    The block is found by a binary search over the code stored at the address, so it takes about
+    log2(block number) eth_getCode calls and needs a node that keeps historical state.
+
+    Raises:
+        ValueError: If no contract is deployed at the address.
+    """
+    low, high = 0, web3.eth.block_number
+    if not web3.eth.get_code(address, high):
+        raise ValueError(f"No contract is deployed at {address}")
+    while low < high:
+        middle = (low + high) // 2
+        if web3.eth.get_code(address, middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
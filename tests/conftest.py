@@ -0,0 +1,189 @@
+import base64
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from solidity_python_sdk.utils.ipfs import parse_cid
+
+pytest_plugins = ["solidity_python_sdk.pytest_plugin"]
+
+
+@pytest.fixture()
+def tester_sdk(dpp_sdk):
+    # SDK on the shared in-process eth-tester chain, funded with the tester's first account
+    return dpp_sdk
+
+
+@pytest.fixture()
+def product_details():
+    # Fields of setProduct, as accepted by ProductPassport.set_product
+    return {
+        "uid": "unique_id",
+        "gtin": "1234567890123",
+        "taricCode": "1234",
+        "manufacturerInfo": "Manufacturer XYZ",
+        "consumerInfo": "Consumer XYZ",
+        "endOfLifeInfo": "Dispose properly"
+    }
+
+
+@pytest.fixture()
+def product_data():
+    # Fields of setProductData, as accepted by ProductPassport.set_product_data
+    return {
+        "description": "Product description",
+        "manuals": ["manual1.pdf"],
+        "specifications": ["spec1.pdf"],
+        "batchNumber": "123ABC",
+        "productionDate": "2023-01-01",
+        "expiryDate": "2023-12-31",
+        "certifications": "ISO123",
+        "warrantyInfo": "1 year",
+        "materialComposition": "Materials",
+        "complianceInfo": "Complies with regulations"
+    }
+
+
+@pytest.fixture()
+def batch_details():
+    # Builds the fields of Batch.create_batch for a batch ID, with optional overrides
+    def details(batch_id, **fields):
+        return dict({
+            "batchId": batch_id,
+            "amount": 10,
+            "assemblingTime": 1700000000,
+            "transportDetails": "Truck",
+            "ipfsHash": "QmWDYhFAaT89spcqbKYboyCm6mkYSxKJaWUuS18Akmw96t"
+        }, **fields)
+
+    return details
+
+
+@pytest.fixture()
+def complex_details():
+    # Builds the fields of ComplexManagement.add_complex for a complex number
+    def details(index):
+        return {
+            "complexId": f"C{index}",
+            "complexName": f"Plant {index}",
+            "complexCountry": "DE",
+            "complexAddress": "Industriestrasse 1",
+            "latitude": "48.1",
+            "longitude": "11.5",
+            "complexSiteType": "Factory",
+            "complexIndustry": "Automotive"
+        }
+
+    return details
+
+
+class BlockStore:
+    """
+    IPFS blocks built in memory, keyed by CID: raw leaves, chunked UnixFS files and directories.
+    """
+
+    def __init__(self):
+        self.blocks = {}
+
+    def add_raw(self, data):
+        cid = _cid(0x55, data)
+        self.blocks[cid] = data
+        return cid
+
+    def add_file(self, data, chunk_size=4096):
+        leaves = [self.add_raw(data[start:start + chunk_size]) for start in range(0, len(data), chunk_size)]
+        return self._add_node([(leaf, "") for leaf in leaves], unixfs_type=2)
+
+    def add_directory(self, entries):
+        return self._add_node([(cid, name) for name, cid in sorted(entries.items())], unixfs_type=1)
+
+    def _add_node(self, links, unixfs_type):
+        # PBNode: Links (field 2) come before Data (field 1); each PBLink holds a Hash (1) and a Name (2)
+        node = b"".join(_field(2, _field(1, _cid_bytes(cid)) + _field(2, name.encode())) for cid, name in links)
+        node += _field(1, bytes([0x08, unixfs_type]))
+        cid = _cid(0x70, node)
+        self.blocks[cid] = node
+        return cid
+
+
+class TrustlessGateway:
+    """
+    Local IPFS gateway serving raw blocks under /ipfs/<cid>?format=raw and answering HEAD requests.
+    """
+
+    def __init__(self, blocks, status=200):
+        gateway = self
+        self.blocks = blocks
+        self.requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def respond(self, body):
+                gateway.requests.append((self.command, self.path))
+                content = gateway.blocks.get(parse_cid(self.path.split("?")[0]))
+                if status != 200 or content is None:
+                    self.send_response(status if status != 200 else 404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.end_headers()
+                if body:
+                    self.wfile.write(content)
+
+            def do_GET(self):
+                self.respond(True)
+
+            def do_HEAD(self):
+                self.respond(False)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/ipfs/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture()
+def block_store():
+    return BlockStore()
+
+
+@pytest.fixture()
+def start_gateway():
+    # Starts stand-in gateways over a dict of blocks, and stops them after the test
+    gateways = []
+
+    def start(blocks, status=200):
+        gateways.append(TrustlessGateway(blocks, status))
+        return gateways[-1]
+
+    yield start
+    for gateway in gateways:
+        gateway.close()
+
+
+def _cid(codec, block):
+    # CIDv1 with a sha2-256 multihash, in base32
+    binary = bytes([1, codec, 0x12, 32]) + hashlib.sha256(block).digest()
+    return "b" + base64.b32encode(binary).decode().lower().rstrip("=")
+
+
+def _field(number, value):
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+
+def _varint(value):
+    out = b""
+    while value >= 0x80:
+        out += bytes([value & 0x7f | 0x80])
+        value >>= 7
+    return out + bytes([value])
+
+
+def _cid_bytes(cid):
+    body = cid[1:]
+    return base64.b32decode(body.upper() + "=" * (-len(body) % 8))
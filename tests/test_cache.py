@@ -0,0 +1,25 @@
+from solidity_python_sdk.main import ProductPassport
+from solidity_python_sdk.utils.cache import MISSING, ReadCache
+
+
+def test_read_cache_round_trip(tmp_path):
+    cache = ReadCache(str(tmp_path / "reads.sqlite"))
+    cache.set_many([("a", ["x", [1, 2]]), ("b", b"\x01\x02")])
+
+    assert cache.get_many(["a", "b", "c"]) == [["x", [1, 2]], b"\x01\x02", MISSING]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_historical_reads_are_cached_once_finalized(dpp_chain, product_details, tmp_path):
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    with dpp_chain.isolated(cache_path=str(tmp_path / "reads.sqlite")) as sdk:
+        passport = ProductPassport(sdk)
+        block_number = passport.set_product(contract_address, 7, dict(product_details, uid="first")).blockNumber
+        passport.set_product(contract_address, 7, dict(product_details, uid="second"))
+
+        assert passport.get_product(contract_address, 7, block_identifier=block_number).uid == "first"
+        assert passport.get_product(contract_address, 7).uid == "second"
+        assert (sdk.reader.cache.hits, sdk.reader.cache.misses) == (0, 1)
+
+        assert passport.get_products(contract_address, [7, 8], block_identifier=block_number)[0].uid == "first"
+        assert (sdk.reader.cache.hits, sdk.reader.cache.misses) == (1, 2)
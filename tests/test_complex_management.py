@@ -0,0 +1,47 @@
+import pytest
+from solidity_python_sdk.contracts.records import Complex
+
+
+def test_add_complexes_and_read_back(tester_sdk, dpp_chain, complex_details):
+    management = tester_sdk.complex_management
+    contract_address = dpp_chain.addresses["ComplexManagement"]
+
+    receipts = management.add_complexes(contract_address, [complex_details(index) for index in range(1, 6)])
+    assert [receipt.status for receipt in receipts] == [1] * 5
+    assert len({receipt.blockNumber for receipt in receipts}) == 5
+
+    complexes = management.get_complexes(contract_address, ["C1", "C5", "C9"])
+    assert isinstance(complexes[0], Complex)
+    assert complexes[1].complexName == "Plant 5"
+    assert complexes[2].complexId == ""
+
+    management.set_geolocation(contract_address, "C1", "52.5", "13.4", "Gate 2")
+    assert management.get_geolocations(contract_address, ["C1"])[0].additionalInfo == "Gate 2"
+
+
+def test_sync_complexes_applies_new_events_only(tester_sdk, dpp_chain, complex_details):
+    management = tester_sdk.complex_management
+    contract_address = dpp_chain.addresses["ComplexManagement"]
+    management.add_complex(contract_address, complex_details(1))
+
+    known = {}
+    last_block = management.sync_complexes(contract_address, known)
+    assert list(known) == ["C1"]
+
+    management.add_complex(contract_address, complex_details(2))
+    management.sync_complexes(contract_address, known, from_block=last_block + 1)
+    assert known["C2"].complexIndustry == "Automotive"
+
+
+def test_add_complexes_requires_every_field(tester_sdk, dpp_chain, complex_details):
+    management = tester_sdk.complex_management
+    contract_address = dpp_chain.addresses["ComplexManagement"]
+    misspelled = complex_details(2)
+    misspelled["complexCountyr"] = misspelled.pop("complexCountry")
+    nonce = tester_sdk.web3.eth.get_transaction_count(tester_sdk.account.address)
+
+    with pytest.raises(KeyError):
+        management.add_complexes(contract_address, [complex_details(1), misspelled])
+    with pytest.raises(ValueError):
+        management.add_complex(contract_address, dict(complex_details(3), complexId=""))
+    assert tester_sdk.web3.eth.get_transaction_count(tester_sdk.account.address) == nonce
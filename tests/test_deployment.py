@@ -0,0 +1,44 @@
+import pytest
+from web3 import Web3
+from solidity_python_sdk.contracts.batch import Batch
+from solidity_python_sdk.utils.error_handling import DeploymentError
+
+
+def test_deploy_tenants_in_one_round(tester_sdk, batch_details):
+    manifest = tester_sdk.deployment.deploy(tenants=2)
+
+    assert manifest["deployer"] == tester_sdk.account.address
+    assert len(manifest["tenants"]) == 2
+    for tenant in manifest["tenants"]:
+        assert set(tenant) == {"ProductPassport", "Batch", "Geolocation"}
+        for deployment in tenant.values():
+            assert Web3.is_address(deployment["address"])
+            assert tester_sdk.web3.eth.get_code(deployment["address"])
+
+    # Batch contracts were constructed with the precomputed ProductPassport address
+    tenant = manifest["tenants"][1]
+    batch = Batch(tester_sdk)
+    batch.create_batch(tenant["Batch"]["address"], batch_details(1))
+    assert batch.get_batch(tenant["Batch"]["address"], 1)[0] == 10
+
+
+def test_failed_deployment_keeps_the_manifest_of_deployed_contracts(tester_sdk, monkeypatch):
+    wait_for_transaction_receipt = tester_sdk.web3.eth.wait_for_transaction_receipt
+    awaited = []
+
+    def timeout_on_fifth(tx_hash, **kwargs):
+        awaited.append(tx_hash)
+        if len(awaited) == 5:
+            raise TimeoutError("No receipt")
+        return wait_for_transaction_receipt(tx_hash, **kwargs)
+
+    monkeypatch.setattr(tester_sdk.web3.eth, "wait_for_transaction_receipt", timeout_on_fifth)
+    with pytest.raises(DeploymentError, match="No receipt") as error:
+        tester_sdk.deployment.deploy(tenants=2)
+
+    tenants = error.value.manifest["tenants"]
+    assert set(tenants[0]) == {"ProductPassport", "Batch", "Geolocation"}
+    assert set(tenants[1]) == {"ProductPassport"}
+    for tenant in tenants:
+        for deployment in tenant.values():
+            assert tester_sdk.web3.eth.get_code(deployment["address"])
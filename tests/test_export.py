@@ -0,0 +1,52 @@
+import json
+import pytest
+from solidity_python_sdk.export import PassportExporter
+from solidity_python_sdk.main import ProductPassport, Batch
+
+
+@pytest.fixture()
+def catalog(tester_sdk, dpp_chain, product_data, batch_details):
+    contract_address, batch_address = dpp_chain.addresses["ProductPassport"], dpp_chain.addresses["Batch"]
+    Batch(tester_sdk).create_batch(batch_address, batch_details(1, amount=2 ** 70))
+    passport = ProductPassport(tester_sdk)
+    for product_id in (2, 4, 6):
+        passport.set_product_data(
+            contract_address, product_id, dict(product_data, description=f"Product {product_id}", batchNumber="1")
+        )
+    return contract_address, batch_address
+
+
+def test_export_jsonl_resumes_from_checkpoint(tester_sdk, catalog, tmp_path):
+    contract_address, batch_address = catalog
+    path = str(tmp_path / "passports.jsonl")
+    exporter = PassportExporter(tester_sdk, batch_size=1, chunk_size=2, workers=2)
+
+    stats = exporter.export(path, contract_address, range(1, 5), batch_address=batch_address)
+    assert (stats["records"], stats["lastId"]) == (2, 4)
+
+    stats = exporter.export(path, contract_address, range(1, 8), batch_address=batch_address, resume=True)
+    assert (stats["records"], stats["lastId"]) == (1, 6)
+
+    with open(path) as file:
+        rows = [json.loads(line) for line in file]
+    assert [row["productId"] for row in rows] == [2, 4, 6]
+    assert rows[0]["description"] == "Product 2"
+    assert rows[0]["batchTransportDetails"] == "Truck"
+
+
+def test_export_parquet_writes_part_files(tester_sdk, catalog, tmp_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    contract_address, batch_address = catalog
+    path = str(tmp_path / "passports.parquet")
+    exporter = PassportExporter(tester_sdk, batch_size=2)
+
+    stats = exporter.export(path, contract_address, range(1, 8), batch_address=batch_address)
+
+    table = pyarrow_parquet.read_table(path)
+    assert stats["records"] == table.num_rows == 3
+    assert table.column("productId").to_pylist() == [2, 4, 6]
+    assert table.column("manuals").to_pylist()[0] == ["manual1.pdf"]
+    assert table.column("batchAmount").to_pylist()[0] == str(2 ** 70)
+
+    exporter.export(path, contract_address, range(5, 8), batch_address=batch_address)
+    assert pyarrow_parquet.read_table(path).column("productId").to_pylist() == [6]
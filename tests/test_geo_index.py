@@ -0,0 +1,76 @@
+import pytest
+from solidity_python_sdk.geo_index import GeolocationIndex
+from solidity_python_sdk.utils import utils
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture()
+def geolocation_address(dpp_chain):
+    return dpp_chain.addresses["Geolocation"]
+
+
+def test_index_answers_radius_and_bbox_queries(tester_sdk, geolocation_address):
+    geolocation = tester_sdk.geolocation
+    geolocation.set_geolocation(geolocation_address, "plant", "48.1371", "11.5754", "Munich plant")
+    geolocation.set_geolocation(geolocation_address, "warehouse", "48.3538", "11.7861")
+    geolocation.set_geolocation(geolocation_address, "port", "53.5461", "9.9661")
+
+    index = geolocation.build_index(geolocation_address)
+
+    assert len(index) == 3
+    nearby = index.within_radius(48.1371, 11.5754, 50)
+    assert [batch_id for batch_id, _ in nearby] == ["plant", "warehouse"]
+    assert nearby[0][1] == pytest.approx(0.0)
+    assert 25 < nearby[1][1] < 35
+    assert index.within_bbox(53, 9, 54, 10) == ["port"]
+
+
+def test_index_updates_incrementally(tester_sdk, geolocation_address):
+    geolocation = tester_sdk.geolocation
+    geolocation.set_geolocation(geolocation_address, "plant", "48.1371", "11.5754")
+    geolocation.set_geolocation(geolocation_address, "port", "53.5461", "9.9661")
+    index = geolocation.build_index(geolocation_address)
+
+    geolocation.set_geolocation(geolocation_address, "plant", "52.5200", "13.4050")
+    geolocation.set_geolocation(geolocation_address, "depot", "not a number", "13.4050")
+
+    assert index.update() == 2
+    assert len(index) == 2
+    assert index.skipped == 1
+    assert index.within_radius(52.52, 13.405, 1)[0][0] == "plant"
+    assert index.update() == 0
+
+    geolocation.set_geolocation(geolocation_address, "plant", "95.0", "13.4050")
+    assert index.update() == 1
+    assert "plant" not in index
+    assert index.within_bbox(53, 9, 54, 10) == ["port"]
+
+
+def test_build_index_starts_at_the_deployment_block(tester_sdk, geolocation_address):
+    deployed = utils.find_deployment_block(tester_sdk.web3, geolocation_address)
+    assert tester_sdk.web3.eth.get_code(geolocation_address, deployed)
+    assert not tester_sdk.web3.eth.get_code(geolocation_address, deployed - 1)
+
+    receipt = tester_sdk.geolocation.set_geolocation(geolocation_address, "plant", "48.1371", "11.5754")
+    assert len(tester_sdk.geolocation.build_index(geolocation_address)) == 1
+    assert len(tester_sdk.geolocation.build_index(geolocation_address, from_block=receipt.blockNumber + 1)) == 0
+
+
+def test_update_after_bulk_load_starts_at_the_loaded_block(tester_sdk, geolocation_address, monkeypatch):
+    geolocation = tester_sdk.geolocation
+    geolocation.set_geolocation(geolocation_address, "plant", "48.1371", "11.5754")
+    index = GeolocationIndex(tester_sdk, geolocation_address)
+    with pytest.raises(ValueError):
+        index.update()
+
+    assert index.load(["plant", "port"]) == 1
+    assert index.last_block == tester_sdk.web3.eth.block_number
+    geolocation.set_geolocation(geolocation_address, "port", "53.5461", "9.9661")
+
+    ranges = []
+    load_events = index.load_events
+    monkeypatch.setattr(index, "load_events", lambda from_block: ranges.append(from_block) or load_events(from_block))
+    assert index.update() == 1
+    assert ranges == [tester_sdk.web3.eth.block_number]
+    assert index.within_bbox(53, 9, 54, 10) == ["port"]
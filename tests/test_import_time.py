@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("web3", "eth_account", "pinatapy", "requests", "sqlite3")
+
+
+def _loaded_after(statement):
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_importing_the_package_loads_no_heavy_dependencies():
+    loaded = _loaded_after("import solidity_python_sdk.main")
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_sdk_class_is_available_from_the_package():
+    loaded = _loaded_after("from solidity_python_sdk import DigitalProductPassportSDK")
+    assert "solidity_python_sdk.main" in loaded
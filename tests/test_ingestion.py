@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+from solidity_python_sdk.ingestion import IngestionPipeline
+
+
+class FakePinata:
+    """
+    In-memory replacement for PinataUtility that derives a fake CID from the content.
+    """
+
+    def __init__(self):
+        self.pinned = {}
+        self.lock = threading.Lock()
+
+    def pin(self, content):
+        cid = "Qm" + hashlib.sha256(content).hexdigest()[:44]
+        with self.lock:
+            self.pinned[cid] = content
+        return {"IpfsHash": cid}
+
+    def pin_file(self, file_path):
+        with open(file_path, "rb") as file:
+            return self.pin(file.read())
+
+    def pin_json(self, json_data):
+        return self.pin(json.dumps(json_data, sort_keys=True).encode())
+
+
+def test_ingestion_pipeline_pins_and_submits(tester_sdk, dpp_chain, tmp_path):
+    for product_id in range(1, 6):
+        (tmp_path / f"manual{product_id}.pdf").write_bytes(b"manual %d" % product_id)
+        config = {
+            "productId": product_id,
+            "description": f"Product {product_id}",
+            "manuals": [f"manual{product_id}.pdf"],
+            "specifications": [],
+            "batchNumber": "1"
+        }
+        (tmp_path / f"product{product_id}.json").write_text(json.dumps(config))
+    (tmp_path / "broken.json").write_text(json.dumps({"description": "No product ID"}))
+
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    pinata = FakePinata()
+    report = IngestionPipeline(tester_sdk, pinata, pin_workers=3, queue_size=2).run(str(tmp_path), contract_address)
+
+    assert sorted(result["productId"] for result in report["submitted"]) == [1, 2, 3, 4, 5]
+    assert [(failure["stage"], failure["config"].endswith("broken.json")) for failure in report["failed"]] == [
+        ("pin_documents", True)
+    ]
+    assert all(result["passportCid"] in pinata.pinned for result in report["submitted"])
+
+    product_data = tester_sdk.product_passport.get_product_data(contract_address, 3)
+    assert pinata.pinned[product_data.manuals[0]] == b"manual 3"
+
+
+def test_ingestion_reports_configs_whose_transaction_cannot_be_built(tester_sdk, dpp_chain, tmp_path):
+    class UnbuildableCall:
+        def build_transaction(self, transaction):
+            raise ValueError("Cannot build transaction")
+
+    class Pipeline(IngestionPipeline):
+        def build_passport(self, item, contract):
+            item = super().build_passport(item, contract)
+            if item["productId"] == 2:
+                item["function"] = UnbuildableCall()
+            return item
+
+    for product_id in range(1, 4):
+        (tmp_path / f"product{product_id}.json").write_text(json.dumps({
+            "productId": product_id,
+            "description": f"Product {product_id}",
+            "manuals": [],
+            "specifications": [],
+            "batchNumber": "1"
+        }))
+
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    report = Pipeline(tester_sdk, FakePinata(), build_workers=1, queue_size=1).run(str(tmp_path), contract_address)
+
+    failed = {failure["config"]: failure for failure in report["failed"]}
+    assert len(report["submitted"]) + len(failed) == 3
+    assert failed[str(tmp_path / "product2.json")]["stage"] == "submit"
+    assert "Cannot build transaction" in failed[str(tmp_path / "product2.json")]["error"]
@@ -0,0 +1,86 @@
+import hashlib
+import pytest
+from solidity_python_sdk.contracts.batch import Batch
+from solidity_python_sdk.main import ProductPassport
+from solidity_python_sdk.utils.integrity import IntegrityVerifier
+from solidity_python_sdk.utils.ipfs import IpfsFetcher, decode_cid
+
+
+@pytest.fixture()
+def documents(block_store, start_gateway):
+    manual = block_store.add_file(b"chapter one " * 1000 + b"chapter two " * 1000, chunk_size=12000)
+    spec = block_store.add_raw(b"specification")
+    tampered = block_store.add_raw(b"original")
+    block_store.blocks[tampered] = b"tampered"
+    unpinned = block_store.add_raw(b"unpinned")
+    block_store.blocks.pop(unpinned)
+    return start_gateway(block_store.blocks), manual, spec, tampered, unpinned
+
+
+def test_decode_cid(block_store):
+    cid = decode_cid("QmWDYhFAaT89spcqbKYboyCm6mkYSxKJaWUuS18Akmw96t")
+    assert (cid.version, cid.codec, cid.hash_function, len(cid.digest)) == (0, 0x70, 0x12, 32)
+    assert decode_cid(block_store.add_raw(b"")).digest == hashlib.sha256(b"").digest()
+    with pytest.raises(ValueError):
+        decode_cid("manual1.pdf")
+
+
+def test_verify_walks_the_dag(tester_sdk, documents):
+    gateway, manual, _, tampered, unpinned = documents
+    verifier = IntegrityVerifier(tester_sdk, fetcher=IpfsFetcher([gateway.url]))
+
+    result = verifier.verify(f"ipfs://{manual}")
+    assert result["status"] == "ok"
+    assert result["blocks"] == 3
+    assert all("format=raw" in path for _, path in gateway.requests)
+
+    assert verifier.verify(tampered)["status"] == "mismatched"
+    assert verifier.verify(unpinned)["status"] == "missing"
+
+    gateway.blocks.pop(next(cid for cid, block in gateway.blocks.items() if block.startswith(b"chapter two")))
+    result = verifier.verify(manual)
+    assert result["status"] == "missing" and result["error"].startswith("Block ")
+
+
+def test_verify_products_and_batches(tester_sdk, dpp_chain, documents, product_data, batch_details):
+    gateway, manual, spec, tampered, unpinned = documents
+    verifier = IntegrityVerifier(tester_sdk, fetcher=IpfsFetcher([gateway.url]), max_workers=4)
+    passport_address = dpp_chain.addresses["ProductPassport"]
+    passport = ProductPassport(tester_sdk)
+    for product_id, manuals in ((1, [manual]), (2, [manual, unpinned]), (3, ["manual1.pdf"])):
+        passport.set_product_data(passport_address, product_id, dict(product_data, manuals=manuals, specifications=[spec]))
+
+    report = verifier.verify_products(passport_address, range(1, 5))
+    assert (report["checked"], report["ok"]) == (7, 5)
+    assert [(entry["productId"], entry["field"]) for entry in report["missing"]] == [(2, "manuals[1]")]
+    assert [(entry["productId"], entry["uri"]) for entry in report["invalid"]] == [(3, "manual1.pdf")]
+    assert sum(path.startswith(f"/ipfs/{manual}") for _, path in gateway.requests) == 1
+
+    batch = Batch(tester_sdk)
+    batch_address = dpp_chain.addresses["Batch"]
+    for batch_id, ipfs_hash in ((1, spec), (2, tampered)):
+        batch.create_batch(batch_address, batch_details(batch_id, ipfsHash=ipfs_hash))
+
+    report = verifier.verify_batches(batch_address, range(1, 4))
+    assert (report["checked"], report["ok"]) == (2, 1)
+    assert [(entry["batchId"], entry["field"]) for entry in report["mismatched"]] == [(2, "tokenURI")]
+
+    gateway.requests.clear()
+    report = IntegrityVerifier(tester_sdk, fetcher=IpfsFetcher([gateway.url]), head_only=True).verify_batches(
+        batch_address, range(1, 4)
+    )
+    assert (report["checked"], report["ok"]) == (2, 2)
+    assert {method for method, _ in gateway.requests} == {"HEAD"}
+
+
+def test_verify_batches_does_not_hide_read_failures(tester_sdk, dpp_chain, documents):
+    gateway = documents[0]
+
+    def unreachable(functions, block_identifier):
+        raise ConnectionError("node unreachable")
+
+    tester_sdk.reader._call_chunk = unreachable
+    with pytest.raises(ConnectionError):
+        IntegrityVerifier(tester_sdk, fetcher=IpfsFetcher([gateway.url])).verify_batches(
+            dpp_chain.addresses["Batch"], range(1, 4)
+        )
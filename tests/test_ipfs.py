@@ -0,0 +1,104 @@
+import json
+import pytest
+from web3.exceptions import Web3RPCError
+from solidity_python_sdk.contracts.batch import Batch
+from solidity_python_sdk.utils.error_handling import ContentMismatchError, IpfsFetchError
+from solidity_python_sdk.utils.ipfs import ContentCache, IpfsFetcher
+
+
+def test_fetcher_falls_back_and_caches_by_cid(block_store, start_gateway, tmp_path):
+    metadata = block_store.add_raw(json.dumps({"name": "Batch 1"}).encode())
+    broken = start_gateway({}, status=502)
+    working = start_gateway(block_store.blocks)
+    fetcher = IpfsFetcher([broken.url, working.url], cache=ContentCache(str(tmp_path)))
+
+    assert fetcher.fetch_json(f"ipfs://{metadata}") == {"name": "Batch 1"}
+    assert fetcher.fetch_json(metadata) == {"name": "Batch 1"}
+    assert (len(broken.requests), len(working.requests)) == (1, 1)
+    assert not list(tmp_path.glob(f"*{metadata}*"))
+
+    restarted = IpfsFetcher([working.url], cache=ContentCache(str(tmp_path)))
+    assert restarted.fetch(metadata) == b'{"name": "Batch 1"}'
+    assert len(working.requests) == 1
+
+    unpinned = block_store.add_raw(b"unpinned")
+    block_store.blocks.pop(unpinned)
+    with pytest.raises(IpfsFetchError):
+        fetcher.fetch(unpinned)
+    with pytest.raises(IpfsFetchError):
+        fetcher.fetch("QmMissing")
+
+
+def test_sdk_creates_its_fetcher_on_first_use(tester_sdk):
+    assert "ipfs" not in vars(tester_sdk) and "integrity" not in vars(tester_sdk)
+    assert tester_sdk.integrity.fetcher is tester_sdk.ipfs
+
+
+def test_fetcher_rejects_content_not_matching_its_cid(block_store, start_gateway, tmp_path):
+    document = block_store.add_raw(b"original")
+    tampered = start_gateway({document: b"tampered"})
+    honest = start_gateway(block_store.blocks)
+
+    cache = ContentCache(str(tmp_path))
+    with pytest.raises(ContentMismatchError):
+        IpfsFetcher([tampered.url], cache=cache).fetch(document)
+    assert cache.get(document) is None
+
+    assert IpfsFetcher([tampered.url, honest.url], cache=cache).fetch(document) == b"original"
+    assert cache.get(document) == b"original"
+
+
+def test_fetcher_reassembles_files_and_resolves_paths(block_store, start_gateway):
+    manual = b"chapter one " * 1000 + b"chapter two " * 1000
+    manual_cid = block_store.add_file(manual)
+    metadata = block_store.add_raw(b'{"name": "Batch 1"}')
+    directory = block_store.add_directory({"manual.pdf": manual_cid, "metadata.json": metadata})
+    gateway = start_gateway(block_store.blocks)
+    fetcher = IpfsFetcher([gateway.url])
+
+    assert fetcher.fetch(manual_cid) == manual
+    assert all("format=raw" in path for _, path in gateway.requests)
+    assert fetcher.fetch_json(f"ipfs://{directory}/metadata.json") == {"name": "Batch 1"}
+    assert fetcher.fetch(f"{directory}/manual.pdf") == manual
+    with pytest.raises(IpfsFetchError):
+        fetcher.fetch(f"{directory}/missing.txt")
+
+
+def test_resolve_batch_metadata(tester_sdk, dpp_chain, block_store, start_gateway, batch_details):
+    metadata = block_store.add_raw(json.dumps({"name": "Batch 1"}).encode())
+    unpinned = block_store.add_raw(b"unpinned")
+    block_store.blocks.pop(unpinned)
+    gateway = start_gateway(block_store.blocks)
+    batch = Batch(tester_sdk)
+    contract_address = dpp_chain.addresses["Batch"]
+    for batch_id, ipfs_hash in ((1, metadata), (2, unpinned)):
+        batch.create_batch(contract_address, batch_details(batch_id, ipfsHash=ipfs_hash))
+
+    resolved = batch.resolve_metadata(contract_address, [1, 2, 3], fetcher=IpfsFetcher([gateway.url]))
+
+    assert resolved[0]["tokenURI"] == f"ipfs://{metadata}"
+    assert resolved[0]["metadata"] == {"name": "Batch 1"}
+    assert resolved[0]["details"].transportDetails == "Truck"
+    assert resolved[1]["metadata"] is None and unpinned in resolved[1]["error"]
+    assert resolved[2]["tokenURI"] is None and resolved[2]["error"]
+
+
+def test_resolve_batch_metadata_reports_read_errors(tester_sdk, dpp_chain, block_store, start_gateway, batch_details):
+    metadata = block_store.add_raw(json.dumps({"name": "Batch 1"}).encode())
+    gateway = start_gateway(block_store.blocks)
+    batch = Batch(tester_sdk)
+    contract_address = dpp_chain.addresses["Batch"]
+    batch.create_batch(contract_address, batch_details(1, ipfsHash=metadata))
+    reader = tester_sdk.reader
+    call_chunk = reader._call_chunk
+
+    def rate_limited(functions, block_identifier):
+        if functions[0].fn_name == "tokenURI":
+            return [(None, Web3RPCError("rate limit exceeded"))] * len(functions)
+        return call_chunk(functions, block_identifier)
+
+    reader._call_chunk = rate_limited
+    resolved = batch.resolve_metadata(contract_address, [1, 2], fetcher=IpfsFetcher([gateway.url]))
+
+    assert [entry["tokenURI"] for entry in resolved] == [None, None]
+    assert all("rate limit exceeded" in entry["error"] for entry in resolved)
@@ -0,0 +1,85 @@
+import pytest
+from solidity_python_sdk.main import ProductPassport
+from solidity_python_sdk.utils.error_handling import InsufficientFundsError
+
+
+def test_ledger_tracks_balance_without_per_transaction_rpc(tester_sdk, dpp_chain, product_details, monkeypatch):
+    balance_calls = []
+    get_balance = tester_sdk.web3.eth.get_balance
+    monkeypatch.setattr(tester_sdk.web3.eth, "get_balance", lambda *args: balance_calls.append(args) or get_balance(*args))
+
+    passport = ProductPassport(tester_sdk)
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    passport.set_product(contract_address, 1, product_details)
+    passport.set_product(contract_address, 2, product_details)
+
+    assert len(balance_calls) == 1
+    assert tester_sdk.ledger.reserved == 0
+    assert tester_sdk.ledger.balance == get_balance(tester_sdk.account.address)
+
+
+def test_ledger_refuses_unaffordable_transaction(tester_sdk):
+    ledger = tester_sdk.ledger
+    tx = {"gas": 21000, "gasPrice": ledger.available // 21000 + 1}
+
+    with pytest.raises(InsufficientFundsError):
+        ledger.reserve(tx)
+    assert ledger.reserved == 0
+
+
+def test_ledger_reserves_worst_case_until_released(tester_sdk):
+    ledger = tester_sdk.ledger
+    available = ledger.available
+
+    reservation = ledger.reserve({"gas": 100000, "maxFeePerGas": 10, "gasPrice": 1, "value": 5})
+    assert ledger.available == available - 1000005
+
+    ledger.release(reservation)
+    assert ledger.available == available
+
+
+def test_ledger_resyncs_while_transactions_are_in_flight(tester_sdk):
+    ledger = tester_sdk.ledger
+    ledger.resync_interval = 0
+    reservation = ledger.reserve({"gas": 100000, "gasPrice": 10})
+    ledger.balance -= 12345
+
+    assert ledger.available == tester_sdk.web3.eth.get_balance(tester_sdk.account.address) - 1000000
+    ledger.release(reservation)
+
+
+def test_receipt_failure_holds_reservations_until_mined(tester_sdk, dpp_chain, product_details, monkeypatch):
+    passport = ProductPassport(tester_sdk)
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    ledger = tester_sdk.ledger
+
+    def timeout(*args, **kwargs):
+        raise TimeoutError("No receipt")
+
+    monkeypatch.setattr(tester_sdk.web3.eth, "wait_for_transaction_receipt", timeout)
+    with pytest.raises(TimeoutError):
+        passport.set_product(contract_address, 1, product_details)
+
+    # The transaction was broadcast and mined anyway, so its cost must not be available again.
+    balance = tester_sdk.web3.eth.get_balance(tester_sdk.account.address)
+    assert len(ledger.reservations) == 1 and ledger.available <= balance
+    ledger.sync()
+    assert ledger.reserved == 0 and ledger.available == balance
+
+
+def test_pipelined_receipt_failure_holds_remaining_reservations(tester_sdk, dpp_chain, complex_details, monkeypatch):
+    ledger = tester_sdk.ledger
+
+    def timeout(*args, **kwargs):
+        raise TimeoutError("No receipt")
+
+    monkeypatch.setattr(tester_sdk.web3.eth, "wait_for_transaction_receipt", timeout)
+    with pytest.raises(TimeoutError):
+        tester_sdk.complex_management.add_complexes(
+            dpp_chain.addresses["ComplexManagement"], [complex_details(index) for index in range(4)]
+        )
+
+    balance = tester_sdk.web3.eth.get_balance(tester_sdk.account.address)
+    assert len(ledger.reservations) == 4 and ledger.available <= balance
+    ledger.sync()
+    assert ledger.reserved == 0 and ledger.available == balance
@@ -0,0 +1,54 @@
+import pytest
+from solidity_python_sdk.contracts.batch import Batch
+from solidity_python_sdk.utils.preflight import ErrorDecoder
+
+
+def test_error_decoder_uses_abi_errors(tester_sdk):
+    decoder = ErrorDecoder([tester_sdk.contracts["Batch"]["abi"]])
+    data = "0x7e273289" + "00" * 31 + "07"
+
+    assert decoder.decode(data) == "ERC721NonexistentToken(tokenId=7)"
+    assert decoder.decode("0x12345678") == "Unknown error 0x12345678"
+
+
+def test_preflight_batches_reports_each_item(tester_sdk, dpp_chain, batch_details, monkeypatch):
+    batch = Batch(tester_sdk)
+    contract_address = dpp_chain.addresses["Batch"]
+    batch.create_batch(contract_address, batch_details(1))
+    block_number = tester_sdk.web3.eth.block_number
+    batched = []
+    make_batch_request = tester_sdk.web3.provider.make_batch_request
+    monkeypatch.setattr(tester_sdk.web3.provider, "make_batch_request",
+                        lambda requests: batched.append(len(requests)) or make_batch_request(requests))
+
+    batches = [batch_details(batch_id) for batch_id in (2, 1, 3, 4, 2)]
+    report = batch.preflight_batches(contract_address, batches)
+
+    assert [entry["ok"] for entry in report] == [True, False, True, True, False]
+    assert report[1]["error"].startswith("ERC721InvalidSender")
+    assert report[4]["error"] == "Duplicate batchId 2, first at index 0"
+    assert batched[0] == 5 and tester_sdk.reader.batching_supported is True
+    assert tester_sdk.web3.eth.block_number == block_number
+
+
+def test_preflight_raises_transport_errors(tester_sdk, dpp_chain, batch_details, monkeypatch):
+    batch = Batch(tester_sdk)
+    contract_address = dpp_chain.addresses["Batch"]
+    tester_sdk.reader.batching_supported = False
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError("Node unreachable")
+
+    monkeypatch.setattr(tester_sdk.web3.eth, "call", unreachable)
+    with pytest.raises(ConnectionError):
+        batch.preflight_batches(contract_address, [batch_details(1), batch_details(2)])
+
+
+def test_preflight_product_data_detects_unauthorized_sender(tester_sdk, dpp_chain, product_data):
+    contract_address = dpp_chain.addresses["ProductPassport"]
+
+    with dpp_chain.isolated(account=1) as unauthorized_sdk:
+        assert unauthorized_sdk.product_passport.preflight_product_data(contract_address, {1: product_data})[0]["ok"] is False
+    assert tester_sdk.product_passport.preflight_product_data(contract_address, {1: product_data}) == [
+        {"index": 0, "ok": True, "error": None, "productId": 1}
+    ]
@@ -0,0 +1,146 @@
+import time
+import pytest
+from web3.providers.base import JSONBaseProvider
+from solidity_python_sdk.providers.multi_endpoint import MultiEndpointProvider
+from solidity_python_sdk.providers.rate_limit import RateLimitedProvider, TokenBucket
+
+
+class StandInNode(JSONBaseProvider):
+    # Local stand-in for an RPC node with a configurable delay and failure mode
+    def __init__(self, name, delay=0.0, fail=False):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.name} is down")
+        return {"jsonrpc": "2.0", "id": 1, "result": self.name}
+
+    def make_batch_request(self, requests):
+        return [self.make_request(method, params) for method, params in requests]
+
+
+def test_read_is_hedged_to_second_endpoint_when_first_is_slow():
+    slow, fast = StandInNode("slow", delay=1.0), StandInNode("fast")
+    provider = MultiEndpointProvider([slow, fast], hedge_delay=0.05)
+
+    start = time.monotonic()
+    response = provider.make_request("eth_call", [])
+
+    assert response["result"] == "fast"
+    assert time.monotonic() - start < 0.5
+    assert slow.requests == ["eth_call"] and fast.requests == ["eth_call"]
+
+
+def test_read_answered_by_primary_is_not_hedged():
+    first, second = StandInNode("first"), StandInNode("second")
+    provider = MultiEndpointProvider([first, second], hedge_delay=0.5)
+
+    assert provider.make_request("eth_blockNumber", [])["result"] == "first"
+    assert second.requests == []
+
+
+def test_write_fails_over_and_unhealthy_endpoint_is_ranked_last():
+    down, healthy = StandInNode("down", fail=True), StandInNode("healthy")
+    provider = MultiEndpointProvider([down, healthy])
+
+    assert provider.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "healthy"
+    assert provider.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "healthy"
+    assert provider.ranked_endpoints() == [healthy, down]
+    assert down.requests == ["eth_sendRawTransaction"]
+
+
+def test_unhealthy_endpoint_regains_rank_once_its_failures_expire():
+    flaky, healthy = StandInNode("flaky", fail=True), StandInNode("healthy")
+    provider = MultiEndpointProvider([flaky, healthy], stats_max_age=0.1)
+
+    assert provider.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "healthy"
+    assert provider.ranked_endpoints() == [healthy, flaky]
+
+    flaky.fail = False
+    time.sleep(0.15)
+    assert provider.stats[flaky].error_rate == 0.0
+    assert provider.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "flaky"
+    assert flaky.requests == ["eth_sendRawTransaction"] * 2
+    provider.close()
+
+
+def test_close_shuts_down_hedging_threads():
+    provider = MultiEndpointProvider([StandInNode("a"), StandInNode("b")])
+    assert provider.make_request("eth_call", [])["result"] == "a"
+
+    provider.close()
+    with pytest.raises(RuntimeError):
+        provider.make_request("eth_call", [])
+
+
+def test_all_endpoints_failing_raises():
+    provider = MultiEndpointProvider([StandInNode("a", fail=True), StandInNode("b", fail=True)])
+
+    with pytest.raises(ConnectionError):
+        provider.make_request("eth_call", [])
+    with pytest.raises(ConnectionError):
+        provider.make_request("eth_sendRawTransaction", ["0x00"])
+
+
+class ThrottlingNode(StandInNode):
+    # Stand-in node answering with a JSON-RPC rate-limit error for the first few requests
+    def __init__(self, name, throttled_requests):
+        super().__init__(name)
+        self.throttled_requests = throttled_requests
+
+    def make_request(self, method, params):
+        response = super().make_request(method, params)
+        if len(self.requests) <= self.throttled_requests:
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": 429, "message": "Too Many Requests"}}
+        return response
+
+
+def test_throttled_requests_are_retried_and_shrink_the_budget():
+    node = ThrottlingNode("node", throttled_requests=2)
+    provider = RateLimitedProvider(node, budgets={"reads": {"rate": 100, "concurrency": 8}}, backoff=0.01)
+
+    assert provider.make_request("eth_call", [])["result"] == "node"
+    assert len(node.requests) == 3
+    budget = provider.budgets["reads"]
+    assert budget.concurrency.limit < 8
+    assert budget.rate < 100
+
+
+def test_successful_requests_grow_the_budget_and_use_separate_classes():
+    node = StandInNode("node")
+    provider = RateLimitedProvider(node, budgets={"writes": {"rate": 10, "concurrency": 2}})
+
+    for _ in range(5):
+        provider.make_request("eth_sendRawTransaction", ["0x00"])
+
+    assert provider.budgets["writes"].rate > 10
+    assert provider.budgets["writes"].concurrency.limit > 2
+    assert provider.budgets["reads"].rate == 50
+
+
+def test_failed_requests_do_not_grow_the_budget():
+    node = StandInNode("node", fail=True)
+    provider = RateLimitedProvider(node, budgets={"reads": {"rate": 10, "concurrency": 2}})
+
+    for _ in range(5):
+        with pytest.raises(ConnectionError):
+            provider.make_request("eth_call", [])
+
+    budget = provider.budgets["reads"]
+    assert (budget.rate, budget.concurrency.limit, budget.concurrency.in_flight) == (10, 2, 0)
+
+
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+
+    assert time.monotonic() - start >= 0.15
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from web3.exceptions import ContractLogicError
+from solidity_python_sdk.main import ProductPassport
+
+
+@pytest.fixture()
+def passport(tester_sdk, dpp_chain, product_details):
+    passport = ProductPassport(tester_sdk)
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    passport.set_product(contract_address, 7, product_details)
+    return passport, contract_address
+
+
+@pytest.fixture()
+def slow_calls(tester_sdk):
+    # Slow every node round-trip down so that concurrent callers overlap, and count the round-trips.
+    reader = tester_sdk.reader
+    call_chunk = reader._call_chunk
+    calls = []
+
+    def slow_call_chunk(functions, block_identifier):
+        calls.append(len(functions))
+        time.sleep(0.2)
+        return call_chunk(functions, block_identifier)
+
+    reader._call_chunk = slow_call_chunk
+    return calls
+
+
+def test_concurrent_identical_reads_share_one_call(tester_sdk, passport, slow_calls):
+    passport, contract_address = passport
+    barrier = threading.Barrier(10)
+    products = []
+
+    def scan():
+        barrier.wait()
+        products.append(passport.get_product(contract_address, 7))
+
+    threads = [threading.Thread(target=scan) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(slow_calls) == 1
+    assert {product.uid for product in products} == {"unique_id"}
+    assert (tester_sdk.reader.requested, tester_sdk.reader.coalesced) == (10, 9)
+    assert tester_sdk.reader.dedup_ratio == 0.9
+
+
+def test_async_reads_are_coalesced(tester_sdk, passport, slow_calls):
+    passport, contract_address = passport
+
+    async def scan():
+        return await asyncio.gather(*(passport.get_product_async(contract_address, 7) for _ in range(10)))
+
+    products = asyncio.run(scan())
+
+    assert len(slow_calls) == 1
+    assert all(product.gtin == "1234567890123" for product in products)
+    assert tester_sdk.reader.coalesced == 9
+
+
+def test_async_reads_are_coalesced_without_holding_executor_threads(tester_sdk, passport, slow_calls):
+    passport, contract_address = passport
+
+    async def scan():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        # Keep the only executor thread busy, so no call can register itself from the executor first.
+        busy = loop.run_in_executor(None, time.sleep, 0.1)
+        products = await asyncio.gather(*(passport.get_product_async(contract_address, 7) for _ in range(10)))
+        await busy
+        return products
+
+    products = asyncio.run(scan())
+
+    assert len(slow_calls) == 1
+    assert len(products) == 10
+    assert (tester_sdk.reader.requested, tester_sdk.reader.coalesced) == (10, 9)
+
+
+def test_failing_call_only_fails_its_own_waiters(tester_sdk, dpp_chain, slow_calls):
+    contract = tester_sdk.web3.eth.contract(
+        address=dpp_chain.addresses["Batch"], abi=tester_sdk.contracts["Batch"]["abi"]
+    )
+    reader = tester_sdk.reader
+    led = threading.Thread(target=lambda: pytest.raises(
+        ContractLogicError, reader.call_many, [contract.functions.name(), contract.functions.tokenURI(999)]
+    ))
+    led.start()
+    time.sleep(0.05)
+
+    assert reader.call(contract.functions.name()) == "Product Passport"
+    led.join()
+    # The batch of both calls is the only one made for name(); splitting it isolates the failing call.
+    assert (slow_calls[0], reader.coalesced) == (2, 1)
+
+
+def test_failing_call_in_a_batch_is_isolated_without_serial_reads(tester_sdk, dpp_chain):
+    contract = tester_sdk.web3.eth.contract(
+        address=dpp_chain.addresses["Batch"], abi=tester_sdk.contracts["Batch"]["abi"]
+    )
+    reader = tester_sdk.reader
+    call_chunk = reader._call_chunk
+    chunks = []
+
+    def counting_call_chunk(functions, block_identifier):
+        chunks.append(len(functions))
+        return call_chunk(functions, block_identifier)
+
+    reader._call_chunk = counting_call_chunk
+    calls = [contract.functions.balanceOf(account) for account in tester_sdk.web3.eth.accounts]
+    calls.insert(7, contract.functions.tokenURI(999))
+
+    results = reader.call_many(calls, return_exceptions=True)
+
+    assert isinstance(results.pop(7), ContractLogicError)
+    assert results == [0] * 10
+    # The failing call is found by splitting the batch, not by reading the 11 calls one by one.
+    assert len(chunks) < len(calls)
+    with pytest.raises(ContractLogicError):
+        reader.call_many(calls)
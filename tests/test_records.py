@@ -0,0 +1,42 @@
+import pytest
+from solidity_python_sdk.contracts.records import Product, BatchDetails, RecordColumns
+from solidity_python_sdk.main import ProductPassport
+
+
+def test_record_types_follow_abi_outputs():
+    assert Product._fields == ("uid", "gtin", "taricCode", "manufacturerInfo", "consumerInfo", "endOfLifeInfo")
+    assert BatchDetails.abi_types == ("uint256", "uint256", "string")
+    assert not hasattr(Product("a", "b", "c", "d", "e", "f"), "__dict__")
+
+
+def test_record_columns_round_trip():
+    columns = RecordColumns(BatchDetails, [(10, 1700000000, "Truck"), (2 ** 70, 0, "Ship")], keys=[1, 2])
+
+    assert len(columns) == 2
+    assert columns[0] == BatchDetails(10, 1700000000, "Truck")
+    assert columns[1].amount == 2 ** 70
+    assert list(columns.column("transportDetails")) == ["Truck", "Ship"]
+    assert columns.column("assemblingTime").typecode == "Q"
+
+
+def test_get_products_returns_typed_records(tester_sdk, dpp_chain, product_details):
+    passport = ProductPassport(tester_sdk)
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    passport.set_product(contract_address, 7, product_details)
+
+    product = passport.get_product(contract_address, 7)
+    assert isinstance(product, Product)
+    assert product.manufacturerInfo == product[3] == "Manufacturer XYZ"
+
+    products = passport.get_products(contract_address, [7, 8], columnar=True)
+    assert products.keys == [7, 8]
+    assert products.column("gtin") == ["1234567890123", ""]
+
+
+def test_record_columns_to_arrow():
+    pytest.importorskip("pyarrow")
+    columns = RecordColumns(BatchDetails, [(10, 1700000000, "Truck")], keys=[1])
+
+    table = columns.to_arrow(key_name="batchId")
+    assert table.column_names == ["batchId", "amount", "assemblingTime", "transportDetails"]
+    assert table.column("amount").to_pylist() == [10]
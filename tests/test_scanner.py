@@ -0,0 +1,39 @@
+import threading
+from solidity_python_sdk.main import ProductPassport
+from solidity_python_sdk.utils.scanner import scan
+
+
+def test_scan_yields_in_order_and_skips_filtered_ids():
+    def fetch_chunk(ids):
+        return [i for i in ids if i % 3 == 0]
+
+    assert list(scan(fetch_chunk, range(100), chunk_size=7, workers=3)) == list(range(0, 100, 3))
+    assert sorted(scan(fetch_chunk, range(100), chunk_size=7, workers=3, ordered=False)) == list(range(0, 100, 3))
+
+
+def test_scan_is_lazy():
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch_chunk(ids):
+        with lock:
+            fetched.extend(ids)
+        return ids
+
+    results = scan(fetch_chunk, range(10 ** 9), chunk_size=10, workers=2)
+    assert [next(results) for _ in range(25)] == list(range(25))
+    results.close()
+    assert len(fetched) <= 10 * 2 * 2 + 30
+
+
+def test_iter_products_skips_empty_ids(tester_sdk, dpp_chain, product_details):
+    passport = ProductPassport(tester_sdk)
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    for product_id in (3, 17, 18):
+        passport.set_product(contract_address, product_id, product_details)
+
+    products = list(passport.iter_products(contract_address, range(1, 30), chunk_size=4, workers=2))
+
+    assert [product_id for product_id, _, _ in products] == [3, 17, 18]
+    assert products[0][1].gtin == "1234567890123"
+    assert products[0][2].description == ""
@@ -1,15 +1,20 @@
 import pytest
 from web3 import Web3
 import logging
-from solidity_python_sdk.main import DigitalProductPassportSDK, ProductPassport
+from solidity_python_sdk.main import ProductPassport
 
 # Setup logging
 logging.basicConfig(level=logging.DEBUG)
 
 @pytest.fixture()
-def sdk():
-    # Initialize the SDK
-    return DigitalProductPassportSDK()
+def sdk(dpp_sdk):
+    # SDK on the shared local chain; changes made by each test are reverted afterwards
+    return dpp_sdk
+
+@pytest.fixture()
+def contract_address(dpp_chain):
+    # ProductPassport deployed once per session, with the SDK account already authorized
+    return dpp_chain.addresses["ProductPassport"]
 
 def test_load_contract(sdk):
     contract = sdk.contracts.get('ProductPassport')
@@ -28,27 +33,8 @@ def test_deploy_product_passport_contract(sdk):
     assert Web3.is_address(contract_address), "Invalid contract address"
     logging.debug(f"Contract deployed at address: {contract_address}")
 
-def test_set_and_get_product(sdk):
+def test_set_and_get_product(sdk, contract_address, product_details):
     passport = ProductPassport(sdk)
-    
-    # Deploy the contract
-    contract_address = passport.deploy(sdk.account.address)
-    logging.debug(f"Contract deployed at address: {contract_address}")
-
-    # Authorize the contract with the deployed address
-    entity_address = sdk.account.address
-    tx_receipt = passport.authorize_entity(contract_address, entity_address)
-    logging.debug(f"Authorization transaction receipt: {tx_receipt}")
-
-    # Define product details
-    product_details = {
-        "uid": "unique_id",
-        "gtin": "1234567890123",
-        "taricCode": "1234",
-        "manufacturerInfo": "Manufacturer XYZ",
-        "consumerInfo": "Consumer XYZ",
-        "endOfLifeInfo": "Dispose properly"
-    }
 
     # Set product details
     tx_receipt = passport.set_product(contract_address, "123456", product_details)
@@ -63,33 +49,8 @@ def test_set_and_get_product(sdk):
     assert product_data_retrieved[4] == "Consumer XYZ"
     assert product_data_retrieved[5] == "Dispose properly"
 
-def test_set_and_get_product_data(sdk):
+def test_set_and_get_product_data(sdk, contract_address, product_data):
     passport = ProductPassport(sdk)
-    
-    # Deploy the contract
-    contract_address = passport.deploy(sdk.account.address)
-    logging.debug(f"Contract deployed at address: {contract_address}")
-
-    # Authorize the contract with the deployed address
-    entity_address = sdk.account.address
-    tx_receipt = passport.authorize_entity(contract_address, entity_address)
-    logging.debug(f"Authorization transaction receipt: {tx_receipt}")
-
-    # Define product data
-    product_data = {
-        "productId": 123456,
-        "description": "Product description",
-        "manuals": ["manual1.pdf"],
-        "specifications": ["spec1.pdf"],
-        "batchNumber": "123ABC",
-        "productionDate": "2023-01-01",
-        "expiryDate": "2023-12-31",
-        "certifications": "ISO123",
-        "warrantyInfo": "1 year",
-        "materialComposition": "Materials",
-        "complianceInfo": "Complies with regulations",
-        "ipfs": "QmWDYhFAaT89spcqbKYboyCm6mkYSxKJaWUuS18Akmw96t"
-    }
 
     # Set product data
     tx_receipt = passport.set_product_data(contract_address, 123456, product_data)
@@ -107,4 +68,25 @@ def test_set_and_get_product_data(sdk):
     assert product_data_retrieved[7] == "1 year"
     assert product_data_retrieved[8] == "Materials"
     assert product_data_retrieved[9] == "Complies with regulations"
-    assert product_data_retrieved[10] == "QmWDYhFAaT89spcqbKYboyCm6mkYSxKJaWUuS18Akmw96t"
+
+def test_sync_products_skips_unchanged(sdk, contract_address, product_details, product_data):
+    passport = ProductPassport(sdk)
+
+    source = {1: product_details, 2: product_data}
+
+    report = passport.sync_products(contract_address, source)
+    assert (report["unchanged"], report["changed"], report["new"]) == (0, 0, 2)
+    assert len(report["receipts"]) == 2
+
+    report = passport.sync_products(contract_address, source)
+    assert (report["unchanged"], report["changed"], report["new"]) == (2, 0, 0)
+    assert report["receipts"] == []
+
+    source[2]["manuals"] = ["manual2.pdf"]
+    report = passport.sync_products(contract_address, source)
+    assert (report["unchanged"], report["changed"], report["new"]) == (1, 1, 0)
+    assert passport.get_product_data(contract_address, 2)[1] == ["manual2.pdf"]
+
+    report = passport.sync_products(contract_address, {1: {"uid": "only-uid"}})
+    assert (report["unchanged"], report["changed"], report["new"]) == (0, 1, 0)
+    assert passport.get_product(contract_address, 1)[:2] == ("only-uid", "1234567890123")
@@ -0,0 +1,23 @@
+from solidity_python_sdk.main import ProductPassport
+
+
+def test_isolated_changes_are_reverted(dpp_chain, product_data):
+    contract_address = dpp_chain.addresses["ProductPassport"]
+    start_block = dpp_chain.sdk.web3.eth.block_number
+
+    with dpp_chain.isolated() as sdk:
+        passport = ProductPassport(sdk)
+        passport.set_product_data(contract_address, 1, product_data)
+        assert passport.get_product_data(contract_address, 1).description == "Product description"
+
+    assert dpp_chain.sdk.web3.eth.block_number == start_block
+    assert ProductPassport(dpp_chain.sdk).get_product_data(contract_address, 1).description == ""
+
+
+def test_prefunded_accounts(dpp_chain):
+    assert len(dpp_chain.private_keys) == 10
+    assert set(dpp_chain.addresses) == {"ProductPassport", "Batch", "Geolocation", "ComplexManagement"}
+
+    with dpp_chain.isolated(account=3) as sdk:
+        assert sdk.account.address != dpp_chain.sdk.account.address
+        assert sdk.web3.eth.get_balance(sdk.account.address) == sdk.web3.to_wei(1000000, 'ether')